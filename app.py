@@ -5,6 +5,8 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from listeners import register_listeners
+from listeners.commands.decidely_list import report_service
+from services.digest_job import DigestJob, DigestScheduler, slack_poster
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -24,4 +26,14 @@ app.event("")(log_all_events)
 
 # Start Bolt app
 if __name__ == "__main__":
+    # Optional weekly digest, posted to one channel of the installed workspace
+    digest_channel = os.environ.get("DECIDELY_DIGEST_CHANNEL")
+    if digest_channel:
+        team_id = app.client.auth_test()["team_id"]
+        digest_job = DigestJob(report_service, {team_id: digest_channel}, slack_poster(lambda _: app.client))
+        DigestScheduler(
+            digest_job,
+            weekday=int(os.environ.get("DECIDELY_DIGEST_WEEKDAY", 0)),
+            hour=int(os.environ.get("DECIDELY_DIGEST_HOUR", 9))
+        ).start()
     SocketModeHandler(app, os.environ.get("SLACK_APP_TOKEN")).start()
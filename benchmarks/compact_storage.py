@@ -0,0 +1,88 @@
+"""Compare the text and compact SQLite layouts: file size and row decode time.
+
+Run from the repository root:
+
+    python -m benchmarks.compact_storage --reports 200000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from models.report import Report, ReportType
+from repositories.sqlite_codecs import COMPACT_CODEC, TEXT_CODEC
+from repositories.sqlite_report_repository import SQLiteReportRepository
+
+
+def generate_reports(count: int, workspaces: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    for i in range(count):
+        yield Report(
+            user_id=f"U{rng.randrange(5000):08d}",
+            workspace_id=f"T{rng.randrange(workspaces):08d}",
+            report_type=rng.choice(list(ReportType)),
+            description=f"Needed sign-off for change #{i} but nobody was around",
+            timestamp=start + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        )
+
+
+def database_size(db_path: Path) -> int:
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+    conn.close()
+    return os.path.getsize(db_path)
+
+
+def time_decode(db_path: Path, codec, repeat: int) -> float:
+    conn = sqlite3.connect(str(db_path))
+    rows = conn.execute("SELECT * FROM reports").fetchall()
+    conn.close()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            codec.decode(row)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200_000)
+    parser.add_argument("--workspaces", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = {}
+        for codec, compact in ((TEXT_CODEC, False), (COMPACT_CODEC, True)):
+            db_path = Path(temp_dir) / f"{codec.name}.db"
+            repo = SQLiteReportRepository(str(db_path), compact=compact)
+            repo.save_many(generate_reports(args.reports, args.workspaces), batch_size=10_000)
+            repo.close()
+            results[codec.name] = (
+                database_size(db_path),
+                time_decode(db_path, codec, args.repeat),
+            )
+
+    print(f"{args.reports:,} reports across {args.workspaces} workspaces")
+    print(f"{'layout':<10}{'db size':>14}{'decode (best)':>16}{'per row':>12}")
+    for name, (size, seconds) in results.items():
+        print(
+            f"{name:<10}{size / 1024 / 1024:>11.1f} MiB{seconds:>14.3f} s"
+            f"{seconds / args.reports * 1e6:>9.2f} µs"
+        )
+    (text_size, text_time), (compact_size, compact_time) = results["text"], results["compact"]
+    print(
+        f"compact saves {1 - compact_size / text_size:.0%} of the file "
+        f"and {1 - compact_time / text_time:.0%} of decode time"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare the memory held by dict-backed and slotted, interned Reports.
+
+Run from the repository root:
+
+    python -m benchmarks.report_memory --reports 1000000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from uuid import UUID, uuid4
+from models.report import Report, ReportType
+
+
+@dataclass(frozen=True)
+class DictReport:
+    """Report as it was before slots and interning, for comparison."""
+    user_id: str
+    workspace_id: str
+    report_type: ReportType
+    description: str
+    id: UUID = field(default_factory=uuid4)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+def generate_fields(count: int, users: int, workspaces: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    for i in range(count):
+        # Fresh strings per report, as when rows are decoded from storage
+        yield dict(
+            user_id=f"U{rng.randrange(users):08d}",
+            workspace_id=f"T{rng.randrange(workspaces):08d}",
+            report_type=rng.choice(list(ReportType)),
+            description=f"Needed sign-off for change #{i} but nobody was around",
+            id=UUID(int=rng.getrandbits(128)),
+            timestamp=start + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        )
+
+
+def measure(model, args) -> int:
+    """Bytes still allocated once ``args.reports`` instances are held in a list."""
+    gc.collect()
+    tracemalloc.start()
+    reports = [model(**fields) for fields in generate_fields(args.reports, args.users, args.workspaces)]
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del reports
+    return held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--workspaces", type=int, default=20)
+    args = parser.parse_args()
+
+    results = {"before": measure(DictReport, args), "after": measure(Report, args)}
+
+    print(f"{args.reports:,} reports, {args.users} users across {args.workspaces} workspaces")
+    print(f"{'model':<10}{'held':>14}{'per report':>14}")
+    for name, held in results.items():
+        print(f"{name:<10}{held / 1024 / 1024:>10.1f} MiB{held / args.reports:>12.0f} B")
+    print(f"slots and interning save {1 - results['after'] / results['before']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
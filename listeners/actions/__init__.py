@@ -1,6 +1,14 @@
 from slack_bolt import App
 from .sample_action import sample_action_callback
+from .decidely_list_pagination import decidely_list_page_callback
+from .decidely_search_pagination import decidely_search_page_callback
+from listeners.commands.decidely_list import NEWER_ACTION_ID, OLDER_ACTION_ID
+from listeners.commands.decidely_search import NEXT_ACTION_ID, PREVIOUS_ACTION_ID
 
 
 def register(app: App):
     app.action("sample_action_id")(sample_action_callback)
+    app.action(NEWER_ACTION_ID)(decidely_list_page_callback)
+    app.action(OLDER_ACTION_ID)(decidely_list_page_callback)
+    app.action(PREVIOUS_ACTION_ID)(decidely_search_page_callback)
+    app.action(NEXT_ACTION_ID)(decidely_search_page_callback)
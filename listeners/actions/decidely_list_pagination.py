@@ -0,0 +1,53 @@
+from slack_bolt import Ack, Respond
+from typing import Dict, Any
+from listeners.block_messages import respond_in_messages
+from listeners.commands.decidely_list import (
+    NEWER_ACTION_ID,
+    PAGE_SIZE,
+    USAGE_TEXT,
+    build_fitting_list_blocks,
+    decode_page_value,
+    report_service,
+    window_start,
+)
+
+
+def decidely_list_page_callback(
+    ack: Ack,
+    body: Dict[str, Any],
+    respond: Respond
+) -> None:
+    """Replace the /decidely-list message with the newer or older page."""
+    ack()
+    
+    action = body["actions"][0]
+    cursor, window = decode_page_value(action["value"])
+    # The window is relative, so it is re-anchored at the time of the click
+    try:
+        since = window_start(window)
+    except ValueError:
+        respond(text=USAGE_TEXT)
+        return
+    workspace_id = body["team"]["id"]
+    
+    if action["action_id"] == NEWER_ACTION_ID:
+        page = report_service.get_workspace_reports_page(
+            workspace_id, limit=PAGE_SIZE, after=cursor, since=since
+        )
+    else:
+        page = report_service.get_workspace_reports_page(
+            workspace_id, limit=PAGE_SIZE, before=cursor, since=since
+        )
+    summary = report_service.get_workspace_summary(workspace_id, since=since)
+    
+    # The page replaces the original message, so it has to fit in one; reports
+    # that do not fit are left for the next page rather than cut off
+    respond_in_messages(
+        respond,
+        text=f"📊 Decision Reports - Total: {summary['total_reports']}",
+        blocks=build_fitting_list_blocks(
+            summary, page, window, keep_newest=action["action_id"] != NEWER_ACTION_ID, max_messages=1
+        ),
+        max_messages=1,
+        replace_original=True
+    )
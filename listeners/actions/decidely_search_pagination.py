@@ -0,0 +1,24 @@
+from slack_bolt import Ack, Respond
+from typing import Dict, Any
+from listeners.block_messages import escape_mrkdwn, respond_in_messages
+from listeners.commands.decidely_search import decode_search_state, search_page
+
+
+def decidely_search_page_callback(
+    ack: Ack,
+    body: Dict[str, Any],
+    respond: Respond
+) -> None:
+    """Replace the /decidely-search message with the previous or next page of results."""
+    ack()
+    
+    state = decode_search_state(body["actions"][0]["value"])
+    
+    # The page replaces the original message, so it has to fit in one
+    respond_in_messages(
+        respond,
+        text=f"🔎 Search results for: {escape_mrkdwn(state['query'])}",
+        blocks=search_page(body["team"]["id"], state["query"], state["offset"], max_messages=1),
+        max_messages=1,
+        replace_original=True
+    )
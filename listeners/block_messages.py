@@ -0,0 +1,224 @@
+import json
+from slack_bolt import Respond
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Slack rejects messages with more than 50 blocks or section text over 3000 characters
+MAX_BLOCKS_PER_MESSAGE = 50
+MAX_SECTION_TEXT_LENGTH = 3000
+# Slack does not publish a byte limit for blocks; stay well clear of where
+# large payloads start to fail
+DEFAULT_MAX_MESSAGE_BYTES = 12_000
+DEFAULT_MAX_MESSAGES = 3
+
+TRUNCATED_NOTICE = {
+    "type": "context",
+    "elements": [{
+        "type": "mrkdwn",
+        "text": "_Some results were left out to stay within Slack's message limits._"
+    }]
+}
+
+Block = Dict[str, Any]
+
+
+def block_size(block: Block) -> int:
+    return len(json.dumps(block, ensure_ascii=False).encode())
+
+
+def escape_mrkdwn(text: str) -> str:
+    """Escape user text so Slack shows it literally instead of as links or mentions like <!here>."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def clip_block(block: Block) -> Block:
+    """Shorten an over-long section text so Slack accepts the block."""
+    text = block.get("text") if block.get("type") == "section" else None
+    if text and len(text.get("text", "")) > MAX_SECTION_TEXT_LENGTH:
+        clipped = text["text"][:MAX_SECTION_TEXT_LENGTH - 1] + "…"
+        return {**block, "text": {**text, "text": clipped}}
+    return block
+
+
+def _without_trailing_dividers(message: List[Block], size: int) -> Tuple[List[Block], int]:
+    # A message cut off after a divider would end in an empty rule
+    message = list(message)
+    while message and message[-1].get("type") == "divider":
+        size -= block_size(message.pop())
+    return message, size
+
+
+class BlockMessageBuilder:
+    """Packs blocks into as few Slack messages as their limits allow.
+
+    Block count and payload bytes are tracked as blocks are added. Once
+    ``max_messages`` are full, add() returns False and every later block is
+    refused, so callers can stop producing them. Room for the footer and the
+    truncation notice is always kept in the last allowed message.
+    """
+
+    def __init__(
+        self,
+        footer: Iterable[Block] = (),
+        max_blocks: int = MAX_BLOCKS_PER_MESSAGE,
+        max_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+    ):
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+        self._footer = [clip_block(block) for block in footer]
+        self._max_blocks = max_blocks
+        self._max_bytes = max_bytes
+        self._max_messages = max_messages
+        # The last message must still fit the footer and the notice
+        self._reserved_blocks = len(self._footer) + 1
+        self._reserved_bytes = sum(map(block_size, self._footer)) + block_size(TRUNCATED_NOTICE)
+        self._messages: List[List[Block]] = [[]]
+        self._sizes: List[int] = [0]
+        self.truncated = False
+
+    def _fits(self, blocks: int, size: int, reserve: bool) -> bool:
+        if reserve:
+            blocks += self._reserved_blocks
+            size += self._reserved_bytes
+        return blocks <= self._max_blocks and size <= self._max_bytes
+
+    def _start_message(self) -> None:
+        self._messages.append([])
+        self._sizes.append(0)
+
+    def add(self, block: Block) -> bool:
+        if self.truncated:
+            return False
+        block = clip_block(block)
+        current = self._messages[-1]
+        # A divider is pointless at the top of a continuation message
+        if not current and len(self._messages) > 1 and block.get("type") == "divider":
+            return True
+        size = block_size(block)
+        last = len(self._messages) == self._max_messages
+        if self._fits(len(current) + 1, self._sizes[-1] + size, reserve=last):
+            current.append(block)
+            self._sizes[-1] += size
+            return True
+        if current and not last:
+            self._start_message()
+            return self.add(block)
+        self.truncated = True
+        return False
+
+    def add_all(self, blocks: Iterable[Block]) -> bool:
+        """Add blocks until one is refused; the rest of ``blocks`` is not consumed."""
+        return all(self.add(block) for block in blocks)
+
+    def messages(self) -> List[List[Block]]:
+        """The finished messages, with the notice (if truncated) and footer on the last."""
+        trimmed = map(_without_trailing_dividers, self._messages, self._sizes)
+        filled = [(message, size) for message, size in trimmed if message]
+        messages = [message for message, _ in filled]
+        tail = ([TRUNCATED_NOTICE] if self.truncated else []) + self._footer
+        if not tail:
+            return messages
+        if not messages:
+            return [tail]
+        tail_fits = self._fits(
+            len(messages[-1]) + len(tail), filled[-1][1] + sum(map(block_size, tail)), reserve=False
+        )
+        # The last allowed message always has room reserved for the tail
+        if tail_fits or len(messages) == self._max_messages:
+            messages[-1].extend(tail)
+        else:
+            messages.append(tail)
+        return messages
+
+
+def _split_footer(
+    blocks: Iterable[Block], footer: Optional[Iterable[Block]]
+) -> Tuple[Iterable[Block], List[Block]]:
+    if footer is not None:
+        return blocks, list(footer)
+    # A ready-made list can be checked for trailing navigation buttons without
+    # copying it; anything else is consumed lazily as plain content
+    if isinstance(blocks, Sequence) and blocks and blocks[-1].get("type") == "actions":
+        return islice(blocks, len(blocks) - 1), [blocks[-1]]
+    return blocks, []
+
+
+def _pack(
+    blocks: Iterable[Block],
+    footer: Optional[Iterable[Block]],
+    max_messages: int,
+    max_bytes: int,
+) -> BlockMessageBuilder:
+    blocks, footer = _split_footer(blocks, footer)
+    builder = BlockMessageBuilder(footer=footer, max_bytes=max_bytes, max_messages=max_messages)
+    builder.add_all(blocks)
+    return builder
+
+
+def fits_in_messages(
+    blocks: Iterable[Block],
+    max_messages: int = DEFAULT_MAX_MESSAGES,
+    max_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+    footer: Optional[Iterable[Block]] = None,
+) -> bool:
+    """Whether respond_in_messages would send ``blocks`` without leaving any out."""
+    return not _pack(blocks, footer, max_messages, max_bytes).truncated
+
+
+def fit_blocks(
+    render: Callable[[int], List[Block]],
+    count: int,
+    max_messages: int = DEFAULT_MAX_MESSAGES,
+    max_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+) -> List[Block]:
+    """Render the largest number of ``count`` items that fits in ``max_messages``.
+
+    ``render(n)`` builds the blocks for the first n items, so paging controls
+    can point just past the last item actually shown. At least one item is
+    always rendered; if even that is too large, the truncation notice says so.
+
+    Fewer items take less room, so the count is binary-searched: a page that
+    does not fit is rendered and packed O(log count) times, not once per item.
+    Only counts that were checked to fit are returned.
+    """
+    blocks = render(count)
+    if count <= 1 or fits_in_messages(blocks, max_messages, max_bytes):
+        return blocks
+    best: Optional[List[Block]] = None
+    low, high = 1, count - 1
+    while low <= high:
+        shown = (low + high) // 2
+        blocks = render(shown)
+        if fits_in_messages(blocks, max_messages, max_bytes):
+            best, low = blocks, shown + 1
+        else:
+            high = shown - 1
+    return best if best is not None else render(1)
+
+
+def respond_in_messages(
+    respond: Respond,
+    text: str,
+    blocks: Iterable[Block],
+    max_messages: int = DEFAULT_MAX_MESSAGES,
+    max_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+    footer: Optional[Iterable[Block]] = None,
+    **options: Any,
+) -> int:
+    """Send ``blocks`` through the response URL as one or more compliant messages.
+
+    ``footer`` blocks are kept at the end of the last message even when the
+    cap cuts the list short; when it is not given, a trailing actions block
+    (navigation buttons) of a list is used. Other iterables are consumed
+    lazily and only as far as the messages reach. ``options`` such as
+    replace_original apply to the first message only. Returns the number of
+    messages sent.
+    """
+    messages = _pack(blocks, footer, max_messages, max_bytes).messages()
+    for i, message in enumerate(messages):
+        if i == 0:
+            respond(text=text, blocks=message, **options)
+        else:
+            respond(text=f"{text} (continued)", blocks=message)
+    return len(messages)
@@ -1,5 +1,9 @@
+import re
+from datetime import datetime, timedelta, UTC
 from slack_bolt import Ack, Respond
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from listeners.block_messages import DEFAULT_MAX_MESSAGES, fit_blocks, respond_in_messages
+from models.pagination import ReportCursor, ReportPage
 from repositories.report_repository import InMemoryReportRepository
 from services.report_service import ReportService
 
@@ -8,17 +12,71 @@ report_repository = InMemoryReportRepository()
 report_service = ReportService(report_repository)
 
 
-def decidely_list_callback(
-    ack: Ack,
-    command: Dict[str, Any],
-    respond: Respond
-) -> None:
-    ack()
+PAGE_SIZE = 10
+NEWER_ACTION_ID = "decidely_list_newer"
+OLDER_ACTION_ID = "decidely_list_older"
+USAGE_TEXT = "ℹ️ Usage: `/decidely-list [<days>d|<weeks>w]`, e.g. `/decidely-list 14d`"
+
+_WINDOW = re.compile(r"^(\d+)\s*([dw])$", re.IGNORECASE)
+_WINDOW_UNITS = {"d": 1, "w": 7}
+# Ten years; longer windows would overflow datetime arithmetic
+MAX_WINDOW_DAYS = 3650
+
+
+def parse_window(text: str) -> Optional[timedelta]:
+    """Parse a listing window such as "14d" or "2w"; empty text means all time.
     
-    workspace_id = command["team_id"]
-    reports = report_service.get_workspace_reports(workspace_id)
-    summary = report_service.get_workspace_summary(workspace_id)
+    Raises ValueError for anything else, including windows longer than
+    MAX_WINDOW_DAYS.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    match = _WINDOW.match(text)
+    if not match:
+        raise ValueError(f"Invalid window: {text!r}")
+    days = int(match.group(1)) * _WINDOW_UNITS[match.group(2).lower()]
+    if not 0 < days <= MAX_WINDOW_DAYS:
+        raise ValueError(f"Invalid window: {text!r}")
+    return timedelta(days=days)
+
+
+def window_start(window: Optional[str]) -> Optional[datetime]:
+    delta = parse_window(window or "")
+    return datetime.now(UTC) - delta if delta else None
+
+
+def encode_page_value(cursor: ReportCursor, window: Optional[str]) -> str:
+    """Button value: the keyset cursor, plus the listing window if there is one."""
+    return f"{cursor.encode()}|{window}" if window else cursor.encode()
+
+
+def decode_page_value(value: str) -> Tuple[ReportCursor, Optional[str]]:
+    timestamp, report_id, *window = value.split("|", 2)
+    return ReportCursor.decode(f"{timestamp}|{report_id}"), (window[0] if window else None)
+
+
+def trim_page(page: ReportPage, count: int, keep_newest: bool = True) -> ReportPage:
+    """Keep ``count`` of the page's reports, moving the cursor on the cut side.
     
+    Paging older keeps the newest reports and paging newer the oldest, so
+    either way the reports next to where the reader came from stay, and the
+    next page starts right after the last one kept.
+    """
+    if count >= len(page.reports):
+        return page
+    if keep_newest:
+        return ReportPage.from_reports(page.reports[:count], has_newer=page.has_newer, has_older=True)
+    return ReportPage.from_reports(page.reports[-count:], has_newer=True, has_older=page.has_older)
+
+
+def build_report_list_blocks(
+    summary: Dict[str, Any],
+    page: ReportPage,
+    window: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Build the /decidely-list message for one page of reports."""
+    period = f" (last {window.lower()})" if window else ""
     blocks = [
         {
             "type": "header",
@@ -32,7 +90,7 @@ def decidely_list_callback(
             "text": {
                 "type": "mrkdwn",
                 "text": (
-                    f"*Summary for this workspace:*\n"
+                    f"*Summary for this workspace{period}:*\n"
                     f"• Total reports: {summary['total_reports']}\n"
                     f"• Lacked authority/information: {summary['lacked_authority_count']}\n"
                     f"• Expected initiative: {summary['expected_initiative_count']}"
@@ -41,9 +99,9 @@ def decidely_list_callback(
         }
     ]
     
-    if reports:
+    if page.reports:
         blocks.append({"type": "divider"})
-        blocks.extend(report_service.format_reports_for_slack(reports))
+        blocks.extend(report_service.format_reports_for_slack(page.reports))
     else:
         blocks.append({
             "type": "section",
@@ -53,8 +111,68 @@ def decidely_list_callback(
             }
         })
     
-    # Use respond() which works in any channel, even if bot is not a member
-    respond(
+    # Navigation buttons carry the keyset cursor of the page edge they start from
+    buttons = []
+    if page.newer_cursor:
+        buttons.append({
+            "type": "button",
+            "action_id": NEWER_ACTION_ID,
+            "text": {"type": "plain_text", "text": "← Newer"},
+            "value": encode_page_value(page.newer_cursor, window)
+        })
+    if page.older_cursor:
+        buttons.append({
+            "type": "button",
+            "action_id": OLDER_ACTION_ID,
+            "text": {"type": "plain_text", "text": "Older →"},
+            "value": encode_page_value(page.older_cursor, window)
+        })
+    if buttons:
+        blocks.append({"type": "actions", "elements": buttons})
+    
+    return blocks
+
+
+def build_fitting_list_blocks(
+    summary: Dict[str, Any],
+    page: ReportPage,
+    window: Optional[str] = None,
+    keep_newest: bool = True,
+    max_messages: int = DEFAULT_MAX_MESSAGES
+) -> List[Dict[str, Any]]:
+    """Build the /decidely-list message with as much of the page as fits in ``max_messages``."""
+    return fit_blocks(
+        lambda count: build_report_list_blocks(summary, trim_page(page, count, keep_newest), window),
+        len(page.reports),
+        max_messages=max_messages
+    )
+
+
+def decidely_list_callback(
+    ack: Ack,
+    command: Dict[str, Any],
+    respond: Respond
+) -> None:
+    ack()
+    
+    # An optional window such as "14d" keeps both queries to recent rows
+    window = command.get("text", "").strip() or None
+    try:
+        since = window_start(window)
+    except ValueError:
+        respond(text=USAGE_TEXT)
+        return
+    
+    workspace_id = command["team_id"]
+    page = report_service.get_workspace_reports_page(
+        workspace_id, limit=PAGE_SIZE, since=since
+    )
+    summary = report_service.get_workspace_summary(workspace_id, since=since)
+    
+    # Use respond() which works in any channel, even if bot is not a member;
+    # long listings are split across several messages
+    respond_in_messages(
+        respond,
         text=f"📊 Decision Reports - Total: {summary['total_reports']}",
-        blocks=blocks
-    )
\ No newline at end of file
+        blocks=build_fitting_list_blocks(summary, page, window)
+    )
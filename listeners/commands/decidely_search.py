@@ -0,0 +1,142 @@
+import json
+from slack_bolt import Ack, Respond
+from typing import Dict, Any, List
+from listeners.block_messages import DEFAULT_MAX_MESSAGES, escape_mrkdwn, fit_blocks, respond_in_messages
+from models.report import Report
+from listeners.commands.decidely_list import report_service
+
+
+SEARCH_PAGE_SIZE = 10
+PREVIOUS_ACTION_ID = "decidely_search_previous"
+NEXT_ACTION_ID = "decidely_search_next"
+MAX_QUERY_LENGTH = 500
+# Slack caps button values at 2000 characters; the query rides along in them
+MAX_BUTTON_VALUE_LENGTH = 2000
+# Encoded states are checked with an offset this long, so every page fits
+_LARGEST_OFFSET = 10 ** 9
+
+
+def encode_search_state(query: str, offset: int) -> str:
+    return json.dumps({"query": query, "offset": offset}, ensure_ascii=False)
+
+
+def fit_search_query(text: str) -> str:
+    """Trim a query so its encoded button state stays within Slack's limit.
+
+    JSON escaping can make the state much longer than the query (control
+    characters become six-character escapes), so the encoded length is
+    what gets checked.
+    """
+    query = text.strip()[:MAX_QUERY_LENGTH]
+    while True:
+        excess = len(encode_search_state(query, _LARGEST_OFFSET)) - MAX_BUTTON_VALUE_LENGTH
+        if excess <= 0:
+            return query.strip()
+        # Each character encodes to at most six, so this never cuts too much
+        query = query[:-max(excess // 6, 1)]
+
+
+def decode_search_state(value: str) -> Dict[str, Any]:
+    state = json.loads(value)
+    return {"query": str(state["query"]), "offset": max(int(state["offset"]), 0)}
+
+
+def build_search_blocks(
+    query: str,
+    reports: List[Report],
+    offset: int,
+    has_more: bool
+) -> List[Dict[str, Any]]:
+    """Build the /decidely-search message for one page of ranked results."""
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": "🔎 Search Results"
+            }
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*Reports matching:* {escape_mrkdwn(query)}"
+            }
+        }
+    ]
+    
+    if reports:
+        blocks.append({"type": "divider"})
+        blocks.extend(report_service.format_reports_for_slack(reports))
+    else:
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "_No reports match your search._"
+            }
+        })
+    
+    buttons = []
+    if offset > 0:
+        buttons.append({
+            "type": "button",
+            "action_id": PREVIOUS_ACTION_ID,
+            "text": {"type": "plain_text", "text": "← Previous"},
+            "value": encode_search_state(query, max(offset - SEARCH_PAGE_SIZE, 0))
+        })
+    if has_more:
+        buttons.append({
+            "type": "button",
+            "action_id": NEXT_ACTION_ID,
+            "text": {"type": "plain_text", "text": "Next →"},
+            "value": encode_search_state(query, offset + len(reports))
+        })
+    if buttons:
+        blocks.append({"type": "actions", "elements": buttons})
+    
+    return blocks
+
+
+def search_page(
+    workspace_id: str,
+    query: str,
+    offset: int,
+    max_messages: int = DEFAULT_MAX_MESSAGES
+) -> List[Dict[str, Any]]:
+    """Run one page of a search and render it; one extra row tells if there is more.
+    
+    Only as many results as fit in ``max_messages`` are shown, and Next
+    continues from the first one left out.
+    """
+    reports = report_service.search_reports(
+        workspace_id, query, limit=SEARCH_PAGE_SIZE + 1, offset=offset
+    )
+    has_more = len(reports) > SEARCH_PAGE_SIZE
+    reports = reports[:SEARCH_PAGE_SIZE]
+    return fit_blocks(
+        lambda count: build_search_blocks(
+            query, reports[:count], offset, has_more or count < len(reports)
+        ),
+        len(reports),
+        max_messages=max_messages
+    )
+
+
+def decidely_search_callback(
+    ack: Ack,
+    command: Dict[str, Any],
+    respond: Respond
+) -> None:
+    ack()
+    
+    query = fit_search_query(command.get("text", ""))
+    if not query:
+        respond(text="ℹ️ Usage: `/decidely-search <words>`\nFinds reports whose description contains every word.")
+        return
+    
+    respond_in_messages(
+        respond,
+        text=f"🔎 Search results for: {escape_mrkdwn(query)}",
+        blocks=search_page(command["team_id"], query, 0)
+    )
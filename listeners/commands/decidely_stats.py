@@ -0,0 +1,184 @@
+from slack_bolt import Ack, Respond
+from typing import Dict, Any, List, Optional, Sequence
+from listeners.block_messages import respond_in_messages
+from listeners.commands.decidely_list import report_repository, report_service
+from models.report import ReportType
+from services.report_analytics import DEFAULT_PERIODS, Histogram, ReportAnalytics
+from services.report_statistics import ReporterStatistics
+
+report_analytics = ReportAnalytics(report_repository)
+
+GRANULARITY_ALIASES = {
+    "": "week",
+    "day": "day", "daily": "day",
+    "week": "week", "weekly": "week",
+    "month": "month", "monthly": "month",
+}
+# Buckets per moving average, and how each granularity and its current,
+# partial bucket are described
+MOVING_AVERAGE_WINDOWS = {"day": 7, "week": 4, "month": 3}
+PERIOD_LABELS = {
+    "day": ("Daily", "day", "today"),
+    "week": ("Weekly", "week", "this week"),
+    "month": ("Monthly", "month", "this month"),
+}
+TYPE_LABELS = {
+    ReportType.LACKED_AUTHORITY: "🔒 Lacked authority",
+    ReportType.EXPECTED_INITIATIVE: "💡 Expected initiative",
+}
+_SPARK = "▁▂▃▄▅▆▇█"
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# One character per hour, labelled every six hours
+_HOUR_AXIS = "    0     6     12    18"
+
+
+def parse_granularity(text: str) -> str:
+    """Map the command text to a granularity; raises ValueError for anything else."""
+    try:
+        return GRANULARITY_ALIASES[text.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Invalid granularity: {text!r}") from None
+
+
+def sparkline(values: Sequence[float], peak: Optional[float] = None) -> str:
+    """One bar per value, scaled to ``peak`` (the largest value by default)."""
+    peak = max(values, default=0) if peak is None else peak
+    if not peak:
+        return _SPARK[0] * len(values)
+    return "".join(_SPARK[round(value / peak * (len(_SPARK) - 1))] for value in values)
+
+
+def _percent(value: Optional[float]) -> str:
+    return "–" if value is None else f"{value:.0%}"
+
+
+def build_reporter_blocks(statistics: ReporterStatistics) -> List[Dict[str, Any]]:
+    """Top reporters and the weekday × hour heatmap, for the end of the stats message."""
+    if not statistics.total_reports:
+        return []
+    qualifier = " (approximate)" if statistics.approximate else ""
+    leaders = "\n".join(
+        f"{rank}. <@{user_id}> – {count} reports"
+        for rank, (user_id, count) in enumerate(statistics.top_reporters, start=1)
+    )
+    peak = max(max(row) for row in statistics.heatmap)
+    rows = "\n".join(
+        f"{day} {sparkline(row, peak)}" for day, row in zip(WEEKDAYS, statistics.heatmap)
+    )
+    weekday, hour, count = statistics.busiest_slot()
+    return [
+        {"type": "divider"},
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"*Top reporters{qualifier}:*\n{leaders}"}
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": (
+                    f"*When reports come in (UTC):*\n```{_HOUR_AXIS}\n{rows}```\n"
+                    f"Busiest: {WEEKDAYS[weekday]} {hour:02d}:00–{hour + 1:02d}:00 ({count} reports)"
+                )
+            }
+        }
+    ]
+
+
+def build_stats_blocks(
+    histogram: Histogram, statistics: Optional[ReporterStatistics] = None
+) -> List[Dict[str, Any]]:
+    """Build the /decidely-stats message for one workspace histogram."""
+    adjective, unit, current = PERIOD_LABELS[histogram.granularity]
+    # Histograms span DEFAULT_PERIODS whole buckets and then the current one
+    period = f"last {DEFAULT_PERIODS[histogram.granularity]} {unit}s + {current}"
+    window = MOVING_AVERAGE_WINDOWS[histogram.granularity]
+    blocks = [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "📈 Decision Trends"}
+        }
+    ]
+
+    if not histogram.total():
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"_No reports in the {period}. Use `/decidely` to submit one._"
+            }
+        })
+        return blocks
+
+    # Both lines share a scale so their bars compare
+    peak = max(max(counts) for counts in histogram.counts.values())
+    lines = [f"*{adjective} reports, {period}:*"]
+    for report_type, label in TYPE_LABELS.items():
+        bars = sparkline(histogram.counts[report_type], peak)
+        lines.append(f"{label}: `{bars}` {histogram.total(report_type)} total")
+    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(lines)}})
+
+    # Share over the whole period, and over the latest moving-average window
+    lacked = histogram.counts[ReportType.LACKED_AUTHORITY]
+    totals = histogram.totals
+    recent_total = sum(totals[-window:])
+    overall_share = histogram.total(ReportType.LACKED_AUTHORITY) / histogram.total()
+    recent_share = sum(lacked[-window:]) / recent_total if recent_total else None
+    averages = {
+        report_type: histogram.moving_average(window, report_type)[-1]
+        for report_type in TYPE_LABELS
+    }
+    blocks.append({
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": f"*{window}-{unit} average per {unit}:*\n" + "\n".join(
+                    f"{label}: {averages[report_type]:.1f}"
+                    for report_type, label in TYPE_LABELS.items()
+                )
+            },
+            {
+                "type": "mrkdwn",
+                "text": (
+                    f"*Share lacking authority:*\n"
+                    f"{period.capitalize()}: {_percent(overall_share)}\n"
+                    f"Last {window} {unit}s, incl. {current}: {_percent(recent_share)}"
+                )
+            }
+        ]
+    })
+    blocks.append({
+        "type": "context",
+        "elements": [{
+            "type": "mrkdwn",
+            "text": f"Since {histogram.starts[0].strftime('%Y-%m-%d')} · buckets in UTC"
+        }]
+    })
+    if statistics is not None:
+        blocks.extend(build_reporter_blocks(statistics))
+    return blocks
+
+
+def decidely_stats_callback(
+    ack: Ack,
+    command: Dict[str, Any],
+    respond: Respond
+) -> None:
+    ack()
+
+    try:
+        granularity = parse_granularity(command.get("text", ""))
+    except ValueError:
+        respond(text="ℹ️ Usage: `/decidely-stats [daily|weekly|monthly]`")
+        return
+
+    workspace_id = command["team_id"]
+    histogram = report_analytics.histogram(workspace_id, granularity)
+    # Reporters and time slots over the same period as the histogram
+    statistics = report_service.get_reporter_statistics(workspace_id, since=histogram.starts[0])
+    respond_in_messages(
+        respond,
+        text=f"📈 Decision Trends - {histogram.total()} reports",
+        blocks=build_stats_blocks(histogram, statistics)
+    )
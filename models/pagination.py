@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+from models.report import Report
+
+
+@dataclass(frozen=True)
+class ReportCursor:
+    """Keyset position in a (timestamp, id) ordered list of reports."""
+    timestamp: datetime
+    id: UUID
+
+    @classmethod
+    def from_report(cls, report: Report) -> "ReportCursor":
+        return cls(timestamp=report.timestamp, id=report.id)
+
+    def encode(self) -> str:
+        return f"{self.timestamp.isoformat()}|{self.id}"
+
+    @classmethod
+    def decode(cls, value: str) -> "ReportCursor":
+        """Parse a cursor produced by encode(); raises ValueError if malformed."""
+        timestamp, separator, report_id = value.partition("|")
+        if not separator:
+            raise ValueError(f"Invalid report cursor: {value!r}")
+        return cls(timestamp=datetime.fromisoformat(timestamp), id=UUID(report_id))
+
+
+@dataclass(frozen=True)
+class ReportPage:
+    """One page of reports, newest first, with cursors to the adjacent pages."""
+    reports: List[Report] = field(default_factory=list)
+    newer_cursor: Optional[ReportCursor] = None
+    older_cursor: Optional[ReportCursor] = None
+
+    @classmethod
+    def from_reports(
+        cls, reports: List[Report], has_newer: bool, has_older: bool
+    ) -> "ReportPage":
+        """Build a page from newest-first reports, pointing cursors at its edges."""
+        if not reports:
+            return cls()
+        return cls(
+            reports=reports,
+            newer_cursor=ReportCursor.from_report(reports[0]) if has_newer else None,
+            older_cursor=ReportCursor.from_report(reports[-1]) if has_older else None,
+        )
+
+    @property
+    def has_newer(self) -> bool:
+        return self.newer_cursor is not None
+
+    @property
+    def has_older(self) -> bool:
+        return self.older_cursor is not None
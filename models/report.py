@@ -1,6 +1,7 @@
+import sys
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from uuid import uuid4, UUID
 from typing import Dict, Any
 
@@ -10,8 +11,37 @@ class ReportType(Enum):
     EXPECTED_INITIATIVE = "expected_initiative"
 
 
-@dataclass(frozen=True)
+# Stable small-integer codes for compact storage and binary encodings.
+# Append new types with new codes; never renumber existing ones.
+REPORT_TYPE_CODES: Dict[ReportType, int] = {
+    ReportType.LACKED_AUTHORITY: 1,
+    ReportType.EXPECTED_INITIATIVE: 2,
+}
+REPORT_TYPES_BY_CODE: Dict[int, ReportType] = {
+    code: report_type for report_type, code in REPORT_TYPE_CODES.items()
+}
+
+# Compact storage and binary encodings keep timestamps as epoch microseconds
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(timestamp: datetime) -> int:
+    return (timestamp - EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    """The UTC timestamp; raises OverflowError outside datetime's range."""
+    return EPOCH + timedelta(microseconds=micros)
+
+
+@dataclass(frozen=True, slots=True)
 class Report:
+    """A single report. Slotted, with Slack user and workspace ids interned.
+    
+    Large in-memory stores hold millions of reports from a few thousand users
+    in a handful of workspaces, so every copy of an id string is shared.
+    """
     user_id: str
     workspace_id: str
     report_type: ReportType
@@ -19,6 +49,10 @@ class Report:
     id: UUID = field(default_factory=uuid4)
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
     
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "user_id", sys.intern(self.user_id))
+        object.__setattr__(self, "workspace_id", sys.intern(self.workspace_id))
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": str(self.id),
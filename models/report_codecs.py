@@ -0,0 +1,209 @@
+"""Batch encodings of Reports for exports, backups and cross-process handoff.
+
+Two streaming formats, both written and read one report at a time so whole
+workspaces can be moved without holding them in memory:
+
+* JSON Lines: one ``Report.to_dict()`` object per line, built directly from
+  the report's fields rather than through an intermediate dict.
+* Binary: a struct-packed frame per report. Slack user and workspace ids are
+  sent once per stream and referenced by index afterwards.
+"""
+import io
+import json
+import struct
+from datetime import datetime, timedelta, timezone, UTC
+from typing import BinaryIO, Dict, Iterable, Iterator, List, TextIO
+from uuid import UUID
+from models.report import (
+    Report,
+    ReportType,
+    REPORT_TYPE_CODES,
+    REPORT_TYPES_BY_CODE,
+    from_epoch_micros,
+    to_epoch_micros,
+)
+
+try:
+    from _json import encode_basestring_ascii as _quote
+except ImportError:  # pragma: no cover - pure-Python json
+    from json.encoder import py_encode_basestring_ascii as _quote
+
+class ReportDecodeError(ValueError):
+    """Raised when encoded input is not a valid report stream."""
+
+
+# JSON Lines
+
+_JSONL_RECORD = (
+    '{"id":"%s","user_id":%s,"workspace_id":%s,"report_type":"%s",'
+    '"description":%s,"timestamp":"%s"}\n'
+)
+
+
+def encode_jsonl_line(report: Report) -> str:
+    """One newline-terminated line, identical to ``json.dumps(report.to_dict())``
+    with compact separators."""
+    return _JSONL_RECORD % (
+        report.id,
+        _quote(report.user_id),
+        _quote(report.workspace_id),
+        report.report_type.value,
+        _quote(report.description),
+        report.timestamp.isoformat(),
+    )
+
+
+def iter_jsonl(reports: Iterable[Report]) -> Iterator[str]:
+    for report in reports:
+        yield encode_jsonl_line(report)
+
+
+def dump_jsonl(reports: Iterable[Report], stream: TextIO) -> int:
+    """Write reports to a text stream; returns how many were written."""
+    count = 0
+    for count, line in enumerate(iter_jsonl(reports), start=1):
+        stream.write(line)
+    return count
+
+
+def decode_jsonl_line(line: str) -> Report:
+    try:
+        data = json.loads(line)
+        return Report(
+            id=UUID(data["id"]),
+            user_id=data["user_id"],
+            workspace_id=data["workspace_id"],
+            report_type=ReportType(data["report_type"]),
+            description=data["description"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+    except (ValueError, KeyError, TypeError) as error:
+        raise ReportDecodeError(f"Invalid report line: {error}") from error
+
+
+def load_jsonl(lines: Iterable[str]) -> Iterator[Report]:
+    """Stream reports from a text stream or any iterable of lines; blank lines are skipped."""
+    for line in lines:
+        if line.strip():
+            yield decode_jsonl_line(line)
+
+
+# Binary framing
+#
+#   stream  := MAGIC frame*
+#   frame   := b"S" <u32 length> utf-8 bytes          (defines the next string index)
+#            | b"R" _REPORT_HEADER description bytes
+#
+# Timestamps are UTC epoch microseconds plus the original UTC offset in
+# seconds, or _NAIVE for naive timestamps (stored by their wall-clock time).
+
+MAGIC = b"DRPT\x01"
+_STRING = b"S"
+_REPORT = b"R"
+_LENGTH = struct.Struct("<I")
+# id, epoch microseconds, UTC offset seconds, type code, user ref, workspace ref, description length
+_REPORT_HEADER = struct.Struct("<16sqiBIII")
+_NAIVE = -0x80000000
+
+
+class BinaryReportWriter:
+    """Writes reports to a binary stream in the framed format above."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._strings: Dict[str, int] = {}
+        stream.write(MAGIC)
+
+    def _ref(self, value: str) -> int:
+        ref = self._strings.get(value)
+        if ref is None:
+            ref = self._strings[value] = len(self._strings)
+            encoded = value.encode()
+            self._stream.write(_STRING + _LENGTH.pack(len(encoded)) + encoded)
+        return ref
+
+    def write(self, report: Report) -> None:
+        timestamp = report.timestamp
+        offset = timestamp.utcoffset()
+        if offset is None:
+            timestamp, offset_seconds = timestamp.replace(tzinfo=UTC), _NAIVE
+        else:
+            offset_seconds = offset // timedelta(seconds=1)
+        description = report.description.encode()
+        self._stream.write(_REPORT + _REPORT_HEADER.pack(
+            report.id.bytes,
+            to_epoch_micros(timestamp),
+            offset_seconds,
+            REPORT_TYPE_CODES[report.report_type],
+            self._ref(report.user_id),
+            self._ref(report.workspace_id),
+            len(description),
+        ) + description)
+
+    def write_many(self, reports: Iterable[Report]) -> int:
+        count = 0
+        for count, report in enumerate(reports, start=1):
+            self.write(report)
+        return count
+
+
+def dump_binary(reports: Iterable[Report], stream: BinaryIO) -> int:
+    """Write a complete binary stream; returns how many reports were written."""
+    return BinaryReportWriter(stream).write_many(reports)
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ReportDecodeError("Truncated report stream")
+    return data
+
+
+def _decode_timestamp(micros: int, offset_seconds: int) -> datetime:
+    timestamp = from_epoch_micros(micros)
+    if offset_seconds == _NAIVE:
+        return timestamp.replace(tzinfo=None)
+    if offset_seconds == 0:
+        return timestamp
+    return timestamp.astimezone(timezone(timedelta(seconds=offset_seconds)))
+
+
+def load_binary(stream: BinaryIO) -> Iterator[Report]:
+    """Stream reports back from a binary stream written by dump_binary."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ReportDecodeError("Not a report stream")
+    strings: List[str] = []
+    while tag := stream.read(1):
+        if tag == _STRING:
+            (length,) = _LENGTH.unpack(_read_exactly(stream, _LENGTH.size))
+            strings.append(_read_exactly(stream, length).decode())
+        elif tag == _REPORT:
+            report_id, micros, offset_seconds, type_code, user_ref, workspace_ref, length = (
+                _REPORT_HEADER.unpack(_read_exactly(stream, _REPORT_HEADER.size))
+            )
+            description = _read_exactly(stream, length)
+            try:
+                report = Report(
+                    id=UUID(bytes=report_id),
+                    user_id=strings[user_ref],
+                    workspace_id=strings[workspace_ref],
+                    report_type=REPORT_TYPES_BY_CODE[type_code],
+                    description=description.decode(),
+                    timestamp=_decode_timestamp(micros, offset_seconds)
+                )
+            # Out-of-range timestamps and UTC offsets raise OverflowError and ValueError
+            except (IndexError, KeyError, OverflowError, ValueError) as error:
+                raise ReportDecodeError(f"Invalid report frame: {error!r}") from error
+            yield report
+        else:
+            raise ReportDecodeError(f"Unknown frame tag {tag!r}")
+
+
+def encode_binary(reports: Iterable[Report]) -> bytes:
+    buffer = io.BytesIO()
+    dump_binary(reports, buffer)
+    return buffer.getvalue()
+
+
+def decode_binary(data: bytes) -> List[Report]:
+    return list(load_binary(io.BytesIO(data)))
@@ -0,0 +1,221 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, TypeVar
+from uuid import UUID
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE
+from repositories.sqlite_report_repository import SQLiteReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+
+# Sorts before every stored report, so paging "after" it starts at the oldest one
+_START_CURSOR = ReportCursor(timestamp=datetime.min.replace(tzinfo=UTC), id=UUID(int=0))
+
+
+class AsyncReportRepository(ABC):
+    """Awaitable counterpart of ReportRepository for asyncio deployments."""
+
+    @abstractmethod
+    async def save(self, report: Report) -> Report:
+        pass
+
+    @abstractmethod
+    async def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        pass
+
+    @abstractmethod
+    async def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        pass
+
+    @abstractmethod
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Report]:
+        pass
+
+    @abstractmethod
+    async def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class AsyncSQLiteReportRepository(AsyncReportRepository):
+    """Runs SQLiteReportRepository calls on a dedicated, bounded thread pool.
+
+    The event loop never blocks on SQLite; at most ``max_workers`` queries run
+    at once, each on a worker thread with its own pooled connection.
+    """
+
+    def __init__(self, db_path: str, max_workers: int = DEFAULT_MAX_WORKERS, **options: Any):
+        self._repository = SQLiteReportRepository(db_path, **options)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="decidely-sqlite"
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def save(self, report: Report) -> Report:
+        return await self._run(self._repository.save, report)
+
+    async def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        # Materialize here so a lazy iterable is never consumed off the loop thread
+        return await self._run(self._repository.save_many, list(reports))
+
+    async def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        return await self._run(self._repository.find_by_id, report_id)
+
+    async def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._run(self._repository.find_by_workspace, workspace_id, since, until)
+
+    async def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._run(self._repository.find_by_user, user_id, since, until)
+
+    async def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._run(self._repository.find_by_type, report_type, since, until)
+
+    async def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._run(
+            self._repository.find_by_workspace_and_type,
+            workspace_id, report_type, since, until
+        )
+
+    async def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        return await self._run(
+            self._repository.find_page_by_workspace,
+            workspace_id, limit, before=before, after=after, since=since
+        )
+
+    async def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Report]:
+        # Each chunk is an independent keyset query, so no cursor or connection
+        # has to survive between executor calls that may land on other threads.
+        cursor = _START_CURSOR
+        while True:
+            page = await self.find_page_by_workspace(workspace_id, chunk_size, after=cursor)
+            for report in reversed(page.reports):
+                yield report
+            if not page.has_newer:
+                return
+            cursor = page.newer_cursor
+
+    async def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        return await self._run(self._repository.count_by_type, workspace_id, since)
+
+    async def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return await self._run(self._repository.search, workspace_id, query, limit, offset)
+
+    async def close(self) -> None:
+        """Wait for running queries, then release the threads and connections."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True)
+        )
+        self._repository.close()
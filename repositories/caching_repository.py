@@ -0,0 +1,302 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_REPORTS = 100_000
+DEFAULT_TTL_SECONDS = 60.0
+
+Tag = Tuple[str, Any]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    cached_reports: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tags: Tuple[Tag, ...]
+    weight: int
+    expires_at: float
+
+
+def _weight(value: Any) -> int:
+    if isinstance(value, list):
+        return max(len(value), 1)
+    if isinstance(value, ReportPage):
+        return max(len(value.reports), 1)
+    return 1
+
+
+def _floor_since(since: Optional[datetime]) -> Optional[datetime]:
+    return since.replace(second=0, microsecond=0) if since is not None else None
+
+
+def _copy(value: Any) -> Any:
+    # Cached lists are shared; never hand the stored object to callers
+    return list(value) if isinstance(value, list) else value
+
+
+class CachingReportRepository(ReportRepository):
+    """Read-through LRU cache with TTL in front of another ReportRepository.
+
+    Every query result is cached under its own key and tagged with the
+    workspace, user, type or id it depends on; ``save`` drops all entries
+    tagged with the saved report's values. Memory is bounded both by entry
+    count and by the total number of reports held across entries.
+
+    ``since`` is usually "now minus a window", which differs on every call,
+    so it is rounded down to the minute before it is used as a key or passed
+    on; a window may therefore include up to a minute of older reports.
+    """
+
+    def __init__(
+        self,
+        delegate: ReportRepository,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_reports: int = DEFAULT_MAX_REPORTS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._delegate = delegate
+        self._max_entries = max_entries
+        self._max_reports = max_reports
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._keys_by_tag: Dict[Tag, Set[Hashable]] = {}
+        # Bumped on invalidation so a read racing a save doesn't cache stale data
+        self._generations: Counter = Counter()
+        self._cached_reports = 0
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats["hits"],
+                misses=self._stats["misses"],
+                evictions=self._stats["evictions"],
+                expirations=self._stats["expirations"],
+                invalidations=self._stats["invalidations"],
+                entries=len(self._entries),
+                cached_reports=self._cached_reports,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for tag in list(self._keys_by_tag):
+                self._generations[tag] += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._cached_reports = 0
+
+    # Cache internals (callers hold self._lock)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._cached_reports -= entry.weight
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _store(self, key: Hashable, value: Any, tags: Tuple[Tag, ...]) -> None:
+        if key in self._entries:
+            self._remove(key)
+        weight = _weight(value)
+        if weight > self._max_reports:
+            return
+        self._entries[key] = _Entry(value, tags, weight, self._clock() + self._ttl_seconds)
+        self._cached_reports += weight
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._max_entries or self._cached_reports > self._max_reports:
+            self._remove(next(iter(self._entries)))
+            self._stats["evictions"] += 1
+
+    def _invalidate(self, tags: Iterable[Tag]) -> None:
+        for tag in tags:
+            self._generations[tag] += 1
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                self._stats["invalidations"] += 1
+
+    def _cached(self, key: Hashable, tags: Tuple[Tag, ...], load: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return _copy(entry.value)
+                self._remove(key)
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            generations = [self._generations[tag] for tag in tags]
+
+        value = load()
+
+        with self._lock:
+            if generations == [self._generations[tag] for tag in tags]:
+                self._store(key, _copy(value), tags)
+        return value
+
+    # Writes
+
+    def _tags_for(self, report: Report) -> List[Tag]:
+        return [
+            ("id", report.id),
+            ("workspace", report.workspace_id),
+            ("user", report.user_id),
+            ("type", report.report_type),
+        ]
+
+    def _invalidate_reports(self, reports: Iterable[Report]) -> None:
+        with self._lock:
+            for report in reports:
+                tags = self._tags_for(report)
+                # A re-saved report may be moving out of other workspaces/users/types
+                previous = self._entries.get(("id", report.id))
+                if previous is not None and isinstance(previous.value, Report):
+                    tags.extend(self._tags_for(previous.value))
+                self._invalidate(tags)
+
+    def save(self, report: Report) -> Report:
+        try:
+            return self._delegate.save(report)
+        finally:
+            self._invalidate_reports([report])
+
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        reports = list(reports)
+        try:
+            return self._delegate.save_many(reports)
+        finally:
+            self._invalidate_reports(reports)
+
+    # Reads
+
+    def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        return self._cached(
+            ("id", report_id), (("id", report_id),),
+            lambda: self._delegate.find_by_id(report_id)
+        )
+
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        since = _floor_since(since)
+        return self._cached(
+            ("workspace", workspace_id, since, until), (("workspace", workspace_id),),
+            lambda: self._delegate.find_by_workspace(workspace_id, since, until)
+        )
+
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        since = _floor_since(since)
+        return self._cached(
+            ("user", user_id, since, until), (("user", user_id),),
+            lambda: self._delegate.find_by_user(user_id, since, until)
+        )
+
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        since = _floor_since(since)
+        return self._cached(
+            ("type", report_type, since, until), (("type", report_type),),
+            lambda: self._delegate.find_by_type(report_type, since, until)
+        )
+
+    def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        since = _floor_since(since)
+        return self._cached(
+            ("workspace_type", workspace_id, report_type, since, until),
+            (("workspace", workspace_id), ("type", report_type)),
+            lambda: self._delegate.find_by_workspace_and_type(
+                workspace_id, report_type, since, until
+            )
+        )
+
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        since = _floor_since(since)
+        return self._cached(
+            ("page", workspace_id, limit, before, after, since), (("workspace", workspace_id),),
+            lambda: self._delegate.find_page_by_workspace(
+                workspace_id, limit, before=before, after=after, since=since
+            )
+        )
+
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        # Streams exist to avoid holding whole workspaces; don't cache them
+        return self._delegate.iter_by_workspace(workspace_id, chunk_size)
+
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        since = _floor_since(since)
+        return dict(self._cached(
+            ("count", workspace_id, since), (("workspace", workspace_id),),
+            lambda: self._delegate.count_by_type(workspace_id, since)
+        ))
+
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return self._cached(
+            ("search", workspace_id, query, limit, offset), (("workspace", workspace_id),),
+            lambda: self._delegate.search(workspace_id, query, limit, offset)
+        )
@@ -0,0 +1,564 @@
+import json
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from models.report import Report, ReportType
+from models.report_codecs import encode_jsonl_line
+from models.pagination import ReportCursor, ReportPage
+from repositories import text_search
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPACTION_INTERVAL = 60.0
+# Sealed segments with less than this fraction of live record bytes get compacted
+DEFAULT_COMPACTION_THRESHOLD = 0.5
+
+# Numbers are zero-padded to a minimum width but may grow past it; keys are
+# compared as integers, never by file name
+_SEGMENT_NAME = re.compile(r"^segment-(\d{8,})-(\d{4,})\.log$")
+# Last line of a sealed segment: fixed width, so it can be read with one seek
+_TRAILER_PREFIX = b"#footer-offset "
+_TRAILER_LENGTH = len(_TRAILER_PREFIX) + 20 + 1
+
+SegmentKey = Tuple[int, int]
+Key = Tuple[datetime, UUID]
+
+
+def _segment_name(key: SegmentKey) -> str:
+    return f"segment-{key[0]:08d}-{key[1]:04d}.log"
+
+
+class _Location(NamedTuple):
+    """Where a report's latest record lives, plus what queries filter on."""
+    segment: SegmentKey
+    offset: int
+    length: int
+    workspace_id: str
+    user_id: str
+    report_type: ReportType
+    timestamp: datetime
+
+
+def _footer_entry(report_id: UUID, location: _Location) -> list:
+    return [
+        str(report_id), location.workspace_id, location.user_id,
+        location.report_type.value, location.timestamp.isoformat(),
+        location.offset, location.length,
+    ]
+
+
+def _parse_footer_entry(segment: SegmentKey, entry: list) -> Tuple[UUID, _Location]:
+    report_id, workspace_id, user_id, report_type, timestamp, offset, length = entry
+    return UUID(report_id), _Location(
+        segment, offset, length, workspace_id, user_id,
+        ReportType(report_type), datetime.fromisoformat(timestamp),
+    )
+
+
+class _Segment:
+    def __init__(self, key: SegmentKey, path: Path):
+        self.key = key
+        self.path = path
+        self.size = 0
+        self.record_bytes = 0
+        self.live_bytes = 0
+        self.sealed = False
+        self.reader: IO[bytes] = open(path, "rb")
+
+    def read(self, offset: int, length: int) -> bytes:
+        self.reader.seek(offset)
+        return self.reader.read(length)
+
+
+class LogStructuredReportRepository(ReportRepository):
+    """Append-only ReportRepository over size-capped segment files.
+
+    Every save appends ``Report.to_dict()`` as a JSON line to the active
+    segment; re-saving a report appends a new record that supersedes the old
+    one. Once a segment reaches ``segment_max_bytes`` it is sealed with a
+    footer listing each record's id, workspace, user, type, timestamp and
+    offset, so reopening only reads footers (plus the one unsealed segment).
+
+    Lookups go through in-memory indexes by id, workspace and user that hold
+    offsets, not reports; records are read from disk on demand. A background
+    thread rewrites sealed segments that are mostly superseded records.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        compaction_interval: Optional[float] = DEFAULT_COMPACTION_INTERVAL,
+        compaction_threshold: float = DEFAULT_COMPACTION_THRESHOLD,
+        sync: bool = False,
+    ):
+        """Open or create the log in ``directory``.
+
+        ``compaction_interval=None`` disables background compaction; call
+        ``compact()`` directly instead. ``sync=True`` fsyncs every write.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_max_bytes = segment_max_bytes
+        self._compaction_threshold = compaction_threshold
+        self._sync = sync
+
+        self._segments: Dict[SegmentKey, _Segment] = {}
+        self._locations: Dict[UUID, _Location] = {}
+        # Sorted (timestamp, id) keys; the reports themselves stay on disk
+        self._by_workspace: Dict[str, List[Key]] = defaultdict(list)
+        self._by_user: Dict[str, List[Key]] = defaultdict(list)
+        # Live reports per workspace and type, for count_by_type without a window
+        self._type_counts: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+
+        self._active: Optional[_Segment] = None
+        self._writer: Optional[IO[bytes]] = None
+        self._active_entries: List[list] = []
+        self._load()
+
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        if compaction_interval is not None:
+            self._compactor = threading.Thread(
+                target=self._compact_periodically, args=(compaction_interval,),
+                name="decidely-log-compaction", daemon=True
+            )
+            self._compactor.start()
+
+    # Startup
+
+    def _load(self) -> None:
+        for leftover in self.directory.glob("segment-*.tmp"):
+            # An interrupted compaction; its inputs are all still in place
+            leftover.unlink()
+        keys = sorted(
+            (int(match.group(1)), int(match.group(2)))
+            for path in self.directory.iterdir()
+            if (match := _SEGMENT_NAME.match(path.name))
+        )
+        newest_entries = None
+        for position, key in enumerate(keys):
+            segment = _Segment(key, self.directory / _segment_name(key))
+            self._segments[key] = segment
+            entries = self._read_footer(segment)
+            if entries is not None:
+                segment.sealed = True
+            else:
+                entries = self._recover(segment)
+                self._open_writer(segment)
+                self._active_entries = entries
+                if position < len(keys) - 1:
+                    # Only the newest segment may stay open for appends
+                    self._seal()
+                else:
+                    newest_entries = entries
+            for entry in entries:
+                self._apply(*_parse_footer_entry(key, entry))
+        if newest_entries is None:
+            self._start_segment()
+
+        for report_id, location in self._locations.items():
+            key = (location.timestamp, report_id)
+            self._by_workspace[location.workspace_id].append(key)
+            self._by_user[location.user_id].append(key)
+        for buckets in (self._by_workspace, self._by_user):
+            for bucket in buckets.values():
+                bucket.sort()
+        self.rebuild_counts()
+
+    def _read_footer(self, segment: _Segment) -> Optional[List[list]]:
+        size = segment.path.stat().st_size
+        segment.size = size
+        if size < _TRAILER_LENGTH:
+            return None
+        trailer = segment.read(size - _TRAILER_LENGTH, _TRAILER_LENGTH)
+        if not trailer.startswith(_TRAILER_PREFIX):
+            return None
+        footer_offset = int(trailer[len(_TRAILER_PREFIX):])
+        footer = json.loads(segment.read(footer_offset, size - _TRAILER_LENGTH - footer_offset))
+        segment.record_bytes = footer_offset
+        return footer["footer"]
+
+    def _recover(self, segment: _Segment) -> List[list]:
+        """Scan an unsealed segment; a torn last record (from a crash) is cut off."""
+        entries, offset = [], 0
+        segment.reader.seek(0)
+        for line in segment.reader:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete record")
+                report = Report.from_dict(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Ignoring torn record at %s:%d", segment.path.name, offset)
+                break
+            entries.append(_footer_entry(report.id, self._location(segment.key, offset, len(line), report)))
+            offset += len(line)
+        if offset < segment.size:
+            os.truncate(segment.path, offset)
+        segment.size = segment.record_bytes = offset
+        return entries
+
+    # Index maintenance (callers hold self._lock)
+
+    def _location(self, segment: SegmentKey, offset: int, length: int, report: Report) -> _Location:
+        return _Location(
+            segment, offset, length, report.workspace_id, report.user_id,
+            report.report_type, report.timestamp,
+        )
+
+    def _apply(self, report_id: UUID, location: _Location) -> Optional[_Location]:
+        previous = self._locations.get(report_id)
+        if previous is not None:
+            self._segments[previous.segment].live_bytes -= previous.length
+        self._locations[report_id] = location
+        self._segments[location.segment].live_bytes += location.length
+        return previous
+
+    def _reindex(self, report_id: UUID, previous: Optional[_Location], location: _Location) -> None:
+        if previous is not None:
+            old_key = (previous.timestamp, report_id)
+            for bucket in (self._by_workspace[previous.workspace_id], self._by_user[previous.user_id]):
+                index = bisect_left(bucket, old_key)
+                if index < len(bucket) and bucket[index] == old_key:
+                    del bucket[index]
+            self._type_counts[previous.workspace_id][previous.report_type] -= 1
+        key = (location.timestamp, report_id)
+        insort(self._by_workspace[location.workspace_id], key)
+        insort(self._by_user[location.user_id], key)
+        self._type_counts[location.workspace_id][location.report_type] += 1
+
+    # Segment files (callers hold self._lock)
+
+    def _open_writer(self, segment: _Segment) -> None:
+        self._active = segment
+        self._writer = open(segment.path, "ab")
+
+    def _start_segment(self) -> None:
+        number = max((key[0] for key in self._segments), default=0) + 1
+        key = (number, 0)
+        path = self.directory / _segment_name(key)
+        path.touch()
+        self._segments[key] = _Segment(key, path)
+        self._open_writer(self._segments[key])
+        self._active_entries = []
+
+    def _write_footer(self, writer: IO[bytes], offset: int, entries: List[list]) -> int:
+        footer = json.dumps({"footer": entries}, separators=(",", ":")).encode() + b"\n"
+        trailer = _TRAILER_PREFIX + b"%020d\n" % offset
+        writer.write(footer + trailer)
+        writer.flush()
+        os.fsync(writer.fileno())
+        return offset + len(footer) + len(trailer)
+
+    def _seal(self) -> None:
+        segment = self._active
+        segment.size = self._write_footer(self._writer, segment.record_bytes, self._active_entries)
+        segment.sealed = True
+        self._writer.close()
+        self._writer = None
+        self._active = None
+        self._active_entries = []
+
+    def _append(self, report: Report) -> None:
+        record = encode_jsonl_line(report).encode()
+        if self._active.record_bytes and (
+            self._active.record_bytes + len(record) > self._segment_max_bytes
+        ):
+            self._seal()
+            self._start_segment()
+        segment = self._active
+        location = self._location(segment.key, segment.record_bytes, len(record), report)
+        self._writer.write(record)
+        segment.record_bytes += len(record)
+        segment.size = segment.record_bytes
+        self._active_entries.append(_footer_entry(report.id, location))
+        self._reindex(report.id, self._apply(report.id, location), location)
+
+    def _read(self, report_id: UUID) -> Report:
+        location = self._locations[report_id]
+        record = self._segments[location.segment].read(location.offset, location.length)
+        return Report.from_dict(json.loads(record))
+
+    def _read_keys(self, keys: Iterable[Key]) -> List[Report]:
+        return [self._read(report_id) for _, report_id in keys]
+
+    # Writes
+
+    def save(self, report: Report) -> Report:
+        self.save_many([report])
+        return report
+
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        reports = list(reports)
+        with self._lock:
+            if self._writer is None:
+                raise RuntimeError("LogStructuredReportRepository is closed")
+            for report in reports:
+                self._append(report)
+            self._writer.flush()
+            if self._sync:
+                os.fsync(self._writer.fileno())
+        return reports
+
+    # Reads
+
+    def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        with self._lock:
+            return self._read(report_id) if report_id in self._locations else None
+
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        with self._lock:
+            return [self._read(report_id) for report_id in report_ids if report_id in self._locations]
+
+    def _window(
+        self, bucket: List[Key], since: Optional[datetime], until: Optional[datetime]
+    ) -> List[Key]:
+        # A 1-tuple sorts before every (timestamp, id) key with that timestamp
+        start = 0 if since is None else bisect_left(bucket, (since,))
+        end = len(bucket) if until is None else bisect_left(bucket, (until,))
+        return bucket[start:end]
+
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        with self._lock:
+            return self._read_keys(
+                self._window(self._by_workspace.get(workspace_id, []), since, until)
+            )
+
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        with self._lock:
+            return self._read_keys(self._window(self._by_user.get(user_id, []), since, until))
+
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        with self._lock:
+            keys = sorted(
+                (location.timestamp, report_id)
+                for report_id, location in self._locations.items()
+                if location.report_type == report_type
+                and (since is None or location.timestamp >= since)
+                and (until is None or location.timestamp < until)
+            )
+            return self._read_keys(keys)
+
+    def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        with self._lock:
+            keys = self._window(self._by_workspace.get(workspace_id, []), since, until)
+            return self._read_keys(
+                key for key in keys if self._locations[key[1]].report_type == report_type
+            )
+
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+
+        with self._lock:
+            bucket = self._by_workspace.get(workspace_id, [])
+            first = 0 if since is None else bisect_left(bucket, (since,))
+            if after is not None:
+                start = max(bisect_right(bucket, (after.timestamp, after.id)), first)
+                end = min(start + limit, len(bucket))
+            else:
+                end = len(bucket)
+                if before is not None:
+                    end = bisect_left(bucket, (before.timestamp, before.id))
+                start = max(end - limit, first)
+            reports = self._read_keys(bucket[start:end])[::-1]
+            return ReportPage.from_reports(
+                reports, has_newer=end < len(bucket), has_older=start > first
+            )
+
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        # Resume from the last yielded key so concurrent saves can't shift the stream
+        last_key = None
+        while True:
+            with self._lock:
+                bucket = self._by_workspace.get(workspace_id, [])
+                start = 0 if last_key is None else bisect_right(bucket, last_key)
+                keys = bucket[start:start + chunk_size]
+                chunk = self._read_keys(keys)
+            if not chunk:
+                return
+            yield from chunk
+            last_key = keys[-1]
+
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        with self._lock:
+            if since is None:
+                counts = self._type_counts.get(workspace_id, Counter())
+                return {report_type: counts[report_type] for report_type in ReportType}
+            # Answered from the index alone; no records are read
+            counts = {report_type: 0 for report_type in ReportType}
+            for _, report_id in self._window(self._by_workspace.get(workspace_id, []), since, None):
+                counts[self._locations[report_id].report_type] += 1
+            return counts
+
+    def rebuild_counts(self) -> None:
+        """Recompute the per-workspace type counters from the id index."""
+        counts: Dict[str, Counter] = defaultdict(Counter)
+        with self._lock:
+            for location in self._locations.values():
+                counts[location.workspace_id][location.report_type] += 1
+            self._type_counts = counts
+
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return text_search.rank(self.iter_by_workspace(workspace_id), query, limit, offset)
+
+    # Compaction
+
+    @property
+    def segment_count(self) -> int:
+        with self._lock:
+            return len(self._segments)
+
+    def compact(self) -> int:
+        """Rewrite mostly-superseded sealed segments into one; returns how many were replaced.
+
+        The replacement takes the newest input's number with the next
+        generation, so it still sorts before every segment written after its
+        inputs and rebuilding from footers resolves re-saves the same way.
+        """
+        with self._compaction_lock:
+            with self._lock:
+                inputs = sorted(
+                    segment.key for segment in self._segments.values()
+                    if segment.sealed and segment.record_bytes
+                    and segment.live_bytes < segment.record_bytes * self._compaction_threshold
+                )
+                if not inputs:
+                    return 0
+                input_set = set(inputs)
+                live = sorted(
+                    ((report_id, location) for report_id, location in self._locations.items()
+                     if location.segment in input_set),
+                    key=lambda item: (item[1].segment, item[1].offset)
+                )
+            output_key = (inputs[-1][0], inputs[-1][1] + 1)
+            path = self.directory / _segment_name(output_key)
+            # Segments holding only superseded records are simply dropped
+            copied = self._copy_live(live, output_key, path) if live else []
+
+            with self._lock:
+                if copied:
+                    output = _Segment(output_key, path)
+                    output.sealed = True
+                    output.size = path.stat().st_size
+                    output.record_bytes = sum(location.length for _, location, _ in copied)
+                    self._segments[output_key] = output
+                    for report_id, old, new in copied:
+                        # Skip reports re-saved while we were copying
+                        if self._locations.get(report_id) is old:
+                            self._locations[report_id] = new
+                            output.live_bytes += new.length
+                for key in inputs:
+                    segment = self._segments.pop(key)
+                    segment.reader.close()
+                    segment.path.unlink()
+                # Compaction only moves live records, so the totals should not
+                # change; recounting here keeps any drift from outliving a pass
+                self.rebuild_counts()
+            return len(inputs)
+
+    def _copy_live(
+        self, live: List[Tuple[UUID, _Location]], output_key: SegmentKey, path: Path
+    ) -> List[Tuple[UUID, _Location, _Location]]:
+        # Sealed segments never change, so they are read through private handles
+        # without holding self._lock; only compaction ever deletes them.
+        readers: Dict[SegmentKey, IO[bytes]] = {}
+        copied, entries, offset = [], [], 0
+        temporary = path.with_suffix(".tmp")
+        try:
+            with open(temporary, "wb") as writer:
+                for report_id, location in live:
+                    reader = readers.get(location.segment)
+                    if reader is None:
+                        reader = readers[location.segment] = open(
+                            self.directory / _segment_name(location.segment), "rb"
+                        )
+                    reader.seek(location.offset)
+                    writer.write(reader.read(location.length))
+                    new = location._replace(segment=output_key, offset=offset)
+                    copied.append((report_id, location, new))
+                    entries.append(_footer_entry(report_id, new))
+                    offset += location.length
+                self._write_footer(writer, offset, entries)
+            os.replace(temporary, path)
+        finally:
+            for reader in readers.values():
+                reader.close()
+        return copied
+
+    def _compact_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Background compaction failed")
+
+    def close(self) -> None:
+        """Stop compaction, seal the active segment and release file handles."""
+        self._stop.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            if self._writer is None:
+                return
+            if self._active.record_bytes:
+                self._seal()
+            else:
+                self._writer.close()
+                self._writer = None
+                segment = self._segments.pop(self._active.key)
+                segment.reader.close()
+                segment.path.unlink()
+                self._active = None
+            for segment in self._segments.values():
+                segment.reader.close()
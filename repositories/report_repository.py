@@ -1,7 +1,16 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Dict, Tuple
 from uuid import UUID
 from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories import text_search
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+DEFAULT_CHUNK_SIZE = 500
 
 
 class ReportRepository(ABC):
@@ -9,63 +18,294 @@ class ReportRepository(ABC):
     def save(self, report: Report) -> Report:
         pass
     
+    @abstractmethod
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        pass
+    
     @abstractmethod
     def find_by_id(self, report_id: UUID) -> Optional[Report]:
         pass
     
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        """Return the stored reports among ``report_ids``, in no particular order.
+        
+        Backends that can look up many ids in one query override this.
+        """
+        return [report for report in map(self.find_by_id, report_ids) if report is not None]
+    
     @abstractmethod
-    def find_by_workspace(self, workspace_id: str) -> List[Report]:
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        """Return the workspace's reports, oldest first.
+        
+        ``since`` (inclusive) and ``until`` (exclusive) restrict the result to
+        a time window; the same applies to the other ``find_by_*`` queries.
+        """
         pass
     
     @abstractmethod
-    def find_by_user(self, user_id: str) -> List[Report]:
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
         pass
     
     @abstractmethod
-    def find_by_type(self, report_type: ReportType) -> List[Report]:
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
         pass
     
     @abstractmethod
     def find_by_workspace_and_type(
-        self, workspace_id: str, report_type: ReportType
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> List[Report]:
         pass
+    
+    @abstractmethod
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        """Return up to ``limit`` reports, newest first.
+        
+        ``before`` pages towards older reports and ``after`` towards newer ones;
+        with neither, the newest page is returned. With ``since``, paging stops
+        at the first report older than it.
+        """
+        pass
+    
+    @abstractmethod
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        """Lazily yield a workspace's reports in (timestamp, id) order.
+        
+        At most ``chunk_size`` reports are held by the repository at a time,
+        so callers can stream workspaces of any size.
+        """
+        pass
+    
+    @abstractmethod
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        """Return the number of reports per type in a workspace, zeros included."""
+        pass
+    
+    @abstractmethod
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        """Full-text search of report descriptions in a workspace, best match first.
+        
+        Every word in ``query`` must appear; punctuation and search operators
+        are treated as plain text.
+        """
+        pass
+
+
+def _sort_key(report: Report) -> Tuple[datetime, UUID]:
+    return (report.timestamp, report.id)
+
+
+def _window_bounds(
+    bucket: List[Report], since: Optional[datetime], until: Optional[datetime]
+) -> Tuple[int, int]:
+    # A 1-tuple sorts before every (timestamp, id) key with that timestamp
+    start = 0 if since is None else bisect_left(bucket, (since,), key=_sort_key)
+    end = len(bucket) if until is None else bisect_left(bucket, (until,), key=_sort_key)
+    return start, max(start, end)
 
 
 class InMemoryReportRepository(ReportRepository):
     def __init__(self):
         self._reports: Dict[UUID, Report] = {}
+        # Secondary indexes; every bucket is kept sorted by (timestamp, id)
+        self._by_workspace: Dict[str, List[Report]] = defaultdict(list)
+        self._by_user: Dict[str, List[Report]] = defaultdict(list)
+        self._by_type: Dict[ReportType, List[Report]] = defaultdict(list)
+        self._by_workspace_and_type: Dict[Tuple[str, ReportType], List[Report]] = (
+            defaultdict(list)
+        )
+        self._type_counts: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.RLock()
+    
+    def _buckets(self, report: Report) -> Tuple[List[Report], ...]:
+        return (
+            self._by_workspace[report.workspace_id],
+            self._by_user[report.user_id],
+            self._by_type[report.report_type],
+            self._by_workspace_and_type[(report.workspace_id, report.report_type)],
+        )
+    
+    def _unindex(self, report: Report) -> None:
+        key = _sort_key(report)
+        for bucket in self._buckets(report):
+            index = bisect_left(bucket, key, key=_sort_key)
+            if index < len(bucket) and bucket[index].id == report.id:
+                del bucket[index]
     
     def save(self, report: Report) -> Report:
-        self._reports[report.id] = report
+        with self._lock:
+            previous = self._reports.get(report.id)
+            if previous is not None:
+                self._unindex(previous)
+                self._type_counts[previous.workspace_id][previous.report_type] -= 1
+            self._reports[report.id] = report
+            self._type_counts[report.workspace_id][report.report_type] += 1
+            for bucket in self._buckets(report):
+                insort(bucket, report, key=_sort_key)
         return report
     
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        return [self.save(report) for report in reports]
+    
     def find_by_id(self, report_id: UUID) -> Optional[Report]:
         return self._reports.get(report_id)
     
-    def find_by_workspace(self, workspace_id: str) -> List[Report]:
-        return [
-            report for report in self._reports.values()
-            if report.workspace_id == workspace_id
-        ]
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        with self._lock:
+            return [self._reports[i] for i in report_ids if i in self._reports]
     
-    def find_by_user(self, user_id: str) -> List[Report]:
-        return [
-            report for report in self._reports.values()
-            if report.user_id == user_id
-        ]
+    def _lookup(
+        self,
+        index: Dict[Any, List[Report]],
+        key: Any,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        # .get() so that misses don't create empty buckets
+        with self._lock:
+            bucket = index.get(key, [])
+            start, end = _window_bounds(bucket, since, until)
+            return bucket[start:end]
     
-    def find_by_type(self, report_type: ReportType) -> List[Report]:
-        return [
-            report for report in self._reports.values()
-            if report.report_type == report_type
-        ]
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._lookup(self._by_workspace, workspace_id, since, until)
+    
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._lookup(self._by_user, user_id, since, until)
+    
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._lookup(self._by_type, report_type, since, until)
     
     def find_by_workspace_and_type(
-        self, workspace_id: str, report_type: ReportType
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._lookup(
+            self._by_workspace_and_type, (workspace_id, report_type), since, until
+        )
+    
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        with self._lock:
+            if since is None:
+                counts = self._type_counts.get(workspace_id, Counter())
+                return {report_type: counts[report_type] for report_type in ReportType}
+            counts = {}
+            for report_type in ReportType:
+                bucket = self._by_workspace_and_type.get((workspace_id, report_type), [])
+                start, end = _window_bounds(bucket, since, None)
+                counts[report_type] = end - start
+            return counts
+    
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+        
+        with self._lock:
+            bucket = self._by_workspace.get(workspace_id, [])
+            first, _ = _window_bounds(bucket, since, None)
+            if after is not None:
+                start = max(
+                    bisect_right(bucket, (after.timestamp, after.id), key=_sort_key), first
+                )
+                end = min(start + limit, len(bucket))
+            else:
+                end = len(bucket)
+                if before is not None:
+                    end = bisect_left(bucket, (before.timestamp, before.id), key=_sort_key)
+                start = max(end - limit, first)
+            reports = bucket[start:end][::-1]
+            return ReportPage.from_reports(
+                reports, has_newer=end < len(bucket), has_older=start > first
+            )
+    
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        # Resume each chunk from the last yielded key rather than from an index,
+        # so saves made while the caller iterates cannot shift or repeat reports.
+        last_key = None
+        while True:
+            with self._lock:
+                bucket = self._by_workspace.get(workspace_id, [])
+                start = 0 if last_key is None else bisect_right(
+                    bucket, last_key, key=_sort_key
+                )
+                chunk = bucket[start:start + chunk_size]
+            if not chunk:
+                return
+            yield from chunk
+            last_key = _sort_key(chunk[-1])
+    
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
     ) -> List[Report]:
-        return [
-            report for report in self._reports.values()
-            if report.workspace_id == workspace_id 
-            and report.report_type == report_type
-        ]
\ No newline at end of file
+        # Naive fallback: score every report in the workspace
+        return text_search.rank(
+            self.find_by_workspace(workspace_id), query, limit, offset
+        )
@@ -0,0 +1,365 @@
+import heapq
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+from urllib.parse import quote, unquote
+from uuid import UUID
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository, _sort_key
+from repositories.sqlite_connection import SQLiteConnectionPool
+from repositories.sqlite_report_repository import SQLiteReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+T = TypeVar("T")
+
+DEFAULT_MAX_OPEN_SHARDS = 64
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_CONNECTIONS_PER_SHARD = 2
+SHARD_SUFFIX = ".db"
+# Maps report ids to workspaces; its suffix keeps it out of workspace_ids()
+INDEX_FILE = "report-index.sqlite"
+_INDEX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS report_workspaces ("
+    "id TEXT PRIMARY KEY, workspace_id TEXT NOT NULL) WITHOUT ROWID"
+)
+
+
+class _Shard:
+    def __init__(self, repository: SQLiteReportRepository):
+        self.repository = repository
+        self.leases = 0
+        self.evicted = False
+
+
+class ShardedSQLiteReportRepository(ReportRepository):
+    """One SQLite database file per workspace under ``directory``.
+
+    Workspaces never contend for each other's write lock, and each file only
+    grows with its own workspace. At most ``max_open_shards`` shards are kept
+    open, least recently used first out; a shard evicted while a query is
+    still running on it is closed once that query finishes. Queries that are
+    not scoped to a workspace run on every shard in parallel on a pool of
+    ``max_workers`` threads and are merged in (timestamp, id) order.
+
+    ``find_by_id`` and ``find_by_ids`` avoid that fan-out: a small index
+    database maps every report id to its workspace, so a lookup opens only
+    the shards that hold the reports. The index is written before the shard,
+    so a failed save can leave an entry pointing at a shard without the
+    report, which lookups treat as a miss. ``find_by_user`` and
+    ``find_by_type`` still open every shard, each open through the LRU
+    running migrations and WAL setup, so they cost one query per workspace.
+
+    Each shard shares at most ``max_connections`` SQLite connections between
+    all threads (default DEFAULT_MAX_CONNECTIONS_PER_SHARD), so open file
+    handles stay within ``max_open_shards * max_connections`` however many
+    threads use the repository. Extra keyword arguments are passed to each
+    shard's SQLiteReportRepository.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_open_shards: int = DEFAULT_MAX_OPEN_SHARDS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **shard_options: Any,
+    ):
+        if max_open_shards < 1:
+            raise ValueError("max_open_shards must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._max_open_shards = max_open_shards
+        shard_options.setdefault("max_connections", DEFAULT_MAX_CONNECTIONS_PER_SHARD)
+        self._shard_options = shard_options
+        self._shards: "OrderedDict[str, _Shard]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="decidely-shard"
+        )
+        index_path = self.directory / INDEX_FILE
+        indexed = index_path.exists()
+        self._index = SQLiteConnectionPool(
+            str(index_path), max_connections=shard_options["max_connections"]
+        )
+        with self._index.connection() as conn, conn:
+            conn.execute(_INDEX_SCHEMA)
+        if not indexed:
+            # Shards written before the index existed
+            self.rebuild_index()
+
+    # Shard management
+
+    def shard_path(self, workspace_id: str) -> Path:
+        # Percent-encoding keeps any workspace id a single, reversible file name
+        return self.directory / f"{quote(workspace_id, safe='')}{SHARD_SUFFIX}"
+
+    def workspace_ids(self) -> List[str]:
+        """Workspaces that have a shard on disk."""
+        return sorted(
+            unquote(path.name[:-len(SHARD_SUFFIX)])
+            for path in self.directory.glob(f"*{SHARD_SUFFIX}")
+        )
+
+    @property
+    def open_shard_count(self) -> int:
+        with self._lock:
+            return len(self._shards)
+
+    @property
+    def open_connection_count(self) -> int:
+        """SQLite connections currently open across all shards."""
+        with self._lock:
+            shards = list(self._shards.values())
+        return sum(shard.repository.open_connection_count for shard in shards)
+
+    def _release(self, shard: _Shard) -> None:
+        # Callers hold self._lock
+        if shard.evicted and shard.leases == 0:
+            shard.repository.close()
+
+    def _acquire(self, workspace_id: str) -> Optional[_Shard]:
+        with self._lock:
+            shard = self._shards.get(workspace_id)
+            if shard is not None:
+                self._shards.move_to_end(workspace_id)
+                shard.leases += 1
+            return shard
+
+    @contextmanager
+    def _lease(self, workspace_id: str, create: bool) -> Iterator[Optional[SQLiteReportRepository]]:
+        """Yield the workspace's shard, or None if it has none and create is False."""
+        shard = self._acquire(workspace_id)
+        if shard is None:
+            path = self.shard_path(workspace_id)
+            if not create and not path.exists():
+                yield None
+                return
+            # Opening runs migrations, which may wait on this file's write lock;
+            # do it outside self._lock so other workspaces are not held up.
+            opened = SQLiteReportRepository(str(path), **self._shard_options)
+            with self._lock:
+                shard = self._shards.get(workspace_id)
+                if shard is None:
+                    shard = _Shard(opened)
+                    self._shards[workspace_id] = shard
+                    while len(self._shards) > self._max_open_shards:
+                        _, evicted = self._shards.popitem(last=False)
+                        evicted.evicted = True
+                        self._release(evicted)
+                else:
+                    # Another thread opened it first
+                    opened.close()
+                    self._shards.move_to_end(workspace_id)
+                shard.leases += 1
+
+        try:
+            yield shard.repository
+        finally:
+            with self._lock:
+                shard.leases -= 1
+                self._release(shard)
+
+    def _on_shard(
+        self,
+        workspace_id: str,
+        query: Callable[[SQLiteReportRepository], T],
+        default: T,
+        create: bool = False,
+    ) -> T:
+        with self._lease(workspace_id, create) as repository:
+            return default if repository is None else query(repository)
+
+    def _fan_out(self, query: Callable[[SQLiteReportRepository], List[Report]]) -> List[Report]:
+        results = self._executor.map(
+            lambda workspace_id: self._on_shard(workspace_id, query, []),
+            self.workspace_ids()
+        )
+        return list(heapq.merge(*results, key=_sort_key))
+
+    def rebuild_counts(self) -> None:
+        """Recompute every shard's summary counters."""
+        list(self._executor.map(
+            lambda workspace_id: self._on_shard(
+                workspace_id, lambda shard: shard.rebuild_counts(), None
+            ),
+            self.workspace_ids()
+        ))
+
+    def rebuild_index(self) -> None:
+        """Recompute the id-to-workspace index from every shard."""
+        def indexed_ids(workspace_id: str) -> List[tuple]:
+            reports = self._on_shard(
+                workspace_id, lambda shard: list(shard.iter_by_workspace(workspace_id)), []
+            )
+            return [(str(report.id), workspace_id) for report in reports]
+
+        rows = [row for rows in self._executor.map(indexed_ids, self.workspace_ids()) for row in rows]
+        with self._index.connection() as conn, conn:
+            conn.execute("DELETE FROM report_workspaces")
+            conn.executemany("INSERT OR REPLACE INTO report_workspaces VALUES (?, ?)", rows)
+
+    def _add_to_index(self, reports: List[Report]) -> None:
+        with self._index.connection() as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO report_workspaces VALUES (?, ?)",
+                [(str(report.id), report.workspace_id) for report in reports]
+            )
+
+    def _workspaces_of(self, report_ids: List[UUID]) -> Dict[str, List[UUID]]:
+        by_workspace: Dict[str, List[UUID]] = defaultdict(list)
+        with self._index.connection() as conn:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(report_ids), DEFAULT_CHUNK_SIZE):
+                chunk = report_ids[start:start + DEFAULT_CHUNK_SIZE]
+                rows = conn.execute(
+                    "SELECT id, workspace_id FROM report_workspaces "
+                    f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                    [str(report_id) for report_id in chunk]
+                ).fetchall()
+                for report_id, workspace_id in rows:
+                    by_workspace[workspace_id].append(UUID(report_id))
+        return by_workspace
+
+    def close(self) -> None:
+        """Stop the fan-out threads and close every open shard and the index."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            shards = list(self._shards.values())
+            self._shards.clear()
+            for shard in shards:
+                shard.evicted = True
+                self._release(shard)
+        self._index.close()
+
+    # Writes
+
+    def save(self, report: Report) -> Report:
+        self._add_to_index([report])
+        return self._on_shard(
+            report.workspace_id, lambda shard: shard.save(report), report, create=True
+        )
+
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        reports = list(reports)
+        by_workspace: Dict[str, List[Report]] = defaultdict(list)
+        for report in reports:
+            by_workspace[report.workspace_id].append(report)
+        self._add_to_index(reports)
+        # Shards are independent files, so their batches can commit concurrently
+        list(self._executor.map(
+            lambda item: self._on_shard(
+                item[0], lambda shard: shard.save_many(item[1]), [], create=True
+            ),
+            by_workspace.items()
+        ))
+        return reports
+
+    # Workspace-scoped reads go to a single shard
+
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._on_shard(
+            workspace_id, lambda shard: shard.find_by_workspace(workspace_id, since, until), []
+        )
+
+    def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._on_shard(
+            workspace_id,
+            lambda shard: shard.find_by_workspace_and_type(workspace_id, report_type, since, until),
+            []
+        )
+
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+        return self._on_shard(
+            workspace_id,
+            lambda shard: shard.find_page_by_workspace(
+                workspace_id, limit, before=before, after=after, since=since
+            ),
+            ReportPage()
+        )
+
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        # The lease is held until the stream is exhausted or closed
+        with self._lease(workspace_id, create=False) as shard:
+            if shard is not None:
+                yield from shard.iter_by_workspace(workspace_id, chunk_size)
+
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        return self._on_shard(
+            workspace_id,
+            lambda shard: shard.count_by_type(workspace_id, since),
+            {report_type: 0 for report_type in ReportType}
+        )
+
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return self._on_shard(
+            workspace_id, lambda shard: shard.search(workspace_id, query, limit, offset), []
+        )
+
+    # Lookups by id go through the index to the shards that hold them
+
+    def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        reports = self.find_by_ids([report_id])
+        return reports[0] if reports else None
+
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        by_workspace = self._workspaces_of(list(report_ids))
+        if len(by_workspace) == 1:
+            [(workspace_id, ids)] = by_workspace.items()
+            return self._on_shard(workspace_id, lambda shard: shard.find_by_ids(ids), [])
+        found = self._executor.map(
+            lambda item: self._on_shard(item[0], lambda shard: shard.find_by_ids(item[1]), []),
+            by_workspace.items()
+        )
+        return [report for reports in found for report in reports]
+
+    # Other cross-workspace reads fan out to every shard
+
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fan_out(lambda shard: shard.find_by_user(user_id, since, until))
+
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fan_out(lambda shard: shard.find_by_type(report_type, since, until))
@@ -0,0 +1,484 @@
+import threading
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+from uuid import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    bindparam,
+    create_engine,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, StaticPool
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository
+from repositories.sqlite_connection import configure_connection
+from repositories import text_search
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_BATCH_SIZE = 500
+
+metadata = MetaData()
+
+reports_table = Table(
+    "reports",
+    metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String(64), nullable=False),
+    Column("workspace_id", String(64), nullable=False),
+    Column("report_type", String(32), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("timestamp", DateTime(timezone=True), nullable=False),
+    # The description's text_search tokens, so search can filter in SQL
+    Column("search_text", Text, nullable=False, default=""),
+    Index("idx_reports_workspace_timestamp", "workspace_id", "timestamp"),
+    Index("idx_reports_workspace_type_timestamp", "workspace_id", "report_type", "timestamp"),
+    Index("idx_reports_user_timestamp", "user_id", "timestamp"),
+    Index("idx_reports_type_timestamp", "report_type", "timestamp"),
+)
+
+# Live reports per workspace and type, kept in step with reports by save and
+# save_many so count_by_type without a window is a primary-key lookup
+report_counts_table = Table(
+    "report_counts",
+    metadata,
+    Column("workspace_id", String(64), primary_key=True),
+    Column("report_type", String(32), primary_key=True),
+    Column("count", Integer, nullable=False),
+)
+
+_t = reports_table.c
+_c = report_counts_table.c
+_ORDER = (_t.timestamp, _t.id)
+_ORDER_DESC = (_t.timestamp.desc(), _t.id.desc())
+
+# Statements are built once; SQLAlchemy caches their compiled form per engine,
+# so each call only binds parameters.
+_INSERT = reports_table.insert()
+_SELECT_BY_ID = select(reports_table).where(_t.id == bindparam("id"))
+_SELECT_BY_WORKSPACE = (
+    select(reports_table).where(_t.workspace_id == bindparam("workspace_id")).order_by(*_ORDER)
+)
+_SELECT_BY_USER = select(reports_table).where(_t.user_id == bindparam("user_id")).order_by(*_ORDER)
+_SELECT_BY_TYPE = (
+    select(reports_table).where(_t.report_type == bindparam("report_type")).order_by(*_ORDER)
+)
+_SELECT_BY_WORKSPACE_AND_TYPE = (
+    select(reports_table)
+    .where(_t.workspace_id == bindparam("workspace_id"))
+    .where(_t.report_type == bindparam("report_type"))
+    .order_by(*_ORDER)
+)
+_SELECT_CHUNK = _SELECT_BY_WORKSPACE.limit(bindparam("limit"))
+_SELECT_NEWEST_PAGE = (
+    select(reports_table)
+    .where(_t.workspace_id == bindparam("workspace_id"))
+    .order_by(*_ORDER_DESC)
+    .limit(bindparam("limit"))
+)
+_SELECT_PAGE_BEFORE = (
+    select(reports_table)
+    .where(_t.workspace_id == bindparam("workspace_id"))
+    .where(and_(
+        _t.timestamp <= bindparam("timestamp"),
+        or_(_t.timestamp < bindparam("timestamp"), _t.id < bindparam("id")),
+    ))
+    .order_by(*_ORDER_DESC)
+    .limit(bindparam("limit"))
+)
+_SELECT_PAGE_AFTER = (
+    select(reports_table)
+    .where(_t.workspace_id == bindparam("workspace_id"))
+    .where(and_(
+        _t.timestamp >= bindparam("timestamp"),
+        or_(_t.timestamp > bindparam("timestamp"), _t.id > bindparam("id")),
+    ))
+    .order_by(*_ORDER)
+    .limit(bindparam("limit"))
+)
+_COUNT_BY_TYPE = (
+    select(_t.report_type, func.count())
+    .where(_t.workspace_id == bindparam("workspace_id"))
+    .group_by(_t.report_type)
+)
+_SET_SEARCH_TEXT = (
+    update(reports_table)
+    .where(_t.id == bindparam("row_id"))
+    .values(search_text=bindparam("search_text"))
+)
+_SELECT_COUNTS = select(_c.report_type, _c.count).where(_c.workspace_id == bindparam("workspace_id"))
+_INCREMENT_COUNT = (
+    update(report_counts_table)
+    .where(_c.workspace_id == bindparam("key_workspace_id"))
+    .where(_c.report_type == bindparam("key_report_type"))
+    .values(count=_c.count + bindparam("delta"))
+)
+_REBUILD_COUNTS = report_counts_table.insert().from_select(
+    ["workspace_id", "report_type", "count"],
+    select(_t.workspace_id, _t.report_type, func.count()).group_by(_t.workspace_id, _t.report_type),
+)
+# Dialects with INSERT ... ON CONFLICT bump a counter in one race-free statement
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _windowed(statement, since: Optional[datetime], until: Optional[datetime]):
+    """Restrict a statement to timestamps in [since, until)."""
+    if since is not None:
+        statement = statement.where(_t.timestamp >= since.astimezone(UTC))
+    if until is not None:
+        statement = statement.where(_t.timestamp < until.astimezone(UTC))
+    return statement
+
+
+def create_report_engine(
+    url: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_overflow: int = DEFAULT_MAX_OVERFLOW,
+    **engine_options: Any,
+) -> Engine:
+    """Create a pooled engine for ``url``, tuned for SQLite when that is the backend."""
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        # An in-memory database lives inside one connection; share it
+        return create_engine(
+            url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            **engine_options,
+        )
+
+    engine = create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+        **engine_options,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", lambda conn, _record: configure_connection(conn))
+    return engine
+
+
+class SQLAlchemyReportRepository(ReportRepository):
+    """ReportRepository on SQLAlchemy Core, for SQLite files or server databases.
+
+    Pass a database URL (pool sizing applies to it) or an already configured
+    Engine. Timestamps are stored as UTC and always returned timezone-aware.
+    """
+
+    def __init__(
+        self,
+        url_or_engine: "str | Engine",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if isinstance(url_or_engine, Engine):
+            self._engine = url_or_engine
+            self._owns_engine = False
+        else:
+            self._engine = create_report_engine(
+                url_or_engine, pool_size=pool_size, max_overflow=max_overflow
+            )
+            self._owns_engine = True
+        self.batch_size = batch_size
+        # A StaticPool hands every thread the same DBAPI connection, and returning
+        # it to the pool rolls back whatever transaction is open on it, including
+        # another thread's. Serialize use of such engines; real pools need no lock.
+        self._lock = (
+            threading.RLock() if isinstance(self._engine.pool, StaticPool) else nullcontext()
+        )
+        inspector = inspect(self._engine)
+        counted = inspector.has_table(report_counts_table.name)
+        # create_all leaves existing tables alone, so older reports tables
+        # need search_text added by hand
+        unsearchable = inspector.has_table(reports_table.name) and "search_text" not in {
+            column["name"] for column in inspector.get_columns(reports_table.name)
+        }
+        metadata.create_all(self._engine)
+        if unsearchable:
+            self._add_search_text()
+        if not counted:
+            # New table next to reports that may predate it
+            self.rebuild_counts()
+
+    def _add_search_text(self) -> None:
+        """Add the search_text column to an existing reports table and fill it in."""
+        with self._begin() as conn:
+            conn.exec_driver_sql(
+                "ALTER TABLE reports ADD COLUMN search_text TEXT NOT NULL DEFAULT ''"
+            )
+        last_id = ""
+        while True:
+            with self._begin() as conn:
+                rows = conn.execute(
+                    select(_t.id, _t.description).where(_t.id > last_id)
+                    .order_by(_t.id).limit(self.batch_size)
+                ).all()
+                if not rows:
+                    return
+                conn.execute(_SET_SEARCH_TEXT, [
+                    {"row_id": row_id, "search_text": " ".join(text_search.tokenize(description))}
+                    for row_id, description in rows
+                ])
+            last_id = rows[-1][0]
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    def close(self) -> None:
+        """Dispose of the connection pool if this repository created it."""
+        if self._owns_engine:
+            self._engine.dispose()
+
+    @contextmanager
+    def _connect(self):
+        with self._lock, self._engine.connect() as conn:
+            yield conn
+
+    @contextmanager
+    def _begin(self):
+        with self._lock, self._engine.begin() as conn:
+            yield conn
+
+    def _report_to_row(self, report: Report) -> Dict[str, Any]:
+        return {
+            "id": str(report.id),
+            "user_id": report.user_id,
+            "workspace_id": report.workspace_id,
+            "report_type": report.report_type.value,
+            "description": report.description,
+            "timestamp": report.timestamp.astimezone(UTC),
+            "search_text": " ".join(text_search.tokenize(report.description)),
+        }
+
+    def _row_to_report(self, row: Mapping[str, Any]) -> Report:
+        timestamp = row["timestamp"]
+        # SQLite has no timezone storage and hands back naive UTC values
+        timestamp = (
+            timestamp.replace(tzinfo=UTC) if timestamp.tzinfo is None
+            else timestamp.astimezone(UTC)
+        )
+        return Report(
+            id=UUID(row["id"]),
+            user_id=row["user_id"],
+            workspace_id=row["workspace_id"],
+            report_type=ReportType(row["report_type"]),
+            description=row["description"],
+            timestamp=timestamp,
+        )
+
+    def _fetch(self, statement, **params: Any) -> List[Report]:
+        with self._connect() as conn:
+            result = conn.execute(statement, params)
+            return [self._row_to_report(row) for row in result.mappings()]
+
+    def _add_counts(self, conn, reports: List[Report]) -> None:
+        deltas = Counter((report.workspace_id, report.report_type.value) for report in reports)
+        upsert = _UPSERT_DIALECTS.get(conn.dialect.name)
+        for (workspace_id, report_type), delta in deltas.items():
+            row = {"workspace_id": workspace_id, "report_type": report_type, "count": delta}
+            if upsert is not None:
+                statement = upsert(report_counts_table).values(row)
+                conn.execute(statement.on_conflict_do_update(
+                    index_elements=[_c.workspace_id, _c.report_type],
+                    set_={"count": _c.count + statement.excluded.count},
+                ))
+                continue
+            result = conn.execute(_INCREMENT_COUNT, {
+                "key_workspace_id": workspace_id, "key_report_type": report_type, "delta": delta
+            })
+            if result.rowcount == 0:
+                conn.execute(report_counts_table.insert(), row)
+
+    def save(self, report: Report) -> Report:
+        with self._begin() as conn:
+            conn.execute(_INSERT, self._report_to_row(report))
+            self._add_counts(conn, [report])
+        return report
+
+    def save_many(
+        self, reports: Iterable[Report], batch_size: Optional[int] = None
+    ) -> List[Report]:
+        """Bulk insert with one executemany and one transaction per batch."""
+        batch_size = batch_size or self.batch_size
+        saved: List[Report] = []
+        iterator = iter(reports)
+        while batch := list(islice(iterator, batch_size)):
+            with self._begin() as conn:
+                conn.execute(_INSERT, [self._report_to_row(report) for report in batch])
+                self._add_counts(conn, batch)
+            saved.extend(batch)
+        return saved
+
+    def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        reports = self._fetch(_SELECT_BY_ID, id=str(report_id))
+        return reports[0] if reports else None
+
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        ids = [str(report_id) for report_id in report_ids]
+        reports: List[Report] = []
+        for start in range(0, len(ids), self.batch_size):
+            reports.extend(self._fetch(
+                select(reports_table).where(_t.id.in_(ids[start:start + self.batch_size]))
+            ))
+        return reports
+
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fetch(
+            _windowed(_SELECT_BY_WORKSPACE, since, until), workspace_id=workspace_id
+        )
+
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fetch(_windowed(_SELECT_BY_USER, since, until), user_id=user_id)
+
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fetch(
+            _windowed(_SELECT_BY_TYPE, since, until), report_type=report_type.value
+        )
+
+    def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._fetch(
+            _windowed(_SELECT_BY_WORKSPACE_AND_TYPE, since, until),
+            workspace_id=workspace_id,
+            report_type=report_type.value,
+        )
+
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+
+        if after is not None:
+            reports = self._fetch(
+                _windowed(_SELECT_PAGE_AFTER, since, None), workspace_id=workspace_id, limit=limit + 1,
+                timestamp=after.timestamp.astimezone(UTC), id=str(after.id),
+            )
+            return ReportPage.from_reports(
+                reports[:limit][::-1], has_newer=len(reports) > limit, has_older=True
+            )
+
+        if before is not None:
+            reports = self._fetch(
+                _windowed(_SELECT_PAGE_BEFORE, since, None), workspace_id=workspace_id, limit=limit + 1,
+                timestamp=before.timestamp.astimezone(UTC), id=str(before.id),
+            )
+        else:
+            reports = self._fetch(
+                _windowed(_SELECT_NEWEST_PAGE, since, None),
+                workspace_id=workspace_id, limit=limit + 1,
+            )
+        return ReportPage.from_reports(
+            reports[:limit], has_newer=before is not None, has_older=len(reports) > limit
+        )
+
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        # One keyset query per chunk, so no connection (or StaticPool lock) is
+        # held while the caller consumes the stream
+        reports = self._fetch(_SELECT_CHUNK, workspace_id=workspace_id, limit=chunk_size)
+        while reports:
+            yield from reports
+            if len(reports) < chunk_size:
+                return
+            last = reports[-1]
+            reports = self._fetch(
+                _SELECT_PAGE_AFTER, workspace_id=workspace_id, limit=chunk_size,
+                timestamp=last.timestamp.astimezone(UTC), id=str(last.id),
+            )
+
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        counts = {report_type: 0 for report_type in ReportType}
+        # Without a window, the maintained totals answer with one primary-key range
+        statement = _SELECT_COUNTS if since is None else _windowed(_COUNT_BY_TYPE, since, None)
+        with self._connect() as conn:
+            for report_type, count in conn.execute(statement, {"workspace_id": workspace_id}):
+                counts[ReportType(report_type)] = count
+        return counts
+
+    def rebuild_counts(self) -> None:
+        """Recompute the per-workspace summary counters from the reports table, in one transaction."""
+        with self._begin() as conn:
+            conn.execute(report_counts_table.delete())
+            conn.execute(_REBUILD_COUNTS)
+
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        """Portable search: filters in SQL on normalized tokens, ranks in Python.
+
+        Descriptions are stored a second time as text_search tokens (casefolded,
+        accents stripped), so a plain LIKE per query word matches what the
+        SQLite FTS5 index would on every database SQLAlchemy supports. Only
+        rows containing every word are fetched and scored.
+
+        ``LIKE '%word%'`` cannot use an index, so the database still scans
+        every report in the workspace; every match is fetched, since ranking
+        happens after the fact. Use SQLiteReportRepository (FTS5) where search
+        has to scale with workspace size.
+        """
+        tokens = text_search.tokenize(query)
+        if not tokens:
+            return []
+        statement = select(reports_table).where(_t.workspace_id == bindparam("workspace_id"))
+        for token in tokens:
+            statement = statement.where(_t.search_text.contains(token, autoescape=True))
+        candidates = self._fetch(statement, workspace_id=workspace_id)
+        return text_search.rank(candidates, query, limit, offset)
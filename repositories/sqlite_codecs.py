@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+from models.report import (
+    Report,
+    ReportType,
+    REPORT_TYPE_CODES,
+    REPORT_TYPES_BY_CODE,
+    from_epoch_micros,
+    to_epoch_micros,
+)
+
+
+class TextRowCodec:
+    """Original layout: UUID and ISO timestamp as TEXT, report type by enum value."""
+    name = "text"
+
+    def encode_id(self, report_id: UUID) -> Any:
+        return str(report_id)
+
+    def encode_timestamp(self, timestamp: datetime) -> Any:
+        return timestamp.isoformat()
+
+    def encode_type(self, report_type: ReportType) -> Any:
+        return report_type.value
+
+    def decode_type(self, value: Any) -> ReportType:
+        return ReportType(value)
+
+    def decode_id(self, value: Any) -> UUID:
+        return UUID(value)
+
+    def decode_timestamp(self, value: Any) -> datetime:
+        return datetime.fromisoformat(value)
+
+    def encode(self, report: Report) -> Tuple[Any, ...]:
+        return (
+            str(report.id),
+            report.user_id,
+            report.workspace_id,
+            report.report_type.value,
+            report.description,
+            report.timestamp.isoformat()
+        )
+
+    def decode(self, row: Tuple[Any, ...]) -> Report:
+        return Report(
+            id=UUID(row[0]),
+            user_id=row[1],
+            workspace_id=row[2],
+            report_type=ReportType(row[3]),
+            description=row[4],
+            timestamp=datetime.fromisoformat(row[5])
+        )
+
+
+class CompactRowCodec:
+    """Compact layout: 16-byte BLOB id, INTEGER epoch microseconds, INTEGER type code.
+
+    All three encodings sort like the values they encode (big-endian UUID
+    bytes compare like the UUID's integer value), so keyset comparisons and
+    the (…, timestamp) indexes behave exactly as in the text layout.
+    Timestamps are normalized to UTC.
+    """
+    name = "compact"
+
+    def encode_id(self, report_id: UUID) -> Any:
+        return report_id.bytes
+
+    def encode_timestamp(self, timestamp: datetime) -> Any:
+        return to_epoch_micros(timestamp)
+
+    def encode_type(self, report_type: ReportType) -> Any:
+        return REPORT_TYPE_CODES[report_type]
+
+    def decode_type(self, value: Any) -> ReportType:
+        return REPORT_TYPES_BY_CODE[value]
+
+    def decode_id(self, value: Any) -> UUID:
+        return UUID(bytes=value)
+
+    def decode_timestamp(self, value: Any) -> datetime:
+        return from_epoch_micros(value)
+
+    def encode(self, report: Report) -> Tuple[Any, ...]:
+        return (
+            report.id.bytes,
+            report.user_id,
+            report.workspace_id,
+            REPORT_TYPE_CODES[report.report_type],
+            report.description,
+            to_epoch_micros(report.timestamp)
+        )
+
+    def decode(self, row: Tuple[Any, ...]) -> Report:
+        return Report(
+            id=UUID(bytes=row[0]),
+            user_id=row[1],
+            workspace_id=row[2],
+            report_type=REPORT_TYPES_BY_CODE[row[3]],
+            description=row[4],
+            timestamp=from_epoch_micros(row[5])
+        )
+
+
+TEXT_CODEC = TextRowCodec()
+COMPACT_CODEC = CompactRowCodec()
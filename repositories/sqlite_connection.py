@@ -0,0 +1,168 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_CACHE_SIZE_KIB = 16 * 1024
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def configure_connection(
+    conn: sqlite3.Connection,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+    mmap_size: int = DEFAULT_MMAP_SIZE,
+) -> sqlite3.Connection:
+    """Apply the per-connection pragmas used by every pooled connection."""
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    # WAL lets readers proceed while a writer holds the lock; NORMAL sync is
+    # durable across application crashes, which is all a WAL database needs.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # A negative cache_size is a size in KiB rather than in pages
+    conn.execute(f"PRAGMA cache_size = {-int(cache_size_kib)}")
+    conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+    return conn
+
+
+class SQLiteConnectionPool:
+    """Thread-safe source of configured SQLite connections.
+
+    File databases get one persistent connection per thread, opened and
+    configured on first use. With ``max_connections`` they instead share at
+    most that many connections, checked out for the duration of each
+    ``connection()`` block and waited for when all are busy, so the number of
+    open files no longer grows with the number of threads. ``:memory:``
+    databases only exist inside a single connection, so that one is shared and
+    access to it is serialized.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        max_connections: Optional[int] = None,
+    ):
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.db_path = db_path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._cache_size_kib = cache_size_kib
+        self._mmap_size = mmap_size
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._registry_lock = threading.Lock()
+        self._closed = False
+        self._max_connections = max_connections
+        # Bounded mode: connections not checked out, and slots being opened
+        self._idle: List[sqlite3.Connection] = []
+        self._opening = 0
+        self._released = threading.Condition(self._registry_lock)
+
+        self._shared: Optional[sqlite3.Connection] = None
+        self._shared_lock = threading.RLock()
+        if db_path == ":memory:":
+            self._shared = self._open()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        configure_connection(
+            conn,
+            busy_timeout_ms=self._busy_timeout_ms,
+            cache_size_kib=self._cache_size_kib,
+            mmap_size=self._mmap_size,
+        )
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = self._connect()
+        with self._registry_lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def open_connection_count(self) -> int:
+        with self._registry_lock:
+            return len(self._connections)
+
+    def _check_out(self) -> sqlite3.Connection:
+        with self._released:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._connections) + self._opening < self._max_connections:
+                    self._opening += 1
+                    break
+                self._released.wait()
+        # Connect outside the lock; setting WAL mode may wait on the database
+        try:
+            conn = self._connect()
+        except BaseException:
+            with self._released:
+                self._opening -= 1
+                self._released.notify()
+            raise
+        with self._released:
+            self._opening -= 1
+            if self._closed:
+                conn.close()
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            self._connections.append(conn)
+        return conn
+
+    def _check_in(self, conn: sqlite3.Connection) -> None:
+        with self._released:
+            if not self._closed:
+                self._idle.append(conn)
+            self._released.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the calling thread's connection."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+
+        if self._shared is not None:
+            with self._shared_lock:
+                yield self._shared
+            return
+
+        # Nested use on one thread gets the connection it already holds
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        if self._max_connections is None:
+            conn = self._open()
+            self._local.conn = conn
+            yield conn
+            return
+
+        conn = self._check_out()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._check_in(conn)
+
+    def close(self) -> None:
+        """Close every connection handed out by this pool."""
+        with self._registry_lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+            self._idle = []
+            self._released.notify_all()
+        for conn in connections:
+            conn.close()
@@ -0,0 +1,54 @@
+"""Maintenance commands for SQLite report databases.
+
+Run from the repository root:
+
+    python -m repositories.sqlite_maintenance rebuild-counts path/to/reports.db
+
+A directory is treated as a ShardedSQLiteReportRepository and every shard
+in it is processed.
+"""
+import argparse
+from pathlib import Path
+from typing import List
+from repositories.sharded_sqlite_repository import SHARD_SUFFIX
+from repositories.sqlite_report_repository import SQLiteReportRepository
+
+
+def database_paths(path: Path) -> List[Path]:
+    if path.is_dir():
+        return sorted(path.glob(f"*{SHARD_SUFFIX}"))
+    if not path.exists():
+        raise FileNotFoundError(f"No report database at {path}")
+    return [path]
+
+
+def rebuild_counts(path: Path) -> int:
+    """Recompute the summary counters of every database at ``path``; returns how many."""
+    paths = database_paths(path)
+    for db_path in paths:
+        repository = SQLiteReportRepository(str(db_path))
+        try:
+            repository.rebuild_counts()
+        finally:
+            repository.close()
+    return len(paths)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser(
+        "rebuild-counts", help="recompute per-workspace summary counters from reports"
+    )
+    rebuild.add_argument("path", type=Path, help="database file or shard directory")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "rebuild-counts":
+            print(f"Rebuilt summary counters in {rebuild_counts(args.path)} database(s)")
+    except FileNotFoundError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import sqlite3
+from typing import List, Tuple
+from repositories.sqlite_codecs import COMPACT_CODEC, TEXT_CODEC
+
+COMPACT_COPY_BATCH_SIZE = 5000
+
+REPORT_INDEXES: List[str] = [
+    """
+    CREATE INDEX IF NOT EXISTS idx_reports_workspace_timestamp
+    ON reports (workspace_id, timestamp)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_reports_workspace_type_timestamp
+    ON reports (workspace_id, report_type, timestamp)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_reports_user_timestamp
+    ON reports (user_id, timestamp)
+    """,
+]
+
+# Range scans for find_by_type(since=..., until=...)
+REPORT_TYPE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_reports_type_timestamp
+    ON reports (report_type, timestamp)
+"""
+
+# Keeps the reports_fts index (external content over reports.description)
+# in step with the reports table.
+REPORT_TRIGGERS: List[str] = [
+    """
+    CREATE TRIGGER IF NOT EXISTS reports_fts_insert AFTER INSERT ON reports BEGIN
+        INSERT INTO reports_fts (rowid, description) VALUES (new.rowid, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reports_fts_delete AFTER DELETE ON reports BEGIN
+        INSERT INTO reports_fts (reports_fts, rowid, description)
+        VALUES ('delete', old.rowid, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reports_fts_update AFTER UPDATE OF description ON reports BEGIN
+        INSERT INTO reports_fts (reports_fts, rowid, description)
+        VALUES ('delete', old.rowid, old.description);
+        INSERT INTO reports_fts (rowid, description) VALUES (new.rowid, new.description);
+    END
+    """,
+]
+
+REBUILD_FTS = "INSERT INTO reports_fts (reports_fts) VALUES ('rebuild')"
+
+# Per-workspace, per-type report totals kept in step with reports by
+# triggers, so unwindowed summaries are a primary-key lookup. report_type
+# holds the same encoded value as the reports table in either layout.
+REPORT_COUNTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS report_counts (
+        workspace_id TEXT NOT NULL,
+        report_type NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (workspace_id, report_type)
+    ) WITHOUT ROWID
+"""
+
+REPORT_COUNT_TRIGGERS: List[str] = [
+    """
+    CREATE TRIGGER IF NOT EXISTS report_counts_insert AFTER INSERT ON reports BEGIN
+        INSERT INTO report_counts (workspace_id, report_type, count)
+        VALUES (new.workspace_id, new.report_type, 1)
+        ON CONFLICT (workspace_id, report_type) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS report_counts_delete AFTER DELETE ON reports BEGIN
+        UPDATE report_counts SET count = count - 1
+        WHERE workspace_id = old.workspace_id AND report_type = old.report_type;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS report_counts_update
+    AFTER UPDATE OF workspace_id, report_type ON reports BEGIN
+        UPDATE report_counts SET count = count - 1
+        WHERE workspace_id = old.workspace_id AND report_type = old.report_type;
+        INSERT INTO report_counts (workspace_id, report_type, count)
+        VALUES (new.workspace_id, new.report_type, 1)
+        ON CONFLICT (workspace_id, report_type) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+REBUILD_REPORT_COUNTS: List[str] = [
+    "DELETE FROM report_counts",
+    """
+    INSERT INTO report_counts (workspace_id, report_type, count)
+    SELECT workspace_id, report_type, COUNT(*) FROM reports
+    GROUP BY workspace_id, report_type
+    """,
+]
+
+# Ordered schema migrations. Each entry is (version, statements); a database
+# at version N gets every step with a higher version applied, in order, inside
+# a single transaction per step. Never edit a released step: append a new one.
+MIGRATIONS: List[Tuple[int, List[str]]] = [
+    (1, [
+        """
+        CREATE TABLE IF NOT EXISTS reports (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            workspace_id TEXT NOT NULL,
+            report_type TEXT NOT NULL,
+            description TEXT NOT NULL,
+            timestamp TEXT NOT NULL
+        )
+        """,
+    ]),
+    (2, REPORT_INDEXES),
+    (3, [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+            description,
+            content = 'reports',
+            content_rowid = 'rowid',
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """,
+        *REPORT_TRIGGERS,
+        REBUILD_FTS,
+    ]),
+    (4, [REPORT_TYPE_INDEX]),
+    (5, [REPORT_COUNTS_TABLE, *REPORT_COUNT_TRIGGERS, *REBUILD_REPORT_COUNTS]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database, 0 if none."""
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"
+    )
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] if row and row[0] is not None else 0
+
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """Bring the database up to LATEST_VERSION and return the final version."""
+    current = get_schema_version(conn)
+    conn.commit()
+
+    for version, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Another process may have migrated while we waited for the lock
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current = version
+
+    return current
+
+
+def get_layout(conn: sqlite3.Connection) -> str:
+    """Return "compact" if reports uses the compact column types, else "text"."""
+    columns = {row[1]: row[2].upper() for row in conn.execute("PRAGMA table_info(reports)")}
+    return COMPACT_CODEC.name if columns.get("id") == "BLOB" else TEXT_CODEC.name
+
+
+def migrate_to_compact(conn: sqlite3.Connection) -> None:
+    """Rewrite a text-layout reports table into the compact layout, in one transaction."""
+    if get_layout(conn) == COMPACT_CODEC.name:
+        return
+
+    conn.commit()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if get_layout(conn) == COMPACT_CODEC.name:
+            conn.rollback()
+            return
+        conn.execute("ALTER TABLE reports RENAME TO reports_text_layout")
+        # Index names are global, so free them before recreating on the new table
+        for name, in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'reports_text_layout' AND sql IS NOT NULL"
+        ).fetchall():
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("""
+            CREATE TABLE reports (
+                id BLOB PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                workspace_id TEXT NOT NULL,
+                report_type INTEGER NOT NULL,
+                description TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            )
+        """)
+        source = conn.execute("SELECT * FROM reports_text_layout")
+        while rows := source.fetchmany(COMPACT_COPY_BATCH_SIZE):
+            conn.executemany(
+                "INSERT INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                [COMPACT_CODEC.encode(TEXT_CODEC.decode(row)) for row in rows]
+            )
+        conn.execute("DROP TABLE reports_text_layout")
+        # Building indexes after the bulk copy is cheaper than maintaining them.
+        # The old table's triggers went with it, rowids changed and type
+        # codes replaced type names, so the full-text index and the counters
+        # are rebuilt from scratch too.
+        for statement in (
+            REPORT_INDEXES + [REPORT_TYPE_INDEX] + REPORT_TRIGGERS + REPORT_COUNT_TRIGGERS
+        ):
+            conn.execute(statement)
+        conn.execute(REBUILD_FTS)
+        for statement in REBUILD_REPORT_COUNTS:
+            conn.execute(statement)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def rebuild_report_counts(conn: sqlite3.Connection) -> None:
+    """Recompute report_counts from the reports table, in one transaction."""
+    conn.commit()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for statement in REBUILD_REPORT_COUNTS:
+            conn.execute(statement)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
@@ -1,60 +1,108 @@
-from typing import List, Optional, Tuple, Any
-from uuid import UUID
 from datetime import datetime
-import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
+from itertools import islice
+from uuid import UUID
 from contextlib import contextmanager
 from models.report import Report, ReportType
-from repositories.report_repository import ReportRepository
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT, build_fts_query
+from repositories.sqlite_connection import (
+    DEFAULT_BUSY_TIMEOUT_MS,
+    DEFAULT_CACHE_SIZE_KIB,
+    DEFAULT_MMAP_SIZE,
+    SQLiteConnectionPool,
+)
+from repositories.sqlite_codecs import COMPACT_CODEC, TEXT_CODEC
+from repositories.sqlite_migrations import (
+    apply_migrations,
+    get_layout,
+    migrate_to_compact,
+    rebuild_report_counts,
+)
+from repositories.sqlite_report_view import REPORT_COLUMNS, ReportView, validate_columns
+
+
+DEFAULT_BATCH_SIZE = 500
+
+_INSERT_REPORT = """
+    INSERT INTO reports (id, user_id, workspace_id, report_type, description, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
 
 
 class SQLiteReportRepository(ReportRepository):
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        compact: bool = False,
+        max_connections: Optional[int] = None,
+    ):
+        """Open (creating or upgrading) the report database at ``db_path``.
+        
+        With ``compact=True`` a text-layout database is rewritten into the
+        compact layout (see sqlite_codecs). An existing compact database is
+        always read as compact, whatever the flag says. ``max_connections``
+        caps the open connections to the file (see SQLiteConnectionPool).
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.db_path = db_path
-        self._conn = None
+        self.batch_size = batch_size
         
-        # For in-memory databases, keep connection open
-        if db_path == ":memory:":
-            self._conn = sqlite3.connect(":memory:")
+        # Persistent, pre-configured connections (one per thread for files,
+        # or at most max_connections shared ones; a single shared one for
+        # in-memory databases)
+        self._pool = SQLiteConnectionPool(
+            db_path,
+            busy_timeout_ms=busy_timeout_ms,
+            cache_size_kib=cache_size_kib,
+            mmap_size=mmap_size,
+            max_connections=max_connections,
+        )
         
-        # Create table
-        with self._database_operation() as cursor:
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS reports (
-                    id TEXT PRIMARY KEY,
-                    user_id TEXT NOT NULL,
-                    workspace_id TEXT NOT NULL,
-                    report_type TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    timestamp TEXT NOT NULL
-                )
-            """)
+        # Create or upgrade the schema in place
+        with self._pool.connection() as conn:
+            apply_migrations(conn)
+            if compact:
+                migrate_to_compact(conn)
+            layout = get_layout(conn)
+        self._codec = COMPACT_CODEC if layout == COMPACT_CODEC.name else TEXT_CODEC
+    
+    @property
+    def layout(self) -> str:
+        """Storage layout in use, "text" or "compact"."""
+        return self._codec.name
+    
+    @property
+    def open_connection_count(self) -> int:
+        return self._pool.open_connection_count
     
-    def _get_connection(self):
-        """Get database connection, using persistent connection for in-memory databases."""
-        return self._conn if self._conn else sqlite3.connect(self.db_path)
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close()
     
     @contextmanager
     def _database_operation(self):
         """Context manager for database operations."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        finally:
-            if not self._conn:
-                conn.close()
+        with self._pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
     
     def _row_to_report(self, row: Tuple[Any, ...]) -> Report:
         """Convert database row to Report object."""
-        return Report(
-            id=UUID(row[0]),
-            user_id=row[1],
-            workspace_id=row[2],
-            report_type=ReportType(row[3]),
-            description=row[4],
-            timestamp=datetime.fromisoformat(row[5])
-        )
+        return self._codec.decode(row)
     
     def _execute_query(self, query: str, params: Tuple[Any, ...] = ()) -> List[Report]:
         """Execute query and return list of Reports."""
@@ -63,52 +111,275 @@ class SQLiteReportRepository(ReportRepository):
             rows = cursor.fetchall()
             return [self._row_to_report(row) for row in rows]
     
+    def _iter_rows(
+        self,
+        columns: Sequence[str],
+        where: str,
+        params: Tuple[Any, ...] = (),
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Lazily yield ``columns`` of matching rows in (timestamp, id) order.
+        
+        Each chunk of chunk_size rows is its own keyset query, so no connection
+        (or, for :memory:, the shared connection's lock) is held between chunks
+        while the caller consumes them.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        query = (
+            f"SELECT {', '.join(columns)}, timestamp, id FROM reports WHERE {where}"
+            "{keyset} ORDER BY timestamp, id LIMIT ?"
+        )
+        rows = self._fetch_rows(query.format(keyset=""), (*params, chunk_size))
+        while rows:
+            for row in rows:
+                yield row[:-2]
+            if len(rows) < chunk_size:
+                return
+            last_timestamp, last_id = rows[-1][-2:]
+            rows = self._fetch_rows(
+                query.format(keyset=" AND (timestamp, id) > (?, ?)"),
+                (*params, last_timestamp, last_id, chunk_size)
+            )
+    
+    def _fetch_rows(self, query: str, params: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        with self._database_operation() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    
+    def _report_to_row(self, report: Report) -> Tuple[Any, ...]:
+        """Convert Report object to database row parameters."""
+        return self._codec.encode(report)
+    
     def save(self, report: Report) -> Report:
         with self._database_operation() as cursor:
-            cursor.execute("""
-                INSERT INTO reports (id, user_id, workspace_id, report_type, description, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                str(report.id),
-                report.user_id,
-                report.workspace_id,
-                report.report_type.value,
-                report.description,
-                report.timestamp.isoformat()
-            ))
+            cursor.execute(_INSERT_REPORT, self._report_to_row(report))
         return report
     
+    def save_many(
+        self, reports: Iterable[Report], batch_size: Optional[int] = None
+    ) -> List[Report]:
+        """Insert reports with one executemany and one commit per batch.
+        
+        A failing batch is rolled back on its own; earlier batches stay committed.
+        """
+        batch_size = batch_size or self.batch_size
+        saved: List[Report] = []
+        iterator = iter(reports)
+        while batch := list(islice(iterator, batch_size)):
+            with self._database_operation() as cursor:
+                cursor.executemany(
+                    _INSERT_REPORT, [self._report_to_row(report) for report in batch]
+                )
+            saved.extend(batch)
+        return saved
+    
     def find_by_id(self, report_id: UUID) -> Optional[Report]:
         with self._database_operation() as cursor:
             cursor.execute(
                 "SELECT * FROM reports WHERE id = ?", 
-                (str(report_id),)
+                (self._codec.encode_id(report_id),)
             )
             row = cursor.fetchone()
             return self._row_to_report(row) if row else None
     
-    def find_by_workspace(self, workspace_id: str) -> List[Report]:
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        ids = [self._codec.encode_id(report_id) for report_id in report_ids]
+        reports: List[Report] = []
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), DEFAULT_CHUNK_SIZE):
+            chunk = ids[start:start + DEFAULT_CHUNK_SIZE]
+            reports.extend(self._execute_query(
+                f"SELECT * FROM reports WHERE id IN ({', '.join('?' * len(chunk))})", tuple(chunk)
+            ))
+        return reports
+    
+    def _time_window(
+        self, since: Optional[datetime], until: Optional[datetime]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """SQL and parameters restricting timestamp to [since, until)."""
+        clause, params = "", ()
+        if since is not None:
+            clause += " AND timestamp >= ?"
+            params += (self._codec.encode_timestamp(since),)
+        if until is not None:
+            clause += " AND timestamp < ?"
+            params += (self._codec.encode_timestamp(until),)
+        return clause, params
+    
+    # Each lookup is a range scan over its (…, timestamp) index
+    
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        window, window_params = self._time_window(since, until)
         return self._execute_query(
-            "SELECT * FROM reports WHERE workspace_id = ?", 
-            (workspace_id,)
+            f"SELECT * FROM reports WHERE workspace_id = ?{window} "
+            "ORDER BY timestamp, id", 
+            (workspace_id, *window_params)
         )
     
-    def find_by_user(self, user_id: str) -> List[Report]:
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        window, window_params = self._time_window(since, until)
         return self._execute_query(
-            "SELECT * FROM reports WHERE user_id = ?", 
-            (user_id,)
+            f"SELECT * FROM reports WHERE user_id = ?{window} "
+            "ORDER BY timestamp, id", 
+            (user_id, *window_params)
         )
     
-    def find_by_type(self, report_type: ReportType) -> List[Report]:
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        window, window_params = self._time_window(since, until)
         return self._execute_query(
-            "SELECT * FROM reports WHERE report_type = ?", 
-            (report_type.value,)
+            f"SELECT * FROM reports WHERE report_type = ?{window} "
+            "ORDER BY timestamp, id", 
+            (self._codec.encode_type(report_type), *window_params)
         )
     
     def find_by_workspace_and_type(
-        self, workspace_id: str, report_type: ReportType
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> List[Report]:
+        window, window_params = self._time_window(since, until)
         return self._execute_query(
-            "SELECT * FROM reports WHERE workspace_id = ? AND report_type = ?", 
-            (workspace_id, report_type.value)
-        )
\ No newline at end of file
+            f"SELECT * FROM reports WHERE workspace_id = ? AND report_type = ?{window} "
+            "ORDER BY timestamp, id", 
+            (workspace_id, self._codec.encode_type(report_type), *window_params)
+        )
+    
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        counts = {report_type: 0 for report_type in ReportType}
+        with self._database_operation() as cursor:
+            if since is None:
+                # Trigger-maintained totals: one primary-key range per workspace
+                cursor.execute(
+                    "SELECT report_type, count FROM report_counts WHERE workspace_id = ?",
+                    (workspace_id,)
+                )
+            else:
+                # Covered by the (workspace_id, report_type, timestamp) index
+                window, window_params = self._time_window(since, None)
+                cursor.execute(
+                    "SELECT report_type, COUNT(*) FROM reports "
+                    f"WHERE workspace_id = ?{window} GROUP BY report_type",
+                    (workspace_id, *window_params)
+                )
+            for report_type, count in cursor.fetchall():
+                counts[self._codec.decode_type(report_type)] = count
+        return counts
+    
+    def rebuild_counts(self) -> None:
+        """Recompute the per-workspace summary counters from the reports table."""
+        with self._pool.connection() as conn:
+            rebuild_report_counts(conn)
+    
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        for row in self._iter_rows(REPORT_COLUMNS, "workspace_id = ?", (workspace_id,), chunk_size):
+            yield self._row_to_report(row)
+    
+    def iter_views_by_workspace(
+        self,
+        workspace_id: str,
+        columns: Sequence[str] = REPORT_COLUMNS,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ReportView]:
+        """Stream lazily decoded views of the workspace's reports, oldest first.
+        
+        Only ``columns`` are read from the database; fields are decoded when
+        the caller first touches them.
+        """
+        columns = validate_columns(columns)
+        window, window_params = self._time_window(since, until)
+        for row in self._iter_rows(
+            columns, f"workspace_id = ?{window}", (workspace_id, *window_params), chunk_size
+        ):
+            yield ReportView(self._codec, columns, row)
+    
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        fts_query = build_fts_query(query)
+        if fts_query is None:
+            return []
+        # rank is FTS5's bm25 score (lower is better)
+        return self._execute_query(
+            "SELECT reports.* FROM reports_fts "
+            "JOIN reports ON reports.rowid = reports_fts.rowid "
+            "WHERE reports_fts MATCH ? AND reports.workspace_id = ? "
+            "ORDER BY reports_fts.rank, reports.timestamp DESC "
+            "LIMIT ? OFFSET ?",
+            (fts_query, workspace_id, limit, offset)
+        )
+    
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+        
+        # One range scan over (workspace_id, timestamp); the extra row tells us
+        # whether another page exists in the scan direction.
+        window, window_params = self._time_window(since, None)
+        if after is not None:
+            reports = self._execute_query(
+                f"SELECT * FROM reports WHERE workspace_id = ?{window} "
+                "AND timestamp >= ? AND (timestamp > ? OR id > ?) "
+                "ORDER BY timestamp, id LIMIT ?",
+                (workspace_id, *window_params, *self._cursor_params(after), limit + 1)
+            )
+            has_newer = len(reports) > limit
+            return ReportPage.from_reports(
+                reports[:limit][::-1], has_newer=has_newer, has_older=True
+            )
+        
+        if before is not None:
+            reports = self._execute_query(
+                f"SELECT * FROM reports WHERE workspace_id = ?{window} "
+                "AND timestamp <= ? AND (timestamp < ? OR id < ?) "
+                "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (workspace_id, *window_params, *self._cursor_params(before), limit + 1)
+            )
+        else:
+            reports = self._execute_query(
+                f"SELECT * FROM reports WHERE workspace_id = ?{window} "
+                "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (workspace_id, *window_params, limit + 1)
+            )
+        has_older = len(reports) > limit
+        return ReportPage.from_reports(
+            reports[:limit], has_newer=before is not None, has_older=has_older
+        )
+    
+    def _cursor_params(self, cursor: ReportCursor) -> Tuple[Any, Any, Any]:
+        timestamp = self._codec.encode_timestamp(cursor.timestamp)
+        return (timestamp, timestamp, self._codec.encode_id(cursor.id))
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any, Dict, Sequence, Tuple
+from uuid import UUID
+from models.report import Report, ReportType
+
+# Columns of the reports table, in table order
+REPORT_COLUMNS: Tuple[str, ...] = (
+    "id", "user_id", "workspace_id", "report_type", "description", "timestamp"
+)
+
+
+def validate_columns(columns: Sequence[str]) -> Tuple[str, ...]:
+    """Return columns as a tuple, rejecting anything that is not a reports column."""
+    columns = tuple(columns)
+    unknown = [column for column in columns if column not in REPORT_COLUMNS]
+    if unknown or not columns:
+        raise ValueError(f"Unknown or missing report columns: {unknown or columns}")
+    return columns
+
+
+class ReportView:
+    """Read-only, Report-compatible view over a raw reports row.
+
+    Each field is decoded on first access and then cached, so callers that
+    only touch ``description`` or ``report_type`` never pay for UUID or
+    timestamp parsing. Reading a column the query did not select raises
+    AttributeError.
+    """
+
+    __slots__ = ("_codec", "_raw", "_decoded")
+
+    def __init__(self, codec: Any, columns: Sequence[str], row: Sequence[Any]):
+        self._codec = codec
+        self._raw: Dict[str, Any] = dict(zip(columns, row))
+        self._decoded: Dict[str, Any] = {}
+
+    def _field(self, name: str) -> Any:
+        try:
+            return self._decoded[name]
+        except KeyError:
+            pass
+        try:
+            raw = self._raw[name]
+        except KeyError:
+            raise AttributeError(f"Column {name!r} was not selected for this view") from None
+        if name == "id":
+            value = self._codec.decode_id(raw)
+        elif name == "report_type":
+            value = self._codec.decode_type(raw)
+        elif name == "timestamp":
+            value = self._codec.decode_timestamp(raw)
+        else:
+            value = raw
+        self._decoded[name] = value
+        return value
+
+    @property
+    def id(self) -> UUID:
+        return self._field("id")
+
+    @property
+    def user_id(self) -> str:
+        return self._field("user_id")
+
+    @property
+    def workspace_id(self) -> str:
+        return self._field("workspace_id")
+
+    @property
+    def report_type(self) -> ReportType:
+        return self._field("report_type")
+
+    @property
+    def description(self) -> str:
+        return self._field("description")
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._field("timestamp")
+
+    def to_report(self) -> Report:
+        """Decode every field into a Report; the view must hold all columns."""
+        return Report(
+            id=self.id,
+            user_id=self.user_id,
+            workspace_id=self.workspace_id,
+            report_type=self.report_type,
+            description=self.description,
+            timestamp=self.timestamp,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.to_report().to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ReportView):
+            return self._raw == other._raw and self._codec is other._codec
+        if isinstance(other, Report):
+            return self.to_report() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ReportView({', '.join(self._raw)})"
@@ -0,0 +1,50 @@
+import re
+import unicodedata
+from typing import Iterable, List, Optional, Sequence
+from models.report import Report
+
+DEFAULT_SEARCH_LIMIT = 20
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Casefold and strip accents, matching FTS5's unicode61 remove_diacritics tokenizer."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(normalize(text))
+
+
+def build_fts_query(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching every word, or None if there are none.
+
+    Each word is quoted, so operators and punctuation typed by users are
+    searched for literally instead of being parsed as FTS5 syntax.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def score(report: Report, tokens: Sequence[str]) -> int:
+    """Naive relevance: occurrences of the query words; 0 unless every word is present."""
+    words = tokenize(report.description)
+    counts = [words.count(token) for token in tokens]
+    return sum(counts) if all(counts) else 0
+
+
+def rank(
+    reports: Iterable[Report], query: str, limit: int, offset: int = 0
+) -> List[Report]:
+    """Rank reports against query, best first and newest first on ties."""
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+    # Only matches are kept, so reports can be a stream over a whole workspace
+    matches = [(s, report) for report in reports if (s := score(report, tokens))]
+    matches.sort(key=lambda item: (item[0], item[1].timestamp), reverse=True)
+    return [report for _, report in matches[offset:offset + limit]]
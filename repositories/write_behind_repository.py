@@ -0,0 +1,336 @@
+import atexit
+import heapq
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.report_repository import DEFAULT_CHUNK_SIZE, ReportRepository, _sort_key
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _in_window(
+    report: Report, since: Optional[datetime], until: Optional[datetime]
+) -> bool:
+    return (since is None or report.timestamp >= since) and (
+        until is None or report.timestamp < until
+    )
+
+
+class WriteBehindReportRepository(ReportRepository):
+    """Buffers saves in memory and writes them to ``delegate`` in batches.
+
+    A background thread calls ``delegate.save_many`` once ``flush_size``
+    reports are pending or every ``flush_interval`` seconds, whichever comes
+    first. Reads merge the pending buffer into the delegate's results, so a
+    report is visible as soon as ``save`` returns. Saving an id that is
+    already pending raises ValueError at once. Ids already stored are found
+    with one ``delegate.find_by_ids`` per flush and dropped with an error
+    logged, so ``save`` never waits on the delegate. ``close()`` (also run at
+    interpreter exit) stops the thread and flushes whatever is left.
+    """
+
+    def __init__(
+        self,
+        delegate: ReportRepository,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self._delegate = delegate
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_attempts = max_attempts
+        self._pending: Dict[UUID, Report] = {}
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        # Odd while a batch is being written; counts retry until it is even and unchanged
+        self._flush_epoch = 0
+        self._flush_done = threading.Condition(self._lock)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="decidely-write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # Writes
+
+    def save(self, report: Report) -> Report:
+        return self.save_many([report])[0]
+
+    def save_many(self, reports: Iterable[Report]) -> List[Report]:
+        reports = list(reports)
+        ids = {report.id for report in reports}
+        if len(ids) < len(reports):
+            raise ValueError("save_many was given the same report id twice")
+        with self._wakeup:
+            if self._closed:
+                raise RuntimeError("WriteBehindReportRepository is closed")
+            duplicate = next((i for i in ids if i in self._pending), None)
+            if duplicate is not None:
+                raise ValueError(f"Report {duplicate} already exists")
+            for report in reports:
+                self._pending[report.id] = report
+            if len(self._pending) >= self._flush_size:
+                self._wakeup.notify()
+        return reports
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write every pending report to the delegate; returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending.values())
+                if not batch:
+                    return 0
+                self._flush_epoch += 1
+            try:
+                return self._write(batch)
+            finally:
+                with self._flush_done:
+                    self._flush_epoch += 1
+                    self._flush_done.notify_all()
+
+    def _write(self, batch: List[Report]) -> int:
+        # One lookup for the whole batch finds ids the delegate already has:
+        # either this batch, partly written by an earlier failed flush, or a
+        # report saved elsewhere under the same id
+        stored = {report.id: report for report in self._delegate.find_by_ids(r.id for r in batch)}
+        conflicts = [report for report in batch if stored.get(report.id, report) != report]
+        for report in conflicts:
+            logger.error("Dropping report %s: a different report is already stored with that id", report.id)
+        new = [report for report in batch if report.id not in stored]
+
+        failed: List[Report] = []
+        if new:
+            try:
+                self._delegate.save_many(new)
+            except Exception:
+                logger.exception("Batched write of %d reports failed; retrying one by one", len(new))
+                failed = self._save_individually(new)
+
+        failed_ids = {report.id for report in failed}
+        with self._lock:
+            for report in batch:
+                if report.id in failed_ids:
+                    self._attempts[report.id] += 1
+                    if self._attempts[report.id] < self._max_attempts:
+                        continue
+                    logger.error("Dropping report %s after %d failed writes", report.id, self._max_attempts)
+                del self._pending[report.id]
+                self._attempts.pop(report.id, None)
+        return len(batch) - len(failed) - len(conflicts)
+
+    def _save_individually(self, batch: List[Report]) -> List[Report]:
+        failed = []
+        for report in batch:
+            try:
+                # A partially applied batch may already have stored this one
+                if self._delegate.find_by_id(report.id) != report:
+                    self._delegate.save(report)
+            except Exception:
+                logger.exception("Writing report %s failed", report.id)
+                failed.append(report)
+        return failed
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if not self._closed and len(self._pending) < self._flush_size:
+                    self._wakeup.wait(self._flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Background flush failed")
+
+    def close(self) -> None:
+        """Stop the background thread and durably flush pending reports."""
+        with self._wakeup:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+        self._thread.join()
+        for _ in range(self._max_attempts):
+            if not self.pending_count:
+                break
+            self.flush()
+        atexit.unregister(self.close)
+
+    # Reads
+
+    def _pending_matching(self, predicate) -> List[Report]:
+        with self._lock:
+            return [report for report in self._pending.values() if predicate(report)]
+
+    def _merge(self, stored: List[Report], pending: List[Report]) -> List[Report]:
+        merged = {report.id: report for report in stored}
+        merged.update((report.id, report) for report in pending)
+        return sorted(merged.values(), key=_sort_key)
+
+    def find_by_id(self, report_id: UUID) -> Optional[Report]:
+        with self._lock:
+            report = self._pending.get(report_id)
+        return report if report is not None else self._delegate.find_by_id(report_id)
+
+    def find_by_ids(self, report_ids: Iterable[UUID]) -> List[Report]:
+        report_ids = list(report_ids)
+        with self._lock:
+            pending = [self._pending[i] for i in report_ids if i in self._pending]
+        pending_ids = {report.id for report in pending}
+        return pending + self._delegate.find_by_ids(i for i in report_ids if i not in pending_ids)
+
+    def find_by_workspace(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pending = self._pending_matching(
+            lambda r: r.workspace_id == workspace_id and _in_window(r, since, until)
+        )
+        return self._merge(self._delegate.find_by_workspace(workspace_id, since, until), pending)
+
+    def find_by_user(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pending = self._pending_matching(
+            lambda r: r.user_id == user_id and _in_window(r, since, until)
+        )
+        return self._merge(self._delegate.find_by_user(user_id, since, until), pending)
+
+    def find_by_type(
+        self,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pending = self._pending_matching(
+            lambda r: r.report_type == report_type and _in_window(r, since, until)
+        )
+        return self._merge(self._delegate.find_by_type(report_type, since, until), pending)
+
+    def find_by_workspace_and_type(
+        self,
+        workspace_id: str,
+        report_type: ReportType,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        pending = self._pending_matching(
+            lambda r: r.workspace_id == workspace_id and r.report_type == report_type
+            and _in_window(r, since, until)
+        )
+        return self._merge(
+            self._delegate.find_by_workspace_and_type(workspace_id, report_type, since, until),
+            pending
+        )
+
+    def find_page_by_workspace(
+        self,
+        workspace_id: str,
+        limit: int,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        # Take the stored page, add pending reports from the same key range and
+        # re-cut it: the true page is always within those two sets.
+        page = self._delegate.find_page_by_workspace(
+            workspace_id, limit, before=before, after=after, since=since
+        )
+        if after is not None:
+            bound = (after.timestamp, after.id)
+            pending = self._pending_matching(
+                lambda r: r.workspace_id == workspace_id and _sort_key(r) > bound
+                and _in_window(r, since, None)
+            )
+            ordered = self._merge(page.reports, pending)
+            return ReportPage.from_reports(
+                ordered[:limit][::-1],
+                has_newer=page.has_newer or len(ordered) > limit,
+                has_older=True
+            )
+
+        bound = (before.timestamp, before.id) if before is not None else None
+        pending = self._pending_matching(
+            lambda r: r.workspace_id == workspace_id
+            and (bound is None or _sort_key(r) < bound)
+            and _in_window(r, since, None)
+        )
+        ordered = self._merge(page.reports, pending)[::-1]
+        return ReportPage.from_reports(
+            ordered[:limit],
+            has_newer=before is not None,
+            has_older=page.has_older or len(ordered) > limit
+        )
+
+    def iter_by_workspace(
+        self, workspace_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Report]:
+        pending = sorted(
+            self._pending_matching(lambda r: r.workspace_id == workspace_id), key=_sort_key
+        )
+        pending_ids = {report.id for report in pending}
+        stored = (
+            report for report in self._delegate.iter_by_workspace(workspace_id, chunk_size)
+            if report.id not in pending_ids
+        )
+        return heapq.merge(stored, pending, key=_sort_key)
+
+    def count_by_type(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[ReportType, int]:
+        # A batch moving from the buffer to the delegate between the two reads
+        # would be counted twice (or not at all), so the reads are retried
+        # until no flush was writing around them. Flushes are never blocked.
+        while True:
+            with self._flush_done:
+                while self._flush_epoch % 2:
+                    self._flush_done.wait()
+                epoch = self._flush_epoch
+                pending = [
+                    r for r in self._pending.values()
+                    if r.workspace_id == workspace_id and _in_window(r, since, None)
+                ]
+            counts = self._delegate.count_by_type(workspace_id, since)
+            with self._lock:
+                if self._flush_epoch == epoch:
+                    break
+        for report in pending:
+            counts[report.report_type] = counts.get(report.report_type, 0) + 1
+        return counts
+
+    def search(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        # Relevance comes from the delegate's index, so make pending reports
+        # part of it before searching
+        if self._pending_matching(lambda r: r.workspace_id == workspace_id):
+            self.flush()
+        return self._delegate.search(workspace_id, query, limit, offset)
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Iterable, List, Dict, Any, Optional
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+from repositories.async_report_repository import AsyncReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+from services.report_service import DEFAULT_PAGE_SIZE, build_workspace_summary
+
+
+class AsyncReportService:
+    """ReportService for slack_bolt's AsyncApp; every storage call is awaited.
+
+    Rendering stays on ReportService.format_reports_for_slack, which does no I/O.
+    """
+
+    def __init__(self, repository: AsyncReportRepository):
+        self._repository = repository
+
+    async def create_report(
+        self,
+        user_id: str,
+        workspace_id: str,
+        report_type: ReportType,
+        description: str
+    ) -> Report:
+        report = Report(
+            user_id=user_id,
+            workspace_id=workspace_id,
+            report_type=report_type,
+            description=description
+        )
+        return await self._repository.save(report)
+
+    async def create_reports(self, reports: Iterable[Report]) -> List[Report]:
+        return await self._repository.save_many(reports)
+
+    async def get_workspace_reports(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._repository.find_by_workspace(workspace_id, since, until)
+
+    async def get_workspace_reports_page(
+        self,
+        workspace_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        return await self._repository.find_page_by_workspace(
+            workspace_id, limit, before=before, after=after, since=since
+        )
+
+    async def get_user_reports(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return await self._repository.find_by_user(user_id, since, until)
+
+    async def search_reports(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return await self._repository.search(workspace_id, query, limit, offset)
+
+    async def get_workspace_summary(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        counts = await self._repository.count_by_type(workspace_id, since)
+        return build_workspace_summary(workspace_id, counts)
@@ -0,0 +1,395 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from models.report import Report
+from services.report_service import REPORT_TYPE_TEXT, ReportService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+# Slack allows about one message per second per channel; each workspace
+# gets one message per run, so this only smooths bursts across workspaces.
+DEFAULT_POSTS_PER_SECOND = 10.0
+DEFAULT_TIME_BUDGET_SECONDS = 15 * 60
+DEFAULT_TOP_REPORTS = 5
+DEFAULT_TOP_REPORTERS = 3
+DIGEST_PERIOD = timedelta(weeks=1)
+EXCERPT_LENGTH = 280
+
+Block = Dict[str, Any]
+# (workspace id, channel id, fallback text, blocks) -> None
+PostMessage = Callable[[str, str, str, List[Block]], None]
+
+
+class RateLimitedError(Exception):
+    """Raised by a poster when Slack answers 429; ``retry_after`` is in seconds."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a workspace cannot be finished within the run's time budget."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``burst`` at once."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Take one token, waiting if needed; False if that would pass ``deadline``."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait_for = max(0.0, (1 - self._tokens) / self.rate)
+            if deadline is not None and now + wait_for > deadline:
+                return False
+            # Reserve the token now so concurrent callers queue up behind it
+            self._tokens -= 1
+        if wait_for:
+            self._sleep(wait_for)
+        return True
+
+
+@dataclass(frozen=True)
+class WorkspaceDigest:
+    workspace_id: str
+    since: datetime
+    until: datetime
+    summary: Dict[str, Any]
+    top_reports: List[Report]
+    top_reporters: List[Any]
+
+
+@dataclass
+class DigestRunResult:
+    posted: List[str] = field(default_factory=list)
+    # Workspaces with nothing new this period
+    empty: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    # Not posted: not started, or stopped short of posting, within the time budget
+    skipped: List[str] = field(default_factory=list)
+    # Mid-post when the time budget ran out; these digests may still arrive
+    in_flight: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class _PostGate:
+    """Lets a run stop its workers from posting once its time budget is spent.
+
+    Workers post inside posting(), which refuses to start after stop(); the
+    gate remembers who is posting and who has posted, so a run can tell
+    which of its unfinished workspaces were really held back.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._posting: Set[str] = set()
+        self._posted: Set[str] = set()
+
+    @contextmanager
+    def posting(self, workspace_id: str) -> Iterator[None]:
+        with self._lock:
+            if self._stopped:
+                raise DeadlineExceededError(workspace_id)
+            self._posting.add(workspace_id)
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self._posting.discard(workspace_id)
+            raise
+        with self._lock:
+            self._posting.discard(workspace_id)
+            self._posted.add(workspace_id)
+
+    def stop(self) -> Tuple[Set[str], Set[str]]:
+        """Refuse any further post; returns the workspaces posting and posted so far."""
+        with self._lock:
+            self._stopped = True
+            return set(self._posting), set(self._posted)
+
+
+def build_workspace_digest(
+    service: ReportService,
+    workspace_id: str,
+    until: datetime,
+    top_reports: int = DEFAULT_TOP_REPORTS,
+    top_reporters: int = DEFAULT_TOP_REPORTERS,
+) -> WorkspaceDigest:
+    since = until - DIGEST_PERIOD
+    summary = service.get_workspace_summary(workspace_id, since=since)
+    if not summary["total_reports"]:
+        return WorkspaceDigest(workspace_id, since, until, summary, [], [])
+    page = service.get_workspace_reports_page(workspace_id, limit=top_reports, since=since)
+    statistics = service.get_reporter_statistics(workspace_id, top_k=top_reporters, since=since)
+    return WorkspaceDigest(
+        workspace_id, since, until, summary, page.reports, statistics.top_reporters
+    )
+
+
+def _excerpt(text: str) -> str:
+    return text if len(text) <= EXCERPT_LENGTH else text[:EXCERPT_LENGTH - 1] + "…"
+
+
+def build_digest_blocks(digest: WorkspaceDigest) -> List[Block]:
+    summary = digest.summary
+    period = f"{digest.since.strftime('%b %d')} – {digest.until.strftime('%b %d')}"
+    blocks = [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "🗓️ Weekly Decision Digest"}
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": (
+                    f"*{period}:* {summary['total_reports']} new reports\n"
+                    f"• Lacked authority/information: {summary['lacked_authority_count']}\n"
+                    f"• Expected initiative: {summary['expected_initiative_count']}"
+                )
+            }
+        }
+    ]
+    if digest.top_reporters:
+        leaders = ", ".join(f"<@{user_id}> ({count})" for user_id, count in digest.top_reporters)
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": f"Most active reporters: {leaders}"}]
+        })
+    if digest.top_reports:
+        blocks.append({"type": "divider"})
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "*Latest reports this week:*"}
+        })
+        for report in digest.top_reports:
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"{REPORT_TYPE_TEXT[report.report_type]} · <@{report.user_id}> · "
+                        f"{report.timestamp.strftime('%a %H:%M UTC')}\n"
+                        f"_{_excerpt(report.description)}_"
+                    )
+                }
+            })
+    blocks.append({
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": "Use `/decidely-list 7d` for the full list."}]
+    })
+    return blocks
+
+
+class DigestJob:
+    """Posts each workspace's weekly digest to its configured channel.
+
+    ``channels`` maps workspace ids to the channel their digest goes to and
+    ``post`` sends one message (see slack_poster). Workspaces are digested on
+    a pool of ``max_workers`` threads, posts share one token bucket, and no
+    workspace is started, posted or retried once ``time_budget`` seconds have
+    passed. Workspaces with no new reports are not posted to.
+    """
+
+    def __init__(
+        self,
+        service: ReportService,
+        channels: Mapping[str, str],
+        post: PostMessage,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        posts_per_second: float = DEFAULT_POSTS_PER_SECOND,
+        time_budget: float = DEFAULT_TIME_BUDGET_SECONDS,
+        top_reports: int = DEFAULT_TOP_REPORTS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._service = service
+        self._channels = channels
+        self._post = post
+        self._max_workers = max_workers
+        self._time_budget = time_budget
+        self._top_reports = top_reports
+        self._clock = clock
+        self._sleep = sleep
+        self._bucket = TokenBucket(posts_per_second, burst=max_workers, clock=clock, sleep=sleep)
+
+    def _post_with_retry(
+        self,
+        workspace_id: str,
+        channel: str,
+        text: str,
+        blocks: List[Block],
+        deadline: float,
+        gate: _PostGate,
+    ) -> None:
+        while True:
+            if not self._bucket.acquire(deadline):
+                raise DeadlineExceededError(workspace_id)
+            try:
+                with gate.posting(workspace_id):
+                    self._post(workspace_id, channel, text, blocks)
+                return
+            except RateLimitedError as error:
+                if self._clock() + error.retry_after > deadline:
+                    raise DeadlineExceededError(workspace_id) from error
+                logger.info("Digest for %s rate limited; retrying in %ss", workspace_id, error.retry_after)
+                self._sleep(error.retry_after)
+
+    def _run_workspace(
+        self, workspace_id: str, now: datetime, deadline: float, gate: _PostGate
+    ) -> bool:
+        """Build and post one digest; False if there was nothing to post."""
+        if self._clock() >= deadline:
+            raise DeadlineExceededError(workspace_id)
+        digest = build_workspace_digest(
+            self._service, workspace_id, now, top_reports=self._top_reports
+        )
+        if not digest.summary["total_reports"]:
+            return False
+        self._post_with_retry(
+            workspace_id,
+            self._channels[workspace_id],
+            f"🗓️ Weekly Decision Digest - {digest.summary['total_reports']} new reports",
+            build_digest_blocks(digest),
+            deadline,
+            gate
+        )
+        return True
+
+    def run(self, now: Optional[datetime] = None) -> DigestRunResult:
+        """Digest the week up to ``now`` for every configured workspace."""
+        now = now or datetime.now(UTC)
+        started = self._clock()
+        deadline = started + self._time_budget
+        result = DigestRunResult()
+        gate = _PostGate()
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="decidely-digest"
+        )
+        try:
+            futures = {
+                executor.submit(self._run_workspace, workspace_id, now, deadline, gate): workspace_id
+                for workspace_id in self._channels
+            }
+            done, not_done = wait(futures, timeout=max(0.0, deadline - self._clock()))
+            # Workers still building a digest will not post it now; only the
+            # ones already inside a post may yet finish it
+            posting, posted = gate.stop()
+            for future in done:
+                workspace_id = futures[future]
+                try:
+                    (result.posted if future.result() else result.empty).append(workspace_id)
+                except DeadlineExceededError:
+                    result.skipped.append(workspace_id)
+                except Exception as error:
+                    logger.exception("Digest for %s failed", workspace_id)
+                    result.failed[workspace_id] = str(error)
+            for future in not_done:
+                workspace_id = futures[future]
+                if workspace_id in posted:
+                    result.posted.append(workspace_id)
+                elif workspace_id in posting:
+                    result.in_flight.append(workspace_id)
+                else:
+                    result.skipped.append(workspace_id)
+        finally:
+            # Queued workspaces are dropped; posts in flight finish in the background
+            gate.stop()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        result.elapsed = self._clock() - started
+        logger.info(
+            "Digest run: %d posted, %d empty, %d failed, %d skipped, %d in flight in %.1fs",
+            len(result.posted), len(result.empty), len(result.failed),
+            len(result.skipped), len(result.in_flight), result.elapsed
+        )
+        return result
+
+
+def slack_poster(client_for: Callable[[str], WebClient]) -> PostMessage:
+    """A PostMessage that calls chat.postMessage with each workspace's client."""
+
+    def post(workspace_id: str, channel: str, text: str, blocks: List[Block]) -> None:
+        try:
+            client_for(workspace_id).chat_postMessage(channel=channel, text=text, blocks=blocks)
+        except SlackApiError as error:
+            if error.response.status_code == 429:
+                raise RateLimitedError(
+                    float(error.response.headers.get("Retry-After", 1))
+                ) from error
+            raise
+
+    return post
+
+
+def next_weekly_run(now: datetime, weekday: int, hour: int) -> datetime:
+    """The first ``weekday`` (Monday is 0) at ``hour``:00 UTC strictly after ``now``."""
+    now = now.astimezone(UTC)
+    candidate = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    candidate += timedelta(days=(weekday - now.weekday()) % 7)
+    return candidate if candidate > now else candidate + timedelta(weeks=1)
+
+
+class DigestScheduler:
+    """Runs a DigestJob every week on a daemon thread until stopped."""
+
+    def __init__(self, job: DigestJob, weekday: int = 0, hour: int = 9):
+        if not 0 <= weekday <= 6 or not 0 <= hour <= 23:
+            raise ValueError("weekday must be 0-6 and hour 0-23")
+        self._job = job
+        self._weekday = weekday
+        self._hour = hour
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._loop, name="decidely-digest-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            run_at = next_weekly_run(datetime.now(UTC), self._weekday, self._hour)
+            if self._stopped.wait((run_at - datetime.now(UTC)).total_seconds()):
+                return
+            try:
+                self._job.run(now=run_at)
+            except Exception:
+                logger.exception("Digest run failed")
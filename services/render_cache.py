@@ -0,0 +1,52 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class RenderCache:
+    """Thread-safe, bounded LRU of rendered report text.
+
+    Keys are (report id, locale). Saved reports are never edited through the
+    service, so an entry stays valid until it is evicted.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def put(self, key: Hashable, text: str) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+            self.misses += 1
+        # Rendering is pure, so a concurrent miss on the same key is harmless
+        text = render()
+        self.put(key, text)
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
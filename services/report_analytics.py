@@ -0,0 +1,210 @@
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.report import Report, ReportType
+from repositories.report_repository import ReportRepository
+
+GRANULARITIES = ("day", "week", "month")
+# Whole buckets a histogram reaches back when no start is given; the current,
+# partial bucket comes on top of them
+DEFAULT_PERIODS = {"day": 30, "week": 52, "month": 12}
+DEFAULT_MAX_WORKSPACES = 128
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_SECOND = timedelta(seconds=1)
+# All analytics need from a report; SQLite can project just these
+_COLUMNS = ("report_type", "timestamp")
+
+
+def epoch_seconds(timestamp: datetime) -> int:
+    """Seconds since the epoch; naive timestamps are taken to be UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return (timestamp - EPOCH) // _SECOND
+
+
+def bucket_boundaries(granularity: str, since: datetime, until: datetime) -> List[datetime]:
+    """Bucket edges in UTC covering [since, until): calendar days, Monday weeks or months.
+
+    The first edge is ``since`` rounded down to its bucket; the last is the
+    first edge at or after ``until``, so the final bucket may be partial.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity!r}")
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=UTC)
+    edge = since.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        edge -= timedelta(days=edge.weekday())
+    elif granularity == "month":
+        edge = edge.replace(day=1)
+
+    edges = [edge]
+    while edge < until:
+        if granularity == "month":
+            edge = edge.replace(year=edge.year + edge.month // 12, month=edge.month % 12 + 1)
+        else:
+            edge += timedelta(days=7 if granularity == "week" else 1)
+        edges.append(edge)
+    return edges
+
+
+def buckets_before(granularity: str, edge: datetime, count: int) -> datetime:
+    """The bucket edge ``count`` buckets before ``edge``, itself a bucket edge."""
+    if granularity == "month":
+        year, month = divmod(edge.year * 12 + edge.month - 1 - count, 12)
+        return edge.replace(year=year, month=month + 1)
+    return edge - timedelta(days=count * (7 if granularity == "week" else 1))
+
+
+def _is_sorted(column: array) -> bool:
+    return all(a <= b for a, b in zip(column, islice(column, 1, None)))
+
+
+class ReportColumns:
+    """One workspace's report timestamps as sorted epoch-second arrays, one per type.
+
+    Counting the reports in any time range is then two binary searches, so a
+    histogram costs O(buckets × log n) however many reports there are.
+    """
+
+    __slots__ = ("timestamps",)
+
+    def __init__(self, timestamps: Dict[ReportType, array]):
+        self.timestamps = timestamps
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[Report]) -> "ReportColumns":
+        timestamps = {report_type: array("q") for report_type in ReportType}
+        for report in reports:
+            timestamps[report.report_type].append(epoch_seconds(report.timestamp))
+        # Stores stream oldest first, but mixed UTC offsets can still reorder
+        # the normalized values; bisecting needs them sorted.
+        for report_type, column in timestamps.items():
+            if not _is_sorted(column):
+                timestamps[report_type] = array("q", sorted(column))
+        return cls(timestamps)
+
+    def __len__(self) -> int:
+        return sum(len(column) for column in self.timestamps.values())
+
+    def counts(self, boundaries: List[datetime]) -> Dict[ReportType, List[int]]:
+        """Reports of each type between consecutive boundaries."""
+        edges = [epoch_seconds(boundary) for boundary in boundaries]
+        counts = {}
+        for report_type, column in self.timestamps.items():
+            positions = [bisect_left(column, edge) for edge in edges]
+            counts[report_type] = [end - start for start, end in zip(positions, positions[1:])]
+        return counts
+
+
+@dataclass(frozen=True)
+class Histogram:
+    granularity: str
+    starts: List[datetime]
+    counts: Dict[ReportType, List[int]]
+
+    @property
+    def totals(self) -> List[int]:
+        return [sum(bucket) for bucket in zip(*self.counts.values())]
+
+    def total(self, report_type: Optional[ReportType] = None) -> int:
+        return sum(self.totals if report_type is None else self.counts[report_type])
+
+    def ratios(self, report_type: ReportType) -> List[Optional[float]]:
+        """Share of each bucket's reports that are ``report_type``; None for empty buckets."""
+        return [
+            count / total if total else None
+            for count, total in zip(self.counts[report_type], self.totals)
+        ]
+
+    def moving_average(
+        self, window: int, report_type: Optional[ReportType] = None
+    ) -> List[float]:
+        """Trailing mean over ``window`` buckets (fewer at the start)."""
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        values = self.totals if report_type is None else self.counts[report_type]
+        averages, running = [], 0
+        for i, value in enumerate(values):
+            running += value
+            if i >= window:
+                running -= values[i - window]
+            averages.append(running / min(i + 1, window))
+        return averages
+
+
+class ReportAnalytics:
+    """Time-bucketed report trends per workspace.
+
+    A workspace's timestamps are loaded once into ReportColumns and reused
+    until its report count changes, i.e. until the next report arrives. At
+    most ``max_workspaces`` workspaces are kept, least recently used first out.
+    """
+
+    def __init__(
+        self, repository: ReportRepository, max_workspaces: int = DEFAULT_MAX_WORKSPACES
+    ):
+        self._repository = repository
+        self._max_workspaces = max_workspaces
+        self._cache: "OrderedDict[str, Tuple[int, ReportColumns]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, workspace_id: str) -> ReportColumns:
+        iter_views = getattr(self._repository, "iter_views_by_workspace", None)
+        if iter_views is not None:
+            return ReportColumns.from_reports(iter_views(workspace_id, columns=_COLUMNS))
+        return ReportColumns.from_reports(self._repository.iter_by_workspace(workspace_id))
+
+    def columns(self, workspace_id: str) -> ReportColumns:
+        # Report counts are cheap to read and only grow, so they version the cache
+        version = sum(self._repository.count_by_type(workspace_id).values())
+        with self._lock:
+            cached = self._cache.get(workspace_id)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(workspace_id)
+                return cached[1]
+
+        columns = self._load(workspace_id)
+        with self._lock:
+            self._cache[workspace_id] = (version, columns)
+            self._cache.move_to_end(workspace_id)
+            while len(self._cache) > self._max_workspaces:
+                self._cache.popitem(last=False)
+        return columns
+
+    def invalidate(self, workspace_id: str) -> None:
+        with self._lock:
+            self._cache.pop(workspace_id, None)
+
+    def histogram(
+        self,
+        workspace_id: str,
+        granularity: str = "week",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Histogram:
+        """Report counts per type in each bucket.
+
+        Without ``since``, the histogram covers the last DEFAULT_PERIODS whole
+        buckets plus the current, partial one.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity!r}")
+        until = until or datetime.now(UTC)
+        if since is None:
+            current = bucket_boundaries(granularity, until, until)[0]
+            since = buckets_before(granularity, current, DEFAULT_PERIODS[granularity])
+        boundaries = bucket_boundaries(granularity, since, until)
+        return Histogram(
+            granularity=granularity,
+            starts=boundaries[:-1],
+            counts=self.columns(workspace_id).counts(boundaries)
+        )
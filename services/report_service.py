@@ -1,11 +1,56 @@
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Iterable, List, Dict, Any, Optional
 from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
 from repositories.report_repository import ReportRepository
+from repositories.text_search import DEFAULT_SEARCH_LIMIT
+from services.render_cache import DEFAULT_MAX_ENTRIES as DEFAULT_RENDER_CACHE_SIZE, RenderCache
+from services.report_statistics import (
+    DEFAULT_APPROXIMATE_THRESHOLD,
+    DEFAULT_TOP_K,
+    ReporterStatistics,
+    compute_reporter_statistics,
+    in_window,
+)
+
+DEFAULT_PAGE_SIZE = 10
+
+REPORT_TYPE_TEXT: Dict[ReportType, str] = {
+    ReportType.LACKED_AUTHORITY: "🔒 *Lacked Authority*",
+    ReportType.EXPECTED_INITIATIVE: "💡 *Expected Initiative*"
+}
+
+
+def render_report_text(report: Report, locale: Optional[str] = None) -> str:
+    """Section text for one report. Every locale currently gets the English labels."""
+    return (
+        f"{REPORT_TYPE_TEXT[report.report_type]}\n"
+        f"Reported by <@{report.user_id}> on "
+        f"{report.timestamp.strftime('%Y-%m-%d at %H:%M UTC')}\n"
+        f"_{report.description}_"
+    )
+
+
+def build_workspace_summary(
+    workspace_id: str, counts: Dict[ReportType, int]
+) -> Dict[str, Any]:
+    return {
+        "workspace_id": workspace_id,
+        "total_reports": sum(counts.values()),
+        "lacked_authority_count": counts.get(ReportType.LACKED_AUTHORITY, 0),
+        "expected_initiative_count": counts.get(ReportType.EXPECTED_INITIATIVE, 0)
+    }
 
 
 class ReportService:
-    def __init__(self, repository: ReportRepository):
+    def __init__(
+        self,
+        repository: ReportRepository,
+        render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE,
+    ):
+        """``render_cache_size`` bounds how many rendered reports are kept; 0 disables it."""
         self._repository = repository
+        self._render_cache = RenderCache(render_cache_size)
     
     def create_report(
         self,
@@ -20,56 +65,101 @@ class ReportService:
             report_type=report_type,
             description=description
         )
-        return self._repository.save(report)
+        saved = self._repository.save(report)
+        self._render_cache.put((report.id, None), render_report_text(report))
+        return saved
     
-    def get_workspace_reports(self, workspace_id: str) -> List[Report]:
-        return self._repository.find_by_workspace(workspace_id)
+    def create_reports(self, reports: Iterable[Report]) -> List[Report]:
+        """Persist already-built reports in bulk, e.g. for backfills and imports."""
+        return self._repository.save_many(reports)
     
-    def get_user_reports(self, user_id: str) -> List[Report]:
-        return self._repository.find_by_user(user_id)
+    def get_workspace_reports(
+        self,
+        workspace_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._repository.find_by_workspace(workspace_id, since, until)
     
-    def get_workspace_summary(self, workspace_id: str) -> Dict[str, Any]:
-        reports = self._repository.find_by_workspace(workspace_id)
-        
-        lacked_authority_count = sum(
-            1 for r in reports 
-            if r.report_type == ReportType.LACKED_AUTHORITY
-        )
-        expected_initiative_count = sum(
-            1 for r in reports 
-            if r.report_type == ReportType.EXPECTED_INITIATIVE
+    def get_workspace_reports_page(
+        self,
+        workspace_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: Optional[ReportCursor] = None,
+        after: Optional[ReportCursor] = None,
+        since: Optional[datetime] = None,
+    ) -> ReportPage:
+        return self._repository.find_page_by_workspace(
+            workspace_id, limit, before=before, after=after, since=since
         )
+    
+    def get_user_reports(
+        self,
+        user_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Report]:
+        return self._repository.find_by_user(user_id, since, until)
+    
+    def search_reports(
+        self,
+        workspace_id: str,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Report]:
+        return self._repository.search(workspace_id, query, limit, offset)
+    
+    def get_workspace_summary(
+        self, workspace_id: str, since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        counts = self._repository.count_by_type(workspace_id, since)
+        return build_workspace_summary(workspace_id, counts)
+    
+    def get_reporter_statistics(
+        self,
+        workspace_id: str,
+        top_k: int = DEFAULT_TOP_K,
+        since: Optional[datetime] = None,
+        approximate: Optional[bool] = None,
+    ) -> ReporterStatistics:
+        """Top reporters and a weekday × hour heatmap from one streaming pass.
         
-        return {
-            "workspace_id": workspace_id,
-            "total_reports": len(reports),
-            "lacked_authority_count": lacked_authority_count,
-            "expected_initiative_count": expected_initiative_count
-        }
+        With ``approximate=None`` workspaces above DEFAULT_APPROXIMATE_THRESHOLD
+        reports are counted with a count-min sketch.
+        """
+        if approximate is None:
+            total = sum(self._repository.count_by_type(workspace_id, since).values())
+            approximate = total > DEFAULT_APPROXIMATE_THRESHOLD
+        # SQLite can read just the two columns needed
+        iter_views = getattr(self._repository, "iter_views_by_workspace", None)
+        if iter_views is not None:
+            reports = iter_views(workspace_id, columns=("user_id", "timestamp"), since=since)
+        else:
+            reports = in_window(self._repository.iter_by_workspace(workspace_id), since)
+        return compute_reporter_statistics(reports, top_k, approximate)
     
-    def format_reports_for_slack(self, reports: List[Report]) -> List[Dict[str, Any]]:
+    def format_reports_for_slack(
+        self, reports: List[Report], locale: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         blocks = []
         
         for i, report in enumerate(reports):
             if i > 0:
                 blocks.append({"type": "divider"})
             
-            report_type_text = {
-                ReportType.LACKED_AUTHORITY: "🔒 *Lacked Authority*",
-                ReportType.EXPECTED_INITIATIVE: "💡 *Expected Initiative*"
-            }
+            # Projections without an id cannot be keyed, so they are rendered each time
+            report_id = getattr(report, "id", None)
+            if report_id is None:
+                text = render_report_text(report, locale)
+            else:
+                text = self._render_cache.get_or_render(
+                    (report_id, locale), lambda: render_report_text(report, locale)
+                )
             
             blocks.append({
                 "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f"{report_type_text[report.report_type]}\n"
-                        f"Reported by <@{report.user_id}> on "
-                        f"{report.timestamp.strftime('%Y-%m-%d at %H:%M UTC')}\n"
-                        f"_{report.description}_"
-                    )
-                }
+                "text": {"type": "mrkdwn", "text": text}
             })
         
-        return blocks
\ No newline at end of file
+        return blocks
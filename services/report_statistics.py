@@ -0,0 +1,163 @@
+import heapq
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.report import Report
+
+DEFAULT_TOP_K = 5
+# Workspaces with more reports than this are counted approximately by default
+DEFAULT_APPROXIMATE_THRESHOLD = 100_000
+DEFAULT_SKETCH_WIDTH = 2048
+DEFAULT_SKETCH_DEPTH = 4
+
+DAYS_PER_WEEK = 7
+HOURS_PER_DAY = 24
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finalizer: spreads every input bit over the whole word."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimates for a stream of strings.
+
+    Estimates never undercount; with ``width`` w they overcount by at most
+    2·n/w with high probability, using ``depth`` × ``width`` counters however
+    many distinct items there are.
+    """
+
+    def __init__(self, width: int = DEFAULT_SKETCH_WIDTH, depth: int = DEFAULT_SKETCH_DEPTH):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1")
+        self.width = width
+        self.depth = depth
+        self._rows = [array("q", bytes(8 * width)) for _ in range(depth)]
+        self._seeds = [(i + 1) * 0x9E3779B97F4A7C15 & _MASK_64 for i in range(depth)]
+
+    def _slots(self, item: str) -> Iterable[Tuple[array, int]]:
+        # Each row mixes the string hash with its own seed, so two items that
+        # share a slot in one row are no more likely to share one in the next
+        digest = hash(item) & _MASK_64
+        for seed, row in zip(self._seeds, self._rows):
+            yield row, _mix(digest ^ seed) % self.width
+
+    def add(self, item: str, count: int = 1) -> int:
+        """Count ``item`` and return its new estimate."""
+        estimate = None
+        for row, slot in self._slots(item):
+            row[slot] += count
+            estimate = row[slot] if estimate is None else min(estimate, row[slot])
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        return min(row[slot] for row, slot in self._slots(item))
+
+
+class _TopK:
+    """The k items with the highest running estimates, via a lazily pruned min-heap."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._best: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def _floor(self) -> Tuple[int, str]:
+        # Drop heap entries that were superseded by a later estimate
+        while self._heap[0][0] != self._best.get(self._heap[0][1]):
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def offer(self, item: str, estimate: int) -> None:
+        if item not in self._best and len(self._best) >= self.k:
+            floor, weakest = self._floor()
+            if estimate <= floor:
+                return
+            del self._best[weakest]
+            heapq.heappop(self._heap)
+        self._best[item] = estimate
+        heapq.heappush(self._heap, (estimate, item))
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(count, item) for item, count in self._best.items()]
+            heapq.heapify(self._heap)
+
+    def items(self) -> List[Tuple[str, int]]:
+        return sorted(self._best.items(), key=lambda pair: (-pair[1], pair[0]))
+
+
+@dataclass(frozen=True)
+class ReporterStatistics:
+    total_reports: int
+    # (user id, report count), most reports first
+    top_reporters: List[Tuple[str, int]]
+    # heatmap[weekday][hour] in UTC, Monday first
+    heatmap: List[List[int]]
+    approximate: bool = False
+
+    def busiest_slot(self) -> Optional[Tuple[int, int, int]]:
+        """(weekday, hour, count) of the fullest heatmap cell, or None if empty."""
+        count, weekday, hour = max(
+            (count, weekday, hour)
+            for weekday, row in enumerate(self.heatmap)
+            for hour, count in enumerate(row)
+        )
+        return (weekday, hour, count) if count else None
+
+
+def compute_reporter_statistics(
+    reports: Iterable[Report],
+    top_k: int = DEFAULT_TOP_K,
+    approximate: bool = False,
+    sketch: Optional[CountMinSketch] = None,
+) -> ReporterStatistics:
+    """Top reporters and a weekday × hour heatmap in one pass over ``reports``.
+
+    Exact mode keeps one counter per distinct reporter. Approximate mode keeps
+    only a count-min sketch and the k best candidates, so memory stays fixed.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+    heatmap = [array("q", bytes(8 * HOURS_PER_DAY)) for _ in range(DAYS_PER_WEEK)]
+    exact: Counter = Counter()
+    sketch = sketch or (CountMinSketch() if approximate else None)
+    leaders = _TopK(top_k)
+    total = 0
+
+    for report in reports:
+        total += 1
+        timestamp = report.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(UTC)
+        heatmap[timestamp.weekday()][timestamp.hour] += 1
+        if approximate:
+            leaders.offer(report.user_id, sketch.add(report.user_id))
+        else:
+            exact[report.user_id] += 1
+
+    if approximate:
+        top_reporters = leaders.items()
+    else:
+        top_reporters = heapq.nsmallest(top_k, exact.items(), key=lambda pair: (-pair[1], pair[0]))
+    return ReporterStatistics(
+        total_reports=total,
+        top_reporters=top_reporters,
+        heatmap=[list(row) for row in heatmap],
+        approximate=approximate
+    )
+
+
+def in_window(reports: Iterable[Report], since: Optional[datetime]) -> Iterable[Report]:
+    """Reports at or after ``since``; naive timestamps compare as UTC."""
+    if since is None:
+        return reports
+    since = since if since.tzinfo else since.replace(tzinfo=UTC)
+    return (
+        report for report in reports
+        if (report.timestamp if report.timestamp.tzinfo else report.timestamp.replace(tzinfo=UTC)) >= since
+    )
@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, UTC
+from uuid import uuid4
+from models.report import Report, ReportType
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def make_report(
+    i=0,
+    workspace_id="W123456",
+    user_id="U123456",
+    report_type=ReportType.LACKED_AUTHORITY,
+    description=None,
+    timestamp=None,
+):
+    """Report number ``i``: described as "Report i" and filed ``i`` minutes after START unless given."""
+    return Report(
+        id=uuid4(),
+        user_id=user_id,
+        workspace_id=workspace_id,
+        report_type=report_type,
+        description=f"Report {i}" if description is None else description,
+        timestamp=START + timedelta(minutes=i) if timestamp is None else timestamp
+    )
@@ -0,0 +1,177 @@
+from datetime import datetime, UTC
+from uuid import uuid4
+from unittest.mock import Mock, patch
+
+from models.pagination import ReportCursor, ReportPage
+from models.report import Report, ReportType
+from listeners.actions.decidely_list_pagination import decidely_list_page_callback
+from listeners.commands.decidely_list import (
+    NEWER_ACTION_ID,
+    OLDER_ACTION_ID,
+    PAGE_SIZE,
+    build_report_list_blocks,
+)
+from tests.factories import make_report
+
+SUMMARY = {
+    "workspace_id": "T123456",
+    "total_reports": 30,
+    "lacked_authority_count": 20,
+    "expected_initiative_count": 10
+}
+
+
+class TestDecidelyListPagination:
+    def setup_method(self):
+        self.cursor = ReportCursor(timestamp=datetime(2024, 1, 1, tzinfo=UTC), id=uuid4())
+        self.fake_ack = Mock()
+        self.fake_respond = Mock()
+
+    def _body(self, action_id):
+        return {
+            "team": {"id": "T123456"},
+            "user": {"id": "U123456"},
+            "actions": [{"action_id": action_id, "value": self.cursor.encode()}]
+        }
+
+    def test_older_button_pages_before_cursor(self):
+        with patch('listeners.actions.decidely_list_pagination.report_service') as mock_service:
+            mock_service.get_workspace_reports_page.return_value = ReportPage()
+            mock_service.get_workspace_summary.return_value = SUMMARY
+
+            decidely_list_page_callback(
+                ack=self.fake_ack,
+                body=self._body(OLDER_ACTION_ID),
+                respond=self.fake_respond
+            )
+
+            self.fake_ack.assert_called_once()
+            mock_service.get_workspace_reports_page.assert_called_once_with(
+                "T123456", limit=PAGE_SIZE, before=self.cursor, since=None
+            )
+            assert self.fake_respond.call_args.kwargs["replace_original"] is True
+
+    def test_newer_button_pages_after_cursor(self):
+        with patch('listeners.actions.decidely_list_pagination.report_service') as mock_service:
+            mock_service.get_workspace_reports_page.return_value = ReportPage()
+            mock_service.get_workspace_summary.return_value = SUMMARY
+
+            decidely_list_page_callback(
+                ack=self.fake_ack,
+                body=self._body(NEWER_ACTION_ID),
+                respond=self.fake_respond
+            )
+
+            mock_service.get_workspace_reports_page.assert_called_once_with(
+                "T123456", limit=PAGE_SIZE, after=self.cursor, since=None
+            )
+
+    def _long_page(self, has_newer):
+        # Newest first, as pages are
+        reports = [
+            make_report(-i, workspace_id="T123456", description=f"Long report {i} " + "z" * 2500)
+            for i in range(PAGE_SIZE)
+        ]
+        return reports, ReportPage.from_reports(reports, has_newer=has_newer, has_older=True)
+
+    def _page_after_click(self, action_id, page):
+        with patch('listeners.actions.decidely_list_pagination.report_service') as mock_service:
+            mock_service.get_workspace_reports_page.return_value = page
+            mock_service.get_workspace_summary.return_value = SUMMARY
+
+            decidely_list_page_callback(
+                ack=self.fake_ack,
+                body=self._body(action_id),
+                respond=self.fake_respond
+            )
+
+        blocks = self.fake_respond.call_args.kwargs["blocks"]
+        shown = [block for block in blocks[3:] if block["type"] == "section"]
+        buttons = {e["action_id"]: ReportCursor.decode(e["value"]) for e in blocks[-1]["elements"]}
+        assert blocks[-2]["type"] != "divider"
+        return shown, buttons
+
+    def test_older_cursor_follows_last_report_that_fit(self):
+        reports, page = self._long_page(has_newer=True)
+
+        shown, buttons = self._page_after_click(OLDER_ACTION_ID, page)
+
+        assert 0 < len(shown) < PAGE_SIZE
+        assert "Long report 0 " in shown[0]["text"]["text"]
+        assert buttons[OLDER_ACTION_ID] == ReportCursor.from_report(reports[len(shown) - 1])
+        assert buttons[NEWER_ACTION_ID] == ReportCursor.from_report(reports[0])
+
+    def test_newer_page_keeps_reports_next_to_cursor(self):
+        reports, page = self._long_page(has_newer=False)
+
+        shown, buttons = self._page_after_click(NEWER_ACTION_ID, page)
+
+        assert 0 < len(shown) < PAGE_SIZE
+        assert f"Long report {PAGE_SIZE - 1} " in shown[-1]["text"]["text"]
+        assert buttons[NEWER_ACTION_ID] == ReportCursor.from_report(reports[PAGE_SIZE - len(shown)])
+        assert buttons[OLDER_ACTION_ID] == ReportCursor.from_report(reports[-1])
+
+    def test_blocks_include_navigation_buttons(self):
+        report = Report(
+            user_id="U123456",
+            workspace_id="T123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Paged report"
+        )
+        page = ReportPage.from_reports([report], has_newer=True, has_older=True)
+
+        blocks = build_report_list_blocks(SUMMARY, page)
+
+        actions = blocks[-1]
+        assert actions["type"] == "actions"
+        assert [e["action_id"] for e in actions["elements"]] == [NEWER_ACTION_ID, OLDER_ACTION_ID]
+        assert ReportCursor.decode(actions["elements"][1]["value"]) == ReportCursor.from_report(report)
+
+    def test_single_page_has_no_navigation(self):
+        blocks = build_report_list_blocks(SUMMARY, ReportPage())
+
+        assert all(block["type"] != "actions" for block in blocks)
+
+    def test_window_is_carried_through_buttons(self):
+        report = Report(
+            user_id="U123456",
+            workspace_id="T123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Paged report"
+        )
+        page = ReportPage.from_reports([report], has_newer=False, has_older=True)
+        value = build_report_list_blocks(SUMMARY, page, "2w")[-1]["elements"][0]["value"]
+
+        with patch('listeners.actions.decidely_list_pagination.report_service') as mock_service:
+            mock_service.get_workspace_reports_page.return_value = ReportPage()
+            mock_service.get_workspace_summary.return_value = SUMMARY
+
+            decidely_list_page_callback(
+                ack=self.fake_ack,
+                body={
+                    "team": {"id": "T123456"},
+                    "actions": [{"action_id": OLDER_ACTION_ID, "value": value}]
+                },
+                respond=self.fake_respond
+            )
+
+            kwargs = mock_service.get_workspace_reports_page.call_args.kwargs
+            assert kwargs["before"] == ReportCursor.from_report(report)
+            assert kwargs["since"] is not None
+
+    def test_invalid_window_in_button_shows_usage(self):
+        from listeners.commands.decidely_list import USAGE_TEXT
+
+        with patch('listeners.actions.decidely_list_pagination.report_service') as mock_service:
+            decidely_list_page_callback(
+                ack=self.fake_ack,
+                body={
+                    "team": {"id": "T123456"},
+                    "actions": [{"action_id": OLDER_ACTION_ID, "value": f"{self.cursor.encode()}|99999w"}]
+                },
+                respond=self.fake_respond
+            )
+
+            self.fake_ack.assert_called_once()
+            mock_service.get_workspace_reports_page.assert_not_called()
+            self.fake_respond.assert_called_once_with(text=USAGE_TEXT)
@@ -3,6 +3,8 @@ from unittest.mock import Mock, MagicMock, patch
 from models.report import ReportType
 from services.report_service import ReportService
 from repositories.report_repository import InMemoryReportRepository
+from models.pagination import ReportPage
+from listeners.commands.decidely_list import PAGE_SIZE
 
 
 class TestDecidelyReportCommand:
@@ -251,7 +253,7 @@ class TestDecidelyListCommand:
         }
         
         with patch('listeners.commands.decidely_list.report_service') as mock_service:
-            mock_service.get_workspace_reports.return_value = []
+            mock_service.get_workspace_reports_page.return_value = ReportPage()
             mock_service.get_workspace_summary.return_value = {
                 "total_reports": 0,
                 "lacked_authority_count": 0,
@@ -266,7 +268,9 @@ class TestDecidelyListCommand:
             )
             
             mock_ack.assert_called_once()
-            mock_service.get_workspace_reports.assert_called_once_with("T123456")
+            mock_service.get_workspace_reports_page.assert_called_once_with(
+                "T123456", limit=PAGE_SIZE, since=None
+            )
             mock_respond.assert_called_once()
             
             blocks = mock_respond.call_args[1]["blocks"]
@@ -294,7 +298,9 @@ class TestDecidelyListCommand:
         ]
         
         with patch('listeners.commands.decidely_list.report_service') as mock_service:
-            mock_service.get_workspace_reports.return_value = mock_reports
+            mock_service.get_workspace_reports_page.return_value = ReportPage(
+                reports=mock_reports
+            )
             mock_service.get_workspace_summary.return_value = {
                 "total_reports": 1,
                 "lacked_authority_count": 1,
@@ -317,4 +323,65 @@ class TestDecidelyListCommand:
                 respond=mock_respond
             )
             
-            mock_service.format_reports_for_slack.assert_called_once_with(mock_reports)
\ No newline at end of file
+            mock_service.format_reports_for_slack.assert_called_once_with(mock_reports)
+    
+    def test_list_command_with_window_limits_queries(self):
+        from datetime import datetime, timedelta, UTC
+        from listeners.commands.decidely_list import decidely_list_callback
+        
+        mock_ack = Mock()
+        mock_respond = Mock()
+        mock_command = {"team_id": "T123456", "user_id": "U123456", "text": "14d"}
+        
+        with patch('listeners.commands.decidely_list.report_service') as mock_service:
+            mock_service.get_workspace_reports_page.return_value = ReportPage()
+            mock_service.get_workspace_summary.return_value = {
+                "total_reports": 0,
+                "lacked_authority_count": 0,
+                "expected_initiative_count": 0,
+                "workspace_id": "T123456"
+            }
+            
+            decidely_list_callback(
+                ack=mock_ack,
+                command=mock_command,
+                respond=mock_respond
+            )
+            
+            since = mock_service.get_workspace_reports_page.call_args.kwargs["since"]
+            expected = datetime.now(UTC) - timedelta(days=14)
+            assert abs(since - expected) < timedelta(minutes=1)
+            mock_service.get_workspace_summary.assert_called_once_with("T123456", since=since)
+            blocks = mock_respond.call_args[1]["blocks"]
+            assert "(last 14d)" in blocks[1]["text"]["text"]
+    
+    def test_list_command_rejects_invalid_window(self):
+        from listeners.commands.decidely_list import decidely_list_callback
+        
+        mock_respond = Mock()
+        
+        with patch('listeners.commands.decidely_list.report_service') as mock_service:
+            decidely_list_callback(
+                ack=Mock(),
+                command={"team_id": "T123456", "user_id": "U123456", "text": "forever"},
+                respond=mock_respond
+            )
+            
+            mock_service.get_workspace_reports_page.assert_not_called()
+            assert "Usage" in mock_respond.call_args[1]["text"]
+    
+    def test_list_command_rejects_oversized_window(self):
+        from listeners.commands.decidely_list import decidely_list_callback
+        
+        for text in ("99999999d", "400000w", "1000000000d", "3651d"):
+            mock_respond = Mock()
+            
+            with patch('listeners.commands.decidely_list.report_service') as mock_service:
+                decidely_list_callback(
+                    ack=Mock(),
+                    command={"team_id": "T123456", "user_id": "U123456", "text": text},
+                    respond=mock_respond
+                )
+                
+                mock_service.get_workspace_reports_page.assert_not_called()
+                assert "Usage" in mock_respond.call_args[1]["text"]
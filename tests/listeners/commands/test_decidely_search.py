@@ -0,0 +1,166 @@
+from unittest.mock import Mock, patch
+
+from models.report import ReportType
+from listeners.actions.decidely_search_pagination import decidely_search_page_callback
+from listeners.commands.decidely_search import (
+    NEXT_ACTION_ID,
+    PREVIOUS_ACTION_ID,
+    SEARCH_PAGE_SIZE,
+    decidely_search_callback,
+    decode_search_state,
+    encode_search_state,
+)
+from tests.factories import make_report
+
+
+def make_reports(count, description="Budget report {i}"):
+    return [
+        make_report(
+            i,
+            workspace_id="T123456",
+            report_type=ReportType.EXPECTED_INITIATIVE,
+            description=description.format(i=i)
+        )
+        for i in range(count)
+    ]
+
+
+class TestDecidelySearchCommand:
+    def setup_method(self):
+        self.fake_ack = Mock()
+        self.fake_respond = Mock()
+
+    def test_empty_query_shows_usage(self):
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            decidely_search_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "   "},
+                respond=self.fake_respond
+            )
+
+            self.fake_ack.assert_called_once()
+            mock_service.search_reports.assert_not_called()
+            assert "Usage" in self.fake_respond.call_args.kwargs["text"]
+
+    def test_first_page_with_more_results_has_next_button(self):
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            mock_service.search_reports.return_value = make_reports(SEARCH_PAGE_SIZE + 1)
+            mock_service.format_reports_for_slack.return_value = []
+
+            decidely_search_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "budget"},
+                respond=self.fake_respond
+            )
+
+            mock_service.search_reports.assert_called_once_with(
+                "T123456", "budget", limit=SEARCH_PAGE_SIZE + 1, offset=0
+            )
+            shown = mock_service.format_reports_for_slack.call_args.args[0]
+            assert len(shown) == SEARCH_PAGE_SIZE
+            actions = self.fake_respond.call_args.kwargs["blocks"][-1]
+            assert [e["action_id"] for e in actions["elements"]] == [NEXT_ACTION_ID]
+            assert decode_search_state(actions["elements"][0]["value"]) == {
+                "query": "budget", "offset": SEARCH_PAGE_SIZE
+            }
+
+    def test_no_results(self):
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            mock_service.search_reports.return_value = []
+
+            decidely_search_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "nothing"},
+                respond=self.fake_respond
+            )
+
+            blocks = self.fake_respond.call_args.kwargs["blocks"]
+            assert "No reports match" in blocks[-1]["text"]["text"]
+
+    def test_query_is_escaped_where_echoed(self):
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            mock_service.search_reports.return_value = make_reports(SEARCH_PAGE_SIZE + 1)
+            mock_service.format_reports_for_slack.return_value = []
+
+            decidely_search_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "<!here> R&D"},
+                respond=self.fake_respond
+            )
+
+            kwargs = self.fake_respond.call_args.kwargs
+            assert kwargs["blocks"][1]["text"]["text"] == "*Reports matching:* &lt;!here&gt; R&amp;D"
+            assert "<!here>" not in kwargs["text"]
+            # The button keeps the raw query so the next page searches the same words
+            next_button = kwargs["blocks"][-1]["elements"][-1]
+            assert decode_search_state(next_button["value"])["query"] == "<!here> R&D"
+
+    def test_next_button_loads_following_page(self):
+        body = {
+            "team": {"id": "T123456"},
+            "actions": [{
+                "action_id": NEXT_ACTION_ID,
+                "value": encode_search_state("budget", SEARCH_PAGE_SIZE)
+            }]
+        }
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            mock_service.search_reports.return_value = make_reports(3)
+            mock_service.format_reports_for_slack.return_value = []
+
+            decidely_search_page_callback(
+                ack=self.fake_ack, body=body, respond=self.fake_respond
+            )
+
+            mock_service.search_reports.assert_called_once_with(
+                "T123456", "budget", limit=SEARCH_PAGE_SIZE + 1, offset=SEARCH_PAGE_SIZE
+            )
+            assert self.fake_respond.call_args.kwargs["replace_original"] is True
+            actions = self.fake_respond.call_args.kwargs["blocks"][-1]
+            assert [e["action_id"] for e in actions["elements"]] == [PREVIOUS_ACTION_ID]
+
+    def test_next_continues_after_last_result_that_fit(self):
+        from repositories.report_repository import InMemoryReportRepository
+        from services.report_service import ReportService
+
+        reports = make_reports(SEARCH_PAGE_SIZE + 1, description="Budget {i} " + "z" * 2500)
+        body = {
+            "team": {"id": "T123456"},
+            "actions": [{"action_id": NEXT_ACTION_ID, "value": encode_search_state("budget", 20)}]
+        }
+        with patch('listeners.commands.decidely_search.report_service') as mock_service:
+            mock_service.search_reports.return_value = reports
+            mock_service.format_reports_for_slack.side_effect = (
+                ReportService(InMemoryReportRepository()).format_reports_for_slack
+            )
+
+            decidely_search_page_callback(
+                ack=self.fake_ack, body=body, respond=self.fake_respond
+            )
+
+        blocks = self.fake_respond.call_args.kwargs["blocks"]
+        shown = sum(block["type"] == "section" for block in blocks) - 1
+        assert 0 < shown < SEARCH_PAGE_SIZE
+        assert blocks[-2]["type"] != "divider"
+        next_button = blocks[-1]["elements"][-1]
+        assert next_button["action_id"] == NEXT_ACTION_ID
+        assert decode_search_state(next_button["value"])["offset"] == 20 + shown
+
+
+class TestSearchState:
+    def test_non_ascii_query_is_not_escaped(self):
+        from listeners.commands.decidely_search import fit_search_query
+
+        query = fit_search_query("プロジェクト予算 " * 60)
+
+        assert len(query) == 500
+        assert len(encode_search_state(query, SEARCH_PAGE_SIZE)) <= 2000
+        assert decode_search_state(encode_search_state(query, 10))["query"] == query
+
+    def test_escaped_query_is_trimmed_to_button_limit(self):
+        from listeners.commands.decidely_search import MAX_BUTTON_VALUE_LENGTH, fit_search_query
+
+        query = fit_search_query("budget" + "\x01" * 494)
+
+        assert query.startswith("budget")
+        assert len(encode_search_state(query, 10 ** 9)) <= MAX_BUTTON_VALUE_LENGTH
+        assert len(encode_search_state(query + "\x01", 10 ** 9)) > MAX_BUTTON_VALUE_LENGTH
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, UTC
+from unittest.mock import Mock, patch
+import pytest
+from models.report import ReportType
+from listeners.commands.decidely_stats import (
+    build_stats_blocks,
+    decidely_stats_callback,
+    parse_granularity,
+    sparkline,
+)
+from tests.factories import make_report
+
+
+def make_histogram(lacked, expected, granularity="week"):
+    from services.report_analytics import Histogram
+
+    return Histogram(
+        granularity=granularity,
+        starts=[datetime(2024, 1, 1, tzinfo=UTC) + timedelta(weeks=i) for i in range(len(lacked))],
+        counts={ReportType.LACKED_AUTHORITY: lacked, ReportType.EXPECTED_INITIATIVE: expected}
+    )
+
+
+class TestDecidelyStatsCommand:
+    def setup_method(self):
+        self.fake_ack = Mock()
+        self.fake_respond = Mock()
+
+    def test_defaults_to_weekly_histogram(self):
+        with patch('listeners.commands.decidely_stats.report_analytics') as mock_analytics, \
+                patch('listeners.commands.decidely_stats.report_service') as mock_service:
+            mock_service.get_reporter_statistics.return_value = None
+            mock_analytics.histogram.return_value = make_histogram([1, 2], [0, 1])
+
+            decidely_stats_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": ""},
+                respond=self.fake_respond
+            )
+
+            self.fake_ack.assert_called_once()
+            mock_analytics.histogram.assert_called_once_with("T123456", "week")
+            mock_service.get_reporter_statistics.assert_called_once_with(
+                "T123456", since=datetime(2024, 1, 1, tzinfo=UTC)
+            )
+            blocks = self.fake_respond.call_args.kwargs["blocks"]
+            assert blocks[0]["type"] == "header"
+            assert "Weekly reports" in blocks[1]["text"]["text"]
+
+    def test_accepts_granularity(self):
+        with patch('listeners.commands.decidely_stats.report_analytics') as mock_analytics:
+            mock_analytics.histogram.return_value = make_histogram([1], [1], "month")
+
+            decidely_stats_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "Monthly"},
+                respond=self.fake_respond
+            )
+
+            mock_analytics.histogram.assert_called_once_with("T123456", "month")
+
+    def test_invalid_granularity_shows_usage(self):
+        with patch('listeners.commands.decidely_stats.report_analytics') as mock_analytics:
+            decidely_stats_callback(
+                ack=self.fake_ack,
+                command={"team_id": "T123456", "text": "hourly"},
+                respond=self.fake_respond
+            )
+
+            mock_analytics.histogram.assert_not_called()
+            assert "Usage" in self.fake_respond.call_args.kwargs["text"]
+
+    def test_stats_use_the_shared_repository(self):
+        from listeners.commands.decidely_list import report_service
+
+        report_service.create_report("U1", "T-stats", ReportType.LACKED_AUTHORITY, "Waited for sign-off")
+
+        decidely_stats_callback(
+            ack=self.fake_ack,
+            command={"team_id": "T-stats", "text": "daily"},
+            respond=self.fake_respond
+        )
+
+        assert "1 reports" in self.fake_respond.call_args.kwargs["text"]
+        assert "<@U1>" in self.fake_respond.call_args.kwargs["blocks"][-2]["text"]["text"]
+
+
+class TestStatsBlocks:
+    def test_summarizes_counts_ratios_and_averages(self):
+        blocks = build_stats_blocks(make_histogram([0, 2, 4, 2, 2], [4, 2, 0, 2, 2]))
+
+        trend = blocks[1]["text"]["text"]
+        assert "🔒 Lacked authority: `▁▅█▅▅` 10 total" in trend
+        assert "💡 Expected initiative: `█▅▁▅▅` 10 total" in trend
+        averages, share = (field["text"] for field in blocks[2]["fields"])
+        assert "Lacked authority: 2.5" in averages
+        assert "Last 52 weeks + this week: 50%" in share
+        assert "Last 4 weeks, incl. this week: 62%" in share
+
+    @pytest.mark.parametrize("granularity", ["day", "week", "month"])
+    def test_label_matches_bucket_count(self, granularity):
+        import re
+        from repositories.report_repository import InMemoryReportRepository
+        from services.report_analytics import ReportAnalytics
+
+        repository = InMemoryReportRepository()
+        repository.save(make_report(timestamp=datetime.now(UTC)))
+        histogram = ReportAnalytics(repository).histogram("W123456", granularity)
+
+        label = build_stats_blocks(histogram)[1]["text"]["text"].splitlines()[0]
+        whole = int(re.search(r"last (\d+) \w+ \+ (today|this \w+)", label).group(1))
+        assert len(histogram.starts) == whole + 1
+        assert histogram.total() == 1
+
+    def test_empty_histogram(self):
+        blocks = build_stats_blocks(make_histogram([0, 0], [0, 0]))
+
+        assert len(blocks) == 2
+        assert "No reports" in blocks[1]["text"]["text"]
+
+    def test_reporter_section(self):
+        from services.report_statistics import ReporterStatistics
+
+        heatmap = [[0] * 24 for _ in range(7)]
+        heatmap[1][14] = 3
+        statistics = ReporterStatistics(
+            total_reports=3, top_reporters=[("U1", 2), ("U2", 1)], heatmap=heatmap, approximate=True
+        )
+
+        blocks = build_stats_blocks(make_histogram([1, 2], [0, 0]), statistics)
+
+        leaders, heat = blocks[-2]["text"]["text"], blocks[-1]["text"]["text"]
+        assert "Top reporters (approximate)" in leaders
+        assert "1. <@U1> – 2 reports" in leaders
+        assert "Tue ▁▁▁▁▁▁▁▁▁▁▁▁▁▁█▁▁▁▁▁▁▁▁▁" in heat
+        assert "Busiest: Tue 14:00–15:00 (3 reports)" in heat
+
+    def test_parse_granularity_and_sparkline(self):
+        assert parse_granularity("  DAILY ") == "day"
+        assert parse_granularity("") == "week"
+        assert sparkline([0, 0]) == "▁▁"
+        assert sparkline([1, 2], peak=4) == "▃▅"
@@ -0,0 +1,185 @@
+import pytest
+from unittest.mock import Mock, patch
+
+
+def section(text):
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+ACTIONS = {"type": "actions", "elements": [{"type": "button", "action_id": "next"}]}
+
+
+class TestBlockMessageBuilder:
+    def test_small_payload_is_one_message(self):
+        from listeners.block_messages import BlockMessageBuilder
+        
+        blocks = [section(f"Report {i}") for i in range(5)]
+        builder = BlockMessageBuilder()
+        
+        assert builder.add_all(blocks)
+        assert builder.messages() == [blocks]
+        assert not builder.truncated
+    
+    def test_splits_on_block_count(self):
+        from listeners.block_messages import BlockMessageBuilder, MAX_BLOCKS_PER_MESSAGE
+        
+        blocks = [section(f"Report {i}") for i in range(120)]
+        builder = BlockMessageBuilder(max_bytes=1_000_000)
+        builder.add_all(blocks)
+        
+        messages = builder.messages()
+        
+        assert [len(message) for message in messages] == [50, 50, 20]
+        assert all(len(message) <= MAX_BLOCKS_PER_MESSAGE for message in messages)
+        assert [block for message in messages for block in message] == blocks
+    
+    def test_splits_on_bytes_and_drops_leading_dividers(self):
+        from listeners.block_messages import BlockMessageBuilder, block_size
+        
+        blocks = []
+        for i in range(6):
+            blocks += [section("x" * 400), {"type": "divider"}]
+        builder = BlockMessageBuilder(max_bytes=1000, max_messages=10)
+        builder.add_all(blocks)
+        
+        messages = builder.messages()
+        
+        assert len(messages) > 1
+        assert all(sum(map(block_size, message)) <= 1000 for message in messages)
+        assert all(message[0]["type"] == "section" for message in messages)
+    
+    def test_stops_consuming_once_capped(self):
+        from listeners.block_messages import BlockMessageBuilder, TRUNCATED_NOTICE
+        
+        produced = []
+        
+        def blocks():
+            for i in range(1000):
+                produced.append(i)
+                yield section(f"Report {i}")
+        
+        builder = BlockMessageBuilder(footer=[ACTIONS], max_messages=2)
+        
+        assert not builder.add_all(blocks())
+        assert builder.truncated
+        assert len(produced) < 110
+        messages = builder.messages()
+        assert len(messages) == 2
+        assert messages[-1][-2:] == [TRUNCATED_NOTICE, ACTIONS]
+        assert len(messages[-1]) <= 50
+    
+    def test_clips_long_section_text(self):
+        from listeners.block_messages import BlockMessageBuilder, MAX_SECTION_TEXT_LENGTH
+        
+        builder = BlockMessageBuilder()
+        long_block = section("y" * 5000)
+        builder.add(long_block)
+        
+        text = builder.messages()[0][0]["text"]["text"]
+        
+        assert len(text) == MAX_SECTION_TEXT_LENGTH
+        assert text.endswith("…")
+        assert len(long_block["text"]["text"]) == 5000
+    
+    def test_rejects_zero_messages(self):
+        from listeners.block_messages import BlockMessageBuilder
+        
+        with pytest.raises(ValueError):
+            BlockMessageBuilder(max_messages=0)
+
+
+class TestRespondInMessages:
+    def test_sends_messages_in_order_with_buttons_last(self):
+        from listeners.block_messages import respond_in_messages
+        
+        respond = Mock()
+        blocks = [section(f"Report {i}") for i in range(70)] + [ACTIONS]
+        
+        sent = respond_in_messages(respond, "Reports", blocks, replace_original=True)
+        
+        assert sent == 2
+        first, second = respond.call_args_list
+        assert first.kwargs["text"] == "Reports"
+        assert first.kwargs["replace_original"] is True
+        assert second.kwargs["text"] == "Reports (continued)"
+        assert "replace_original" not in second.kwargs
+        assert second.kwargs["blocks"][-1] == ACTIONS
+        assert first.kwargs["blocks"] + second.kwargs["blocks"] == blocks
+    
+    def test_consumes_blocks_lazily(self):
+        from listeners.block_messages import respond_in_messages, TRUNCATED_NOTICE
+        
+        produced = []
+        
+        def blocks():
+            for i in range(1000):
+                produced.append(i)
+                yield section(f"Report {i}")
+        
+        respond = Mock()
+        sent = respond_in_messages(respond, "Reports", blocks(), max_messages=1, footer=[ACTIONS])
+        
+        assert sent == 1
+        assert len(produced) < 60
+        assert respond.call_args.kwargs["blocks"][-2:] == [TRUNCATED_NOTICE, ACTIONS]
+    
+    def test_messages_never_end_with_a_divider(self):
+        from listeners.block_messages import respond_in_messages, TRUNCATED_NOTICE
+        
+        respond = Mock()
+        blocks = []
+        for i in range(40):
+            blocks += [section(f"Report {i} " + "x" * 300), {"type": "divider"}]
+        
+        respond_in_messages(respond, "Reports", blocks[:-1], max_messages=2, max_bytes=2000)
+        
+        messages = [call.kwargs["blocks"] for call in respond.call_args_list]
+        assert len(messages) == 2
+        assert messages[-1][-1] == TRUNCATED_NOTICE
+        assert messages[0][-1]["type"] == messages[-1][-2]["type"] == "section"
+    
+    def test_list_command_splits_large_reports(self):
+        from listeners.commands.decidely_list import decidely_list_callback
+        from models.report import ReportType
+        from repositories.report_repository import InMemoryReportRepository
+        from services.report_service import ReportService
+        
+        service = ReportService(InMemoryReportRepository())
+        for i in range(12):
+            service.create_report("U1", "T123456", ReportType.LACKED_AUTHORITY, f"{i} " + "z" * 2500)
+        respond = Mock()
+        
+        with patch("listeners.commands.decidely_list.report_service", service):
+            decidely_list_callback(ack=Mock(), command={"team_id": "T123456"}, respond=respond)
+        
+        messages = [call.kwargs["blocks"] for call in respond.call_args_list]
+        assert len(messages) > 1
+        assert messages[0][0]["type"] == "header"
+        assert messages[-1][-1]["type"] == "actions"
+        assert sum(block["type"] == "section" for message in messages for block in message) == 11
+
+
+class TestFitBlocks:
+    def test_shows_the_most_items_that_fit_in_few_renders(self):
+        from listeners.block_messages import fit_blocks, fits_in_messages
+
+        rendered = []
+
+        def render(count):
+            rendered.append(count)
+            return [section("x" * 2000) for _ in range(count)] + [ACTIONS]
+
+        blocks = fit_blocks(render, 100, max_messages=1)
+
+        # The full page, then a binary search over 1..99
+        assert len(rendered) <= 8
+        shown = len(blocks) - 1
+        assert fits_in_messages(blocks, max_messages=1)
+        assert not fits_in_messages(render(shown + 1), max_messages=1)
+
+    def test_renders_one_item_even_if_it_does_not_fit(self):
+        from listeners.block_messages import fit_blocks
+
+        blocks = fit_blocks(lambda count: [section("x" * 2900) for _ in range(count)], 5, max_bytes=1000)
+
+        assert len(blocks) == 1
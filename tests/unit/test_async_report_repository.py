@@ -0,0 +1,89 @@
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+import pytest
+from models.report import ReportType
+from repositories.async_report_repository import (
+    AsyncReportRepository,
+    AsyncSQLiteReportRepository,
+)
+from tests.factories import make_report
+
+
+class TestAsyncSQLiteReportRepository:
+    @pytest.mark.asyncio
+    async def test_save_and_find(self):
+        repo = AsyncSQLiteReportRepository(":memory:")
+        report = make_report(1)
+
+        assert isinstance(repo, AsyncReportRepository)
+        assert await repo.save(report) == report
+        assert await repo.find_by_id(report.id) == report
+        assert await repo.find_by_workspace("W123456") == [report]
+        assert await repo.find_by_user("U123456") == [report]
+        assert await repo.find_by_type(ReportType.LACKED_AUTHORITY) == [report]
+        assert await repo.find_by_workspace_and_type(
+            "W123456", ReportType.EXPECTED_INITIATIVE
+        ) == []
+
+        await repo.close()
+
+    @pytest.mark.asyncio
+    async def test_queries_run_off_the_event_loop_thread(self):
+        repo = AsyncSQLiteReportRepository(":memory:", max_workers=2)
+        loop_thread = threading.get_ident()
+        query_threads = set()
+
+        original = repo._repository.find_by_workspace
+
+        def spy(workspace_id, *window):
+            query_threads.add(threading.get_ident())
+            return original(workspace_id, *window)
+
+        repo._repository.find_by_workspace = spy
+        await asyncio.gather(*(repo.find_by_workspace("W123456") for _ in range(5)))
+
+        assert query_threads
+        assert loop_thread not in query_threads
+        assert len(query_threads) <= 2
+
+        await repo.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_on_file_database(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = AsyncSQLiteReportRepository(str(Path(temp_dir) / "test.db"), max_workers=4)
+
+            await asyncio.gather(*(repo.save(make_report(i)) for i in range(20)))
+
+            counts = await repo.count_by_type("W123456")
+            assert counts[ReportType.LACKED_AUTHORITY] == 20
+
+            await repo.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_by_workspace_streams_in_chunks(self):
+        repo = AsyncSQLiteReportRepository(":memory:")
+        reports = [make_report(i) for i in range(7)]
+        await repo.save_many(reports)
+        await repo.save(make_report(99, workspace_id="W789012"))
+
+        streamed = [report async for report in repo.iter_by_workspace("W123456", chunk_size=3)]
+
+        assert [r.id for r in streamed] == [r.id for r in reports]
+
+        await repo.close()
+
+    @pytest.mark.asyncio
+    async def test_find_page_by_workspace(self):
+        repo = AsyncSQLiteReportRepository(":memory:")
+        reports = [make_report(i) for i in range(3)]
+        await repo.save_many(reports)
+
+        page = await repo.find_page_by_workspace("W123456", 2)
+
+        assert [r.id for r in page.reports] == [reports[2].id, reports[1].id]
+        assert page.has_older
+
+        await repo.close()
@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID
+import pytest
+from models.report import Report, ReportType
+from models.pagination import ReportPage
+from repositories.async_report_repository import AsyncReportRepository
+
+
+class TestAsyncReportService:
+    @pytest.mark.asyncio
+    async def test_create_report(self):
+        from services.async_report_service import AsyncReportService
+
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.save = AsyncMock(side_effect=lambda report: report)
+
+        service = AsyncReportService(mock_repository)
+
+        report = await service.create_report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.EXPECTED_INITIATIVE,
+            description="Async report"
+        )
+
+        mock_repository.save.assert_awaited_once_with(report)
+        assert report.workspace_id == "W123456"
+        assert isinstance(report.id, UUID)
+
+    @pytest.mark.asyncio
+    async def test_get_workspace_summary(self):
+        from services.async_report_service import AsyncReportService
+
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.count_by_type = AsyncMock(return_value={
+            ReportType.LACKED_AUTHORITY: 4,
+            ReportType.EXPECTED_INITIATIVE: 1
+        })
+
+        service = AsyncReportService(mock_repository)
+
+        summary = await service.get_workspace_summary("W123456")
+
+        assert summary == {
+            "workspace_id": "W123456",
+            "total_reports": 5,
+            "lacked_authority_count": 4,
+            "expected_initiative_count": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_workspace_reports_page(self):
+        from services.async_report_service import AsyncReportService
+
+        page = ReportPage()
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.find_page_by_workspace = AsyncMock(return_value=page)
+
+        service = AsyncReportService(mock_repository)
+
+        assert await service.get_workspace_reports_page("W123456", limit=5) is page
+        mock_repository.find_page_by_workspace.assert_awaited_once_with(
+            "W123456", 5, before=None, after=None, since=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_reports(self):
+        from services.async_report_service import AsyncReportService
+
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Bulk"
+            )
+        ]
+        mock_repository = Mock(spec=AsyncReportRepository)
+        mock_repository.save_many = AsyncMock(return_value=reports)
+
+        service = AsyncReportService(mock_repository)
+
+        assert await service.create_reports(reports) == reports
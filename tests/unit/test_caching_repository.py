@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, UTC
+from unittest.mock import Mock
+from models.report import ReportType
+from repositories.report_repository import InMemoryReportRepository, ReportRepository
+from repositories.caching_repository import CachingReportRepository
+from tests.factories import make_report
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachingReportRepository:
+    def setup_method(self):
+        self.delegate = Mock(wraps=InMemoryReportRepository(), spec=ReportRepository)
+        self.clock = FakeClock()
+        self.repo = CachingReportRepository(self.delegate, ttl_seconds=10, clock=self.clock)
+
+    def test_repeated_reads_hit_cache(self):
+        self.repo.save(make_report(1))
+
+        first = self.repo.find_by_workspace("W123456")
+        second = self.repo.find_by_workspace("W123456")
+
+        assert first == second
+        assert self.delegate.find_by_workspace.call_count == 1
+        stats = self.repo.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_save_invalidates_affected_keys_only(self):
+        self.repo.save(make_report(1))
+        self.repo.find_by_workspace("W123456")
+        self.repo.find_by_workspace("W789012")
+        self.repo.count_by_type("W123456")
+
+        self.repo.save(make_report(2))
+
+        assert len(self.repo.find_by_workspace("W123456")) == 2
+        assert self.repo.count_by_type("W123456")[ReportType.LACKED_AUTHORITY] == 2
+        self.repo.find_by_workspace("W789012")
+        assert self.delegate.find_by_workspace.call_count == 3
+        assert self.repo.stats().invalidations == 2
+
+    def test_save_invalidates_user_and_type_keys(self):
+        self.repo.find_by_user("U123456")
+        self.repo.find_by_type(ReportType.EXPECTED_INITIATIVE)
+        self.repo.find_by_workspace_and_type("W123456", ReportType.EXPECTED_INITIATIVE)
+
+        self.repo.save(make_report(1, workspace_id="W789012", report_type=ReportType.EXPECTED_INITIATIVE))
+
+        assert len(self.repo.find_by_user("U123456")) == 1
+        assert len(self.repo.find_by_type(ReportType.EXPECTED_INITIATIVE)) == 1
+        # Different workspace, but the type tag still invalidates the combined query
+        assert self.repo.find_by_workspace_and_type("W123456", ReportType.EXPECTED_INITIATIVE) == []
+        assert self.delegate.find_by_workspace_and_type.call_count == 2
+
+    def test_entries_expire_after_ttl(self):
+        self.repo.find_by_workspace("W123456")
+        self.clock.now = 11
+
+        self.repo.find_by_workspace("W123456")
+
+        assert self.delegate.find_by_workspace.call_count == 2
+        assert self.repo.stats().expirations == 1
+
+    def test_lru_eviction_by_entry_count(self):
+        repo = CachingReportRepository(self.delegate, max_entries=2, clock=self.clock)
+
+        repo.find_by_workspace("W1")
+        repo.find_by_workspace("W2")
+        repo.find_by_workspace("W1")
+        repo.find_by_workspace("W3")
+
+        stats = repo.stats()
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        repo.find_by_workspace("W1")
+        assert repo.stats().hits == 2  # W1 was recently used, so W2 was evicted
+
+    def test_memory_bound_by_cached_reports(self):
+        repo = CachingReportRepository(self.delegate, max_reports=3, clock=self.clock)
+        repo.save_many([make_report(i) for i in range(2)])
+        repo.save_many([make_report(i, workspace_id="W789012") for i in range(2)])
+
+        repo.find_by_workspace("W123456")
+        repo.find_by_workspace("W789012")
+
+        stats = repo.stats()
+        assert stats.cached_reports <= 3
+        assert stats.evictions == 1
+
+    def test_cached_lists_are_not_shared_with_callers(self):
+        self.repo.save(make_report(1))
+
+        self.repo.find_by_workspace("W123456").clear()
+
+        assert len(self.repo.find_by_workspace("W123456")) == 1
+
+    def test_pages_are_cached_and_invalidated(self):
+        self.repo.save_many([make_report(i) for i in range(3)])
+
+        self.repo.find_page_by_workspace("W123456", 2)
+        self.repo.find_page_by_workspace("W123456", 2)
+        assert self.delegate.find_page_by_workspace.call_count == 1
+
+        self.repo.save(make_report(9))
+        page = self.repo.find_page_by_workspace("W123456", 2)
+
+        assert page.reports[0].description == "Report 9"
+
+    def test_sliding_windows_share_entries_within_a_minute(self):
+        self.repo.save(make_report(1))
+        since = datetime(2024, 1, 1, 0, 0, 10, tzinfo=UTC)
+
+        self.repo.count_by_type("W123456", since)
+        self.repo.count_by_type("W123456", since + timedelta(seconds=30))
+        self.repo.find_page_by_workspace("W123456", 10, since=since)
+        self.repo.find_page_by_workspace("W123456", 10, since=since + timedelta(seconds=30))
+
+        assert self.delegate.count_by_type.call_count == 1
+        assert self.delegate.find_page_by_workspace.call_count == 1
+        # The delegate is asked for the rounded window
+        assert self.delegate.count_by_type.call_args.args[1] == datetime(2024, 1, 1, tzinfo=UTC)
+        self.repo.count_by_type("W123456", since + timedelta(minutes=1))
+        assert self.delegate.count_by_type.call_count == 2
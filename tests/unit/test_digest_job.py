@@ -0,0 +1,306 @@
+import threading
+import time
+from datetime import datetime, timedelta, UTC
+from unittest.mock import MagicMock
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+NOW = datetime(2024, 3, 11, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def service():
+    from repositories.report_repository import InMemoryReportRepository
+    from services.report_service import ReportService
+
+    repository = InMemoryReportRepository()
+    for i in range(20):
+        workspace_id = f"W{i:02d}"
+        repository.save(make_report(workspace_id=workspace_id, user_id="U1", timestamp=NOW - timedelta(days=1)))
+        repository.save(make_report(
+            workspace_id=workspace_id, user_id="U2", timestamp=NOW - timedelta(days=2),
+            report_type=ReportType.EXPECTED_INITIATIVE
+        ))
+        repository.save(make_report(workspace_id=workspace_id, user_id="U1", timestamp=NOW - timedelta(days=30)))
+    return ReportService(repository)
+
+
+class FakeClock:
+    """Monotonic time that only moves when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class TestNextWeeklyRun:
+    def test_later_the_same_day(self):
+        from services.digest_job import next_weekly_run
+
+        # 2024-03-11 is a Monday
+        assert next_weekly_run(datetime(2024, 3, 11, 8, 30, tzinfo=UTC), 0, 9) == NOW
+
+    def test_exactly_at_the_hour_waits_a_week(self):
+        from services.digest_job import next_weekly_run
+
+        assert next_weekly_run(NOW, 0, 9) == NOW + timedelta(weeks=1)
+
+    def test_later_weekday(self):
+        from services.digest_job import next_weekly_run
+
+        assert next_weekly_run(NOW, 4, 17) == datetime(2024, 3, 15, 17, 0, tzinfo=UTC)
+
+    def test_earlier_weekday_wraps_to_next_week(self):
+        from services.digest_job import next_weekly_run
+
+        friday = datetime(2024, 3, 15, 18, 0, tzinfo=UTC)
+        assert next_weekly_run(friday, 0, 9) == datetime(2024, 3, 18, 9, 0, tzinfo=UTC)
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        from services.digest_job import TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            assert bucket.acquire()
+        assert clock.sleeps == [0.5, 0.5]
+
+    def test_refuses_wait_past_deadline(self):
+        from services.digest_job import TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire(deadline=10)
+        assert not bucket.acquire(deadline=0.5)
+        assert clock.sleeps == []
+        assert bucket.acquire(deadline=1)
+
+    def test_rejects_bad_arguments(self):
+        from services.digest_job import TokenBucket
+
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestDigestBlocks:
+    def test_summary_reporters_and_latest_reports(self, service):
+        from services.digest_job import build_digest_blocks, build_workspace_digest
+
+        digest = build_workspace_digest(service, "W00", NOW)
+
+        # The 30-day-old report is outside the week
+        assert digest.summary["total_reports"] == 2
+        assert [report.user_id for report in digest.top_reports] == ["U1", "U2"]
+        assert digest.top_reporters == [("U1", 1), ("U2", 1)]
+        text = str(build_digest_blocks(digest))
+        assert "2 new reports" in text
+        assert "Most active reporters: <@U1> (1), <@U2> (1)" in text
+
+    def test_long_descriptions_are_excerpted(self, service):
+        from services.digest_job import EXCERPT_LENGTH, build_digest_blocks, build_workspace_digest
+
+        service.create_report("U3", "W99", ReportType.LACKED_AUTHORITY, "x" * 5000)
+        blocks = build_digest_blocks(build_workspace_digest(service, "W99", datetime.now(UTC)))
+
+        report_text = blocks[-2]["text"]["text"]
+        assert report_text.endswith("x…_")
+        assert report_text.count("x") == EXCERPT_LENGTH - 1
+        assert all(len(block.get("text", {}).get("text", "")) <= 3000 for block in blocks)
+
+    def test_empty_week_has_no_reports(self, service):
+        from services.digest_job import build_workspace_digest
+
+        digest = build_workspace_digest(service, "W00", NOW + timedelta(weeks=2))
+
+        assert digest.summary["total_reports"] == 0
+        assert digest.top_reports == [] and digest.top_reporters == []
+
+
+class TestDigestJob:
+    def test_posts_every_workspace_with_bounded_concurrency(self, service):
+        from services.digest_job import DigestJob
+
+        lock = threading.Lock()
+        active, peak, posts = 0, 0, []
+
+        def post(workspace_id, channel, text, blocks):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+                posts.append((workspace_id, channel))
+
+        channels = {f"W{i:02d}": f"C{i:02d}" for i in range(20)}
+        channels["W-empty"] = "C-empty"
+        job = DigestJob(service, channels, post, max_workers=4, posts_per_second=1000)
+        result = job.run(NOW)
+
+        assert sorted(result.posted) == sorted(posts_for for posts_for, _ in posts)
+        assert sorted(posts) == sorted((w, c) for w, c in channels.items() if w != "W-empty")
+        assert result.empty == ["W-empty"]
+        assert result.failed == {} and result.skipped == []
+        assert 1 < peak <= 4
+
+    def test_posts_are_rate_limited(self, service):
+        from services.digest_job import DigestJob
+
+        clock = FakeClock()
+        channels = {f"W{i:02d}": "C1" for i in range(6)}
+        job = DigestJob(
+            service, channels, MagicMock(), max_workers=1, posts_per_second=2,
+            clock=clock, sleep=clock.sleep
+        )
+        result = job.run(NOW)
+
+        assert len(result.posted) == 6
+        # One token per worker up front, then one every half second
+        assert clock.sleeps == [0.5] * 5
+
+    def test_retries_after_rate_limit(self, service):
+        from services.digest_job import DigestJob, RateLimitedError
+
+        clock = FakeClock()
+        post = MagicMock(side_effect=[RateLimitedError(3), None])
+        job = DigestJob(service, {"W00": "C1"}, post, clock=clock, sleep=clock.sleep)
+        result = job.run(NOW)
+
+        assert result.posted == ["W00"]
+        assert post.call_count == 2
+        assert 3 in clock.sleeps
+
+    def test_retry_that_would_overrun_budget_is_skipped(self, service):
+        from services.digest_job import DigestJob, RateLimitedError
+
+        clock = FakeClock()
+        post = MagicMock(side_effect=RateLimitedError(120))
+        job = DigestJob(service, {"W00": "C1"}, post, time_budget=60, clock=clock, sleep=clock.sleep)
+        result = job.run(NOW)
+
+        assert result.skipped == ["W00"]
+        assert post.call_count == 1
+
+    def test_stops_starting_workspaces_after_time_budget(self, service):
+        from services.digest_job import DigestJob
+
+        clock = FakeClock()
+
+        def slow_post(workspace_id, channel, text, blocks):
+            clock.sleep(10)
+
+        channels = {f"W{i:02d}": "C1" for i in range(5)}
+        job = DigestJob(
+            service, channels, slow_post, max_workers=1, time_budget=25,
+            clock=clock, sleep=clock.sleep
+        )
+        result = job.run(NOW)
+
+        assert sorted(result.posted) == ["W00", "W01", "W02"]
+        assert sorted(result.skipped) == ["W03", "W04"]
+
+    def test_wall_clock_budget_bounds_the_run(self, service):
+        from services.digest_job import DigestJob
+
+        release = threading.Event()
+
+        def stuck_post(workspace_id, channel, text, blocks):
+            release.wait(5)
+
+        channels = {f"W{i:02d}": "C1" for i in range(10)}
+        job = DigestJob(service, channels, stuck_post, max_workers=2, time_budget=0.2)
+        started = time.monotonic()
+        result = job.run(NOW)
+        release.set()
+
+        assert time.monotonic() - started < 2
+        # The two stuck posts may still go through; the queued rest never will
+        assert sorted(result.in_flight) == ["W00", "W01"]
+        assert sorted(result.skipped) == sorted(channels)[2:]
+
+    def test_workers_do_not_post_after_time_budget(self, service):
+        from services.digest_job import DigestJob
+
+        release = threading.Event()
+        summary = service.get_workspace_summary
+
+        def slow_summary(workspace_id, since=None):
+            release.wait(5)
+            return summary(workspace_id, since=since)
+
+        service.get_workspace_summary = slow_summary
+        post = MagicMock()
+        job = DigestJob(service, {"W00": "C1", "W01": "C2"}, post, max_workers=2, time_budget=0.2)
+        result = job.run(NOW)
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name.startswith("decidely-digest"):
+                thread.join(5)
+
+        assert sorted(result.skipped) == ["W00", "W01"]
+        assert result.in_flight == []
+        post.assert_not_called()
+
+    def test_failures_do_not_stop_other_workspaces(self, service):
+        from services.digest_job import DigestJob
+
+        def post(workspace_id, channel, text, blocks):
+            if workspace_id == "W01":
+                raise RuntimeError("channel_not_found")
+
+        job = DigestJob(service, {"W00": "C1", "W01": "C2", "W02": "C3"}, post)
+        result = job.run(NOW)
+
+        assert sorted(result.posted) == ["W00", "W02"]
+        assert result.failed == {"W01": "channel_not_found"}
+
+
+class TestSlackPoster:
+    def _error(self, status_code, headers=None):
+        from slack_sdk.errors import SlackApiError
+
+        response = MagicMock(status_code=status_code, headers=headers or {})
+        return SlackApiError("failed", response)
+
+    def test_posts_with_workspace_client(self):
+        from services.digest_job import slack_poster
+
+        client = MagicMock()
+        client_for = MagicMock(return_value=client)
+        slack_poster(client_for)("W1", "C1", "text", [{"type": "divider"}])
+
+        client_for.assert_called_once_with("W1")
+        client.chat_postMessage.assert_called_once_with(channel="C1", text="text", blocks=[{"type": "divider"}])
+
+    def test_429_becomes_rate_limited_error(self):
+        from services.digest_job import RateLimitedError, slack_poster
+
+        client = MagicMock()
+        client.chat_postMessage.side_effect = self._error(429, {"Retry-After": "7"})
+
+        with pytest.raises(RateLimitedError) as raised:
+            slack_poster(lambda _: client)("W1", "C1", "text", [])
+        assert raised.value.retry_after == 7
+
+    def test_other_errors_propagate(self):
+        from slack_sdk.errors import SlackApiError
+        from services.digest_job import slack_poster
+
+        client = MagicMock()
+        client.chat_postMessage.side_effect = self._error(404)
+
+        with pytest.raises(SlackApiError):
+            slack_poster(lambda _: client)("W1", "C1", "text", [])
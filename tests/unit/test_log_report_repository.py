@@ -0,0 +1,143 @@
+import time
+from dataclasses import replace
+from uuid import uuid4
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+
+def open_log(path, **options):
+    from repositories.log_report_repository import LogStructuredReportRepository
+
+    options.setdefault("compaction_interval", None)
+    return LogStructuredReportRepository(str(path), **options)
+
+
+class TestLogStructuredReportRepository:
+    def test_queries(self, tmp_path):
+        repo = open_log(tmp_path)
+        reports = [
+            make_report(i, workspace_id=f"W{i % 2}", user_id=f"U{i % 3}",
+                        report_type=ReportType.EXPECTED_INITIATIVE if i % 4 else ReportType.LACKED_AUTHORITY)
+            for i in range(12)
+        ]
+        repo.save_many(reversed(reports))
+
+        assert repo.find_by_id(reports[3].id) == reports[3]
+        assert repo.find_by_id(uuid4()) is None
+        assert repo.find_by_workspace("W0") == reports[0::2]
+        assert repo.find_by_user("U1", since=reports[4].timestamp) == [reports[4], reports[7], reports[10]]
+        assert repo.find_by_type(ReportType.LACKED_AUTHORITY) == reports[0::4]
+        assert repo.find_by_workspace_and_type("W0", ReportType.LACKED_AUTHORITY) == reports[0::4]
+        assert repo.count_by_type("W1") == {
+            ReportType.LACKED_AUTHORITY: 0, ReportType.EXPECTED_INITIATIVE: 6
+        }
+        page = repo.find_page_by_workspace("W0", 4)
+        assert page.reports == reports[0::2][::-1][:4]
+        assert repo.find_page_by_workspace("W0", 4, before=page.older_cursor).reports == [
+            reports[2], reports[0]
+        ]
+        assert list(repo.iter_by_workspace("W0", chunk_size=2)) == reports[0::2]
+        assert repo.search("W1", "report 5") == [reports[5]]
+        repo.close()
+
+    def test_resave_supersedes_previous_record(self, tmp_path):
+        repo = open_log(tmp_path)
+        report = make_report(0)
+        repo.save(report)
+        moved = replace(report, workspace_id="W2", description="Edited")
+        repo.save(moved)
+
+        assert repo.find_by_id(report.id) == moved
+        assert repo.find_by_workspace("W123456") == []
+        assert repo.find_by_workspace("W2") == [moved]
+        repo.close()
+
+    def test_segments_roll_over_and_reopen_from_footers(self, tmp_path, monkeypatch):
+        from repositories.log_report_repository import LogStructuredReportRepository
+
+        repo = open_log(tmp_path, segment_max_bytes=1024)
+        reports = [make_report(i) for i in range(30)]
+        repo.save_many(reports)
+        assert repo.segment_count > 3
+        repo.close()
+
+        # Every segment is sealed on close, so no record has to be scanned
+        def no_scan(self, segment):
+            raise AssertionError(f"scanned {segment.path.name}")
+        monkeypatch.setattr(LogStructuredReportRepository, "_recover", no_scan)
+        reopened = open_log(tmp_path)
+
+        assert reopened.find_by_workspace("W123456") == reports
+        reopened.close()
+
+    def test_recovers_unsealed_segment_and_drops_torn_record(self, tmp_path):
+        repo = open_log(tmp_path, segment_max_bytes=1024)
+        reports = [make_report(i) for i in range(12)]
+        repo.save_many(reports)
+        active = repo._active.path
+        # Simulate a crash: no close(), half a record at the end
+        repo._writer.write(b'{"id": "torn')
+        repo._writer.flush()
+
+        reopened = open_log(tmp_path)
+
+        assert reopened.find_by_workspace("W123456") == reports
+        reopened.save(make_report(12))
+        assert len(reopened.find_by_workspace("W123456")) == 13
+        assert active.read_bytes().count(b"torn") == 0
+        reopened.close()
+
+    def test_compaction_reclaims_superseded_records(self, tmp_path):
+        repo = open_log(tmp_path, segment_max_bytes=1024)
+        reports = [make_report(i) for i in range(20)]
+        repo.save_many(reports)
+        edited = [replace(report, description="Edited") for report in reports[:18]]
+        repo.save_many(edited)
+        size_before = sum(p.stat().st_size for p in tmp_path.iterdir())
+
+        assert repo.compact() > 0
+        assert repo.compact() == 0
+
+        expected = edited + reports[18:]
+        assert repo.find_by_workspace("W123456") == expected
+        assert sum(p.stat().st_size for p in tmp_path.iterdir()) < size_before
+        repo.close()
+
+        reopened = open_log(tmp_path)
+        assert reopened.find_by_workspace("W123456") == expected
+        reopened.close()
+
+    def test_reopens_segments_past_four_digit_generations(self, tmp_path):
+        repo = open_log(tmp_path)
+        reports = [make_report(i) for i in range(3)]
+        repo.save_many(reports)
+        repo.close()
+        [segment] = tmp_path.glob("segment-*.log")
+        number = segment.name.split("-")[1]
+        segment.rename(tmp_path / f"segment-{number}-10000.log")
+
+        reopened = open_log(tmp_path)
+        assert reopened.find_by_workspace("W123456") == reports
+        reopened.close()
+
+    def test_background_compaction(self, tmp_path):
+        repo = open_log(tmp_path, segment_max_bytes=512, compaction_interval=0.01)
+        report = make_report(0)
+        for i in range(20):
+            repo.save(replace(report, description=f"Version {i}"))
+
+        deadline = time.monotonic() + 5
+        while repo.segment_count > 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert repo.segment_count <= 3
+        assert repo.find_by_id(report.id).description == "Version 19"
+        repo.close()
+
+    def test_closed_repository_rejects_writes(self, tmp_path):
+        repo = open_log(tmp_path)
+        repo.close()
+
+        with pytest.raises(RuntimeError):
+            repo.save(make_report(0))
@@ -81,6 +81,47 @@ class TestReportModel:
         assert "U123456" in str_repr
         assert "lacked_authority" in str_repr
         assert report.timestamp.strftime("%Y-%m-%d %H:%M") in str_repr
+    
+    def test_report_has_no_instance_dict(self):
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Test description"
+        )
+        
+        assert not hasattr(report, "__dict__")
+        with pytest.raises(AttributeError):
+            report.description = "Changed"
+    
+    def test_report_interns_slack_ids(self):
+        def build(user_id, workspace_id):
+            return Report(
+                user_id=user_id,
+                workspace_id=workspace_id,
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Test description"
+            )
+        
+        first = build("".join(["U", "123456"]), "".join(["W", "123456"]))
+        second = Report.from_dict(build("".join(["U", "123456"]), "".join(["W", "123456"])).to_dict())
+        
+        assert first.user_id is second.user_id
+        assert first.workspace_id is second.workspace_id
+    
+    def test_report_equality_and_replace(self):
+        from dataclasses import replace
+        
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Test description"
+        )
+        
+        assert Report.from_dict(report.to_dict()) == report
+        assert hash(Report.from_dict(report.to_dict())) == hash(report)
+        assert replace(report, description="Other") != report
 
 
 class TestReportType:
@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime, UTC
+from uuid import uuid4
+from models.report import Report, ReportType
+from models.pagination import ReportCursor, ReportPage
+
+
+class TestReportCursor:
+    def test_encode_decode_round_trip(self):
+        cursor = ReportCursor(timestamp=datetime(2024, 5, 1, 9, 30, tzinfo=UTC), id=uuid4())
+        
+        assert ReportCursor.decode(cursor.encode()) == cursor
+    
+    def test_decode_rejects_malformed_value(self):
+        with pytest.raises(ValueError):
+            ReportCursor.decode("not-a-cursor")
+    
+    def test_page_cursors_point_at_edges(self):
+        newest = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Newest"
+        )
+        oldest = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Oldest"
+        )
+        
+        page = ReportPage.from_reports([newest, oldest], has_newer=True, has_older=False)
+        
+        assert page.newer_cursor == ReportCursor.from_report(newest)
+        assert page.older_cursor is None
+        assert page.has_newer and not page.has_older
+    
+    def test_empty_page_has_no_cursors(self):
+        page = ReportPage.from_reports([], has_newer=True, has_older=True)
+        
+        assert page.reports == []
+        assert not page.has_newer
+        assert not page.has_older
@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta, timezone, UTC
+from unittest.mock import patch
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+LACKED = ReportType.LACKED_AUTHORITY
+EXPECTED = ReportType.EXPECTED_INITIATIVE
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        from repositories.report_repository import InMemoryReportRepository
+        yield InMemoryReportRepository()
+    else:
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        repo = SQLiteReportRepository(str(tmp_path / "reports.db"))
+        yield repo
+        repo.close()
+
+
+class TestBucketBoundaries:
+    def test_weeks_start_on_monday(self):
+        from services.report_analytics import bucket_boundaries
+
+        # 2024-01-03 is a Wednesday
+        edges = bucket_boundaries("week", datetime(2024, 1, 3, 15, tzinfo=UTC), datetime(2024, 1, 20, tzinfo=UTC))
+
+        assert edges == [datetime(2024, 1, d, tzinfo=UTC) for d in (1, 8, 15, 22)]
+
+    def test_months_roll_over_years(self):
+        from services.report_analytics import bucket_boundaries
+
+        edges = bucket_boundaries("month", datetime(2023, 11, 20, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC))
+
+        assert edges == [
+            datetime(2023, 11, 1, tzinfo=UTC), datetime(2023, 12, 1, tzinfo=UTC),
+            datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 2, 1, tzinfo=UTC),
+        ]
+
+    def test_rejects_unknown_granularity(self):
+        from services.report_analytics import bucket_boundaries
+
+        with pytest.raises(ValueError):
+            bucket_boundaries("hour", datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC))
+
+
+class TestHistogram:
+    @pytest.mark.parametrize("granularity, until, first", [
+        ("day", datetime(2024, 3, 1, 9, tzinfo=UTC), datetime(2024, 1, 31, tzinfo=UTC)),
+        ("week", datetime(2024, 1, 3, tzinfo=UTC), datetime(2023, 1, 2, tzinfo=UTC)),
+        ("month", datetime(2024, 2, 29, 12, tzinfo=UTC), datetime(2023, 2, 1, tzinfo=UTC)),
+    ])
+    def test_default_window_is_whole_buckets_plus_the_current_one(self, repository, granularity, until, first):
+        from services.report_analytics import DEFAULT_PERIODS, ReportAnalytics
+
+        histogram = ReportAnalytics(repository).histogram("W123456", granularity, until=until)
+
+        assert len(histogram.starts) == DEFAULT_PERIODS[granularity] + 1
+        assert histogram.starts[0] == first
+        assert histogram.starts[-1] <= until
+
+    def test_counts_match_a_naive_loop(self, repository):
+        import random
+        from services.report_analytics import ReportAnalytics, bucket_boundaries
+
+        rng = random.Random(3)
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        reports = [
+            make_report(
+                timestamp=start + timedelta(hours=rng.randrange(24 * 200)),
+                report_type=rng.choice([LACKED, EXPECTED])
+            )
+            for _ in range(500)
+        ]
+        repository.save_many(reports)
+        until = start + timedelta(days=150)
+
+        for granularity in ("day", "week", "month"):
+            histogram = ReportAnalytics(repository).histogram("W123456", granularity, since=start, until=until)
+            edges = bucket_boundaries(granularity, start, until)
+            for report_type in (LACKED, EXPECTED):
+                assert histogram.counts[report_type] == [
+                    sum(1 for r in reports if r.report_type == report_type and low <= r.timestamp < high)
+                    for low, high in zip(edges, edges[1:])
+                ]
+            assert histogram.starts == edges[:-1]
+
+    def test_ratios_and_moving_average(self):
+        from services.report_analytics import Histogram
+
+        histogram = Histogram(
+            granularity="week",
+            starts=[datetime(2024, 1, 1, tzinfo=UTC) + timedelta(weeks=i) for i in range(4)],
+            counts={LACKED: [2, 0, 1, 3], EXPECTED: [2, 0, 3, 1]}
+        )
+
+        assert histogram.totals == [4, 0, 4, 4]
+        assert histogram.ratios(LACKED) == [0.5, None, 0.25, 0.75]
+        assert histogram.moving_average(2, LACKED) == [2.0, 1.0, 0.5, 2.0]
+        assert histogram.moving_average(3) == [4.0, 2.0, 8 / 3, 8 / 3]
+
+    def test_buckets_by_utc_whatever_the_offset(self, repository):
+        from services.report_analytics import ReportAnalytics
+
+        repository.save_many([
+            make_report(timestamp=datetime(2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=5)))),  # Jan 1, 20:00 UTC
+            make_report(timestamp=datetime(2024, 1, 1, 22, tzinfo=UTC)),
+            make_report(timestamp=datetime(2024, 1, 2, 3, tzinfo=UTC)),
+        ])
+
+        histogram = ReportAnalytics(repository).histogram(
+            "W123456", "day", since=datetime(2024, 1, 1, tzinfo=UTC), until=datetime(2024, 1, 3, tzinfo=UTC)
+        )
+
+        assert histogram.counts[LACKED] == [2, 1]
+
+    def test_columns_sort_out_of_order_and_naive_timestamps(self):
+        from services.report_analytics import ReportColumns
+
+        columns = ReportColumns.from_reports([
+            make_report(timestamp=datetime(2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=5)))),
+            make_report(timestamp=datetime(2024, 1, 1, 22)),
+        ])
+
+        assert columns.counts([
+            datetime(2024, 1, 1, 21, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC)
+        ]) == {LACKED: [1], EXPECTED: [0]}
+        assert list(columns.timestamps[LACKED]) == sorted(columns.timestamps[LACKED])
+
+
+class TestAnalyticsCache:
+    def test_columns_are_reused_until_a_report_arrives(self, repository):
+        from services.report_analytics import ReportAnalytics
+
+        analytics = ReportAnalytics(repository)
+        repository.save(make_report(timestamp=datetime(2024, 1, 1, tzinfo=UTC)))
+        window = dict(since=datetime(2024, 1, 1, tzinfo=UTC), until=datetime(2024, 1, 8, tzinfo=UTC))
+
+        with patch.object(analytics, "_load", wraps=analytics._load) as load:
+            assert analytics.histogram("W123456", "day", **window).total() == 1
+            assert analytics.histogram("W123456", "week", **window).total() == 1
+            assert load.call_count == 1
+
+            repository.save(make_report(timestamp=datetime(2024, 1, 2, tzinfo=UTC), report_type=EXPECTED))
+            assert analytics.histogram("W123456", "day", **window).total() == 2
+            assert load.call_count == 2
+
+    def test_workspaces_are_cached_separately_and_bounded(self, repository):
+        from services.report_analytics import ReportAnalytics
+
+        analytics = ReportAnalytics(repository, max_workspaces=1)
+        repository.save_many([
+            make_report(timestamp=datetime(2024, 1, 1, tzinfo=UTC), workspace_id="W123456"),
+            make_report(timestamp=datetime(2024, 1, 1, tzinfo=UTC), workspace_id="W2"),
+        ])
+
+        first = analytics.columns("W123456")
+        assert analytics.columns("W123456") is first
+        assert len(analytics.columns("W2")) == 1
+        assert analytics.columns("W123456") is not first
@@ -0,0 +1,121 @@
+import io
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+
+def make_reports(count=20):
+    return [
+        make_report(
+            i,
+            workspace_id=f"W{i % 2}",
+            user_id=f"U{i % 3}",
+            report_type=ReportType.EXPECTED_INITIATIVE if i % 2 else ReportType.LACKED_AUTHORITY,
+            description=f"Report {i} with \"quotes\", café and a\nnewline"
+        )
+        for i in range(count)
+    ]
+
+
+class TestJsonLines:
+    def test_lines_match_to_dict_encoding(self):
+        from models.report_codecs import encode_jsonl_line, iter_jsonl
+
+        reports = make_reports(4)
+
+        expected = [json.dumps(r.to_dict(), separators=(",", ":")) + "\n" for r in reports]
+        assert list(iter_jsonl(reports)) == expected
+        assert [encode_jsonl_line(r) for r in reports] == expected
+
+    def test_round_trip_through_stream(self):
+        from models.report_codecs import dump_jsonl, load_jsonl
+
+        reports = make_reports()
+        buffer = io.StringIO()
+
+        assert dump_jsonl(reports, buffer) == len(reports)
+        buffer.seek(0)
+        assert list(load_jsonl(buffer)) == reports
+
+    def test_rejects_malformed_lines(self):
+        from models.report_codecs import ReportDecodeError, load_jsonl
+
+        with pytest.raises(ReportDecodeError):
+            list(load_jsonl(['{"id": "not-a-uuid"}\n']))
+
+
+class TestBinary:
+    def test_round_trip(self):
+        from models.report_codecs import decode_binary, encode_binary
+
+        reports = make_reports()
+
+        decoded = decode_binary(encode_binary(reports))
+
+        assert decoded == reports
+        assert decoded[0].user_id is decoded[3].user_id
+
+    def test_preserves_naive_and_offset_timestamps(self):
+        from dataclasses import replace
+        from models.report_codecs import decode_binary, encode_binary
+
+        naive, shifted = make_reports(2)
+        naive = replace(naive, timestamp=datetime(2024, 1, 1, 12, 30))
+        shifted = replace(
+            shifted, timestamp=datetime(2024, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=5, minutes=45)))
+        )
+
+        decoded = decode_binary(encode_binary([naive, shifted]))
+
+        assert [r.timestamp.isoformat() for r in decoded] == [
+            "2024-01-01T12:30:00", "2024-01-01T12:30:00+05:45"
+        ]
+
+    def test_ids_are_written_once_per_stream(self):
+        from models.report_codecs import encode_binary
+
+        # Fixed ids, so no random id bytes happen to spell the workspace
+        reports = [replace(r, id=UUID(int=i)) for i, r in enumerate(make_reports(100))]
+
+        assert encode_binary(reports).count(b"W1") == 1
+        assert len(encode_binary(reports)) < sum(len(json.dumps(r.to_dict())) for r in reports) / 2
+
+    def test_streams_lazily(self):
+        from models.report_codecs import dump_binary, load_binary
+
+        reports = make_reports()
+        buffer = io.BytesIO()
+        dump_binary(iter(reports), buffer)
+        buffer.seek(0)
+
+        stream = load_binary(buffer)
+
+        assert next(stream) == reports[0]
+        assert buffer.tell() < len(buffer.getvalue())
+        assert list(stream) == reports[1:]
+
+    @pytest.mark.parametrize("data", [b"", b"NOPE!", b"DRPT\x01R\x00", b"DRPT\x01X"])
+    def test_rejects_invalid_streams(self, data):
+        from models.report_codecs import ReportDecodeError, decode_binary
+
+        with pytest.raises(ReportDecodeError):
+            decode_binary(data)
+
+    @pytest.mark.parametrize("micros, offset_seconds", [(2 ** 63 - 1, 0), (0, 2 * 86400)])
+    def test_rejects_out_of_range_timestamps(self, micros, offset_seconds):
+        from models.report_codecs import ReportDecodeError, _REPORT_HEADER, decode_binary, encode_binary
+
+        report = make_report(description="x")
+        data = encode_binary([report])
+        # The stream ends with the report's header and its one-byte description
+        start = len(data) - 1 - _REPORT_HEADER.size
+        header = list(_REPORT_HEADER.unpack_from(data, start))
+        header[1:3] = [micros, offset_seconds]
+        data = data[:start] + _REPORT_HEADER.pack(*header) + data[-1:]
+
+        with pytest.raises(ReportDecodeError):
+            decode_binary(data)
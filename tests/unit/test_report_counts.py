@@ -0,0 +1,201 @@
+import sqlite3
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+
+def expected_counts(lacked, expected):
+    return {ReportType.LACKED_AUTHORITY: lacked, ReportType.EXPECTED_INITIATIVE: expected}
+
+
+@pytest.fixture(params=[False, True], ids=["text", "compact"])
+def db_path(request, tmp_path):
+    from repositories.sqlite_report_repository import SQLiteReportRepository
+
+    path = tmp_path / "reports.db"
+    SQLiteReportRepository(str(path), compact=request.param).close()
+    return path
+
+
+class TestReportCounts:
+    def test_counters_follow_inserts(self, db_path):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        repo = SQLiteReportRepository(str(db_path))
+        repo.save(make_report())
+        repo.save_many([
+            make_report(1, report_type=ReportType.EXPECTED_INITIATIVE),
+            make_report(2),
+            make_report(3, workspace_id="W2"),
+        ])
+
+        assert repo.count_by_type("W123456") == expected_counts(2, 1)
+        assert repo.count_by_type("W2") == expected_counts(1, 0)
+        assert repo.count_by_type("W3") == expected_counts(0, 0)
+        assert repo.count_by_type("W123456", since=make_report(1).timestamp) == expected_counts(1, 1)
+        repo.close()
+
+    def test_counters_follow_deletes_and_updates(self, db_path):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        repo = SQLiteReportRepository(str(db_path))
+        repo.save_many([make_report(i) for i in range(3)])
+        new_type = repo._codec.encode_type(ReportType.EXPECTED_INITIATIVE)
+
+        conn = sqlite3.connect(str(db_path))
+        first, second = [row[0] for row in conn.execute("SELECT rowid FROM reports LIMIT 2")]
+        conn.execute("DELETE FROM reports WHERE rowid = ?", (first,))
+        conn.execute(
+            "UPDATE reports SET workspace_id = 'W2', report_type = ? WHERE rowid = ?",
+            (new_type, second)
+        )
+        conn.commit()
+        conn.close()
+
+        assert repo.count_by_type("W123456") == expected_counts(1, 0)
+        assert repo.count_by_type("W2") == expected_counts(0, 1)
+        repo.close()
+
+    def test_rollback_leaves_counters_untouched(self, db_path):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        repo = SQLiteReportRepository(str(db_path))
+        duplicate = make_report()
+        repo.save(duplicate)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save_many([make_report(1), duplicate])
+
+        assert repo.count_by_type("W123456") == expected_counts(1, 0)
+        repo.close()
+
+    def test_rebuild_command_repairs_counters(self, db_path):
+        from repositories.sqlite_maintenance import rebuild_counts
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        repo = SQLiteReportRepository(str(db_path))
+        repo.save_many([make_report(i) for i in range(3)])
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE report_counts SET count = 99")
+        conn.execute("INSERT INTO report_counts VALUES ('W9', 'stale', 5)")
+        conn.commit()
+        conn.close()
+        assert repo.count_by_type("W123456") == expected_counts(99, 0)
+
+        assert rebuild_counts(db_path) == 1
+
+        assert repo.count_by_type("W123456") == expected_counts(3, 0)
+        assert sqlite3.connect(str(db_path)).execute(
+            "SELECT COUNT(*) FROM report_counts WHERE workspace_id = 'W9'"
+        ).fetchone()[0] == 0
+        repo.close()
+
+    def test_rebuild_command_covers_every_shard(self, tmp_path):
+        from repositories.sharded_sqlite_repository import ShardedSQLiteReportRepository
+        from repositories.sqlite_maintenance import rebuild_counts
+
+        repo = ShardedSQLiteReportRepository(str(tmp_path / "shards"))
+        repo.save_many([make_report(i, workspace_id=f"W{i}") for i in range(3)])
+        for workspace_id in repo.workspace_ids():
+            conn = sqlite3.connect(str(repo.shard_path(workspace_id)))
+            conn.execute("DELETE FROM report_counts")
+            conn.commit()
+            conn.close()
+
+        assert rebuild_counts(tmp_path / "shards") == 3
+        assert [repo.count_by_type(f"W{i}") for i in range(3)] == [expected_counts(1, 0)] * 3
+        repo.close()
+
+    def test_existing_reports_are_counted_on_upgrade(self, tmp_path):
+        from repositories.sqlite_migrations import MIGRATIONS
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        db_path = tmp_path / "v4.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL)")
+        for version, statements in MIGRATIONS:
+            if version < 5:
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute("INSERT INTO schema_version VALUES (?)", (version,))
+        for report in (make_report(), make_report(1, report_type=ReportType.EXPECTED_INITIATIVE)):
+            conn.execute(
+                "INSERT INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                (str(report.id), report.user_id, report.workspace_id, report.report_type.value,
+                 report.description, report.timestamp.isoformat())
+            )
+        conn.commit()
+        conn.close()
+
+        repo = SQLiteReportRepository(str(db_path), compact=True)
+
+        assert repo.layout == "compact"
+        assert repo.count_by_type("W123456") == expected_counts(1, 1)
+        repo.save(make_report(2))
+        assert repo.count_by_type("W123456") == expected_counts(2, 1)
+        repo.close()
+
+
+class TestLogReportCounts:
+    def test_counters_follow_resaves_reopen_and_compaction(self, tmp_path):
+        from dataclasses import replace
+        from repositories.log_report_repository import LogStructuredReportRepository
+
+        repo = LogStructuredReportRepository(str(tmp_path), segment_max_bytes=512, compaction_interval=None)
+        reports = [make_report(i) for i in range(12)]
+        repo.save_many(reports)
+        repo.save_many(
+            replace(report, workspace_id="W2", report_type=ReportType.EXPECTED_INITIATIVE)
+            for report in reports[:8]
+        )
+        assert repo.count_by_type("W123456") == expected_counts(4, 0)
+        assert repo.count_by_type("W2") == expected_counts(0, 8)
+        repo.close()
+
+        repo = LogStructuredReportRepository(str(tmp_path), segment_max_bytes=512, compaction_interval=None)
+        assert repo.count_by_type("W2") == expected_counts(0, 8)
+        assert repo.compact() > 0
+        assert repo.count_by_type("W123456") == expected_counts(4, 0)
+        assert repo.count_by_type("W2") == expected_counts(0, 8)
+        assert repo.count_by_type("W2", since=reports[6].timestamp) == expected_counts(0, 2)
+        repo.close()
+
+
+class TestSQLAlchemyReportCounts:
+    def test_counters_follow_inserts(self):
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+
+        repo = SQLAlchemyReportRepository("sqlite://")
+        repo.save(make_report())
+        repo.save_many([
+            make_report(1, report_type=ReportType.EXPECTED_INITIATIVE),
+            make_report(2),
+            make_report(3, workspace_id="W2"),
+        ], batch_size=2)
+
+        assert repo.count_by_type("W123456") == expected_counts(2, 1)
+        assert repo.count_by_type("W2") == expected_counts(1, 0)
+        assert repo.count_by_type("W3") == expected_counts(0, 0)
+        assert repo.count_by_type("W123456", since=make_report(1).timestamp) == expected_counts(1, 1)
+        repo.close()
+
+    def test_existing_reports_are_counted_and_rebuild_repairs(self, tmp_path):
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+
+        url = f"sqlite:///{tmp_path / 'reports.db'}"
+        repo = SQLAlchemyReportRepository(url)
+        repo.save_many([make_report(i) for i in range(3)])
+        repo.close()
+        conn = sqlite3.connect(str(tmp_path / "reports.db"))
+        conn.execute("DROP TABLE report_counts")
+        conn.commit()
+        conn.close()
+
+        repo = SQLAlchemyReportRepository(url)
+        assert repo.count_by_type("W123456") == expected_counts(3, 0)
+
+        with repo.engine.begin() as connection:
+            connection.exec_driver_sql("UPDATE report_counts SET count = 99")
+        repo.rebuild_counts()
+        assert repo.count_by_type("W123456") == expected_counts(3, 0)
+        repo.close()
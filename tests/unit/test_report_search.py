@@ -0,0 +1,120 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+import pytest
+from tests.factories import make_report
+
+
+@pytest.fixture(params=["memory", "sqlite", "sqlite_compact", "sqlalchemy"])
+def repo(request, tmp_path):
+    if request.param == "memory":
+        from repositories.report_repository import InMemoryReportRepository
+        yield InMemoryReportRepository()
+    elif request.param == "sqlalchemy":
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+        repository = SQLAlchemyReportRepository("sqlite://")
+        yield repository
+        repository.close()
+    else:
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        repository = SQLiteReportRepository(
+            str(tmp_path / "test.db"), compact=request.param == "sqlite_compact"
+        )
+        yield repository
+        repository.close()
+
+
+class TestReportSearch:
+    def test_requires_every_word(self, repo):
+        budget = make_report(description="Could not approve the budget increase")
+        repo.save_many([budget, make_report(description="Budget meeting moved")])
+
+        assert repo.search("W123456", "approve budget") == [budget]
+
+    def test_ranks_more_occurrences_first_then_newest(self, repo):
+        once_old = make_report(0, description="deploy blocked")
+        once_new = make_report(5, description="deploy waiting")
+        twice = make_report(1, description="deploy after deploy")
+        repo.save_many([once_old, once_new, twice])
+
+        assert repo.search("W123456", "deploy") == [twice, once_new, once_old]
+
+    def test_ignores_case_and_accents(self, repo):
+        report = make_report(description="Decisión sobre el Presupuesto")
+        repo.save(report)
+
+        assert repo.search("W123456", "decision presupuesto") == [report]
+        assert repo.search("W123456", "DECISIÓN") == [report]
+
+    def test_punctuation_and_operators_are_literal(self, repo):
+        report = make_report(description="Release NOT approved (again)")
+        repo.save(report)
+
+        assert repo.search("W123456", 'approved" OR "*') == []
+        assert repo.search("W123456", "release NOT (again)") == [report]
+        assert repo.search("W123456", "  ?! ") == []
+
+    def test_scoped_to_workspace(self, repo):
+        repo.save(make_report(description="hiring freeze", workspace_id="W999999"))
+
+        assert repo.search("W123456", "hiring") == []
+
+    def test_limit_and_offset(self, repo):
+        reports = [make_report(i, description=f"roadmap item {i}") for i in range(5)]
+        repo.save_many(reports)
+
+        newest_first = reports[::-1]
+        assert repo.search("W123456", "roadmap", limit=2) == newest_first[:2]
+        assert repo.search("W123456", "roadmap", limit=2, offset=2) == newest_first[2:4]
+        assert repo.search("W123456", "roadmap", limit=2, offset=4) == newest_first[4:]
+
+
+class TestSQLiteFullTextIndex:
+    def test_triggers_follow_updates_and_deletes(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            repo = SQLiteReportRepository(str(db_path))
+            edited = make_report(description="original wording")
+            removed = make_report(description="soon removed")
+            repo.save_many([edited, removed])
+
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(
+                "UPDATE reports SET description = 'rewritten text' WHERE id = ?", (str(edited.id),)
+            )
+            conn.execute("DELETE FROM reports WHERE id = ?", (str(removed.id),))
+            conn.commit()
+            conn.close()
+
+            assert repo.search("W123456", "original") == []
+            assert [r.id for r in repo.search("W123456", "rewritten")] == [edited.id]
+            assert repo.search("W123456", "removed") == []
+            repo.close()
+
+    def test_existing_rows_are_indexed_on_upgrade(self):
+        from repositories.sqlite_migrations import MIGRATIONS
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL)")
+            for version, statements in MIGRATIONS[:2]:
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+            report = make_report(description="legacy report text")
+            conn.execute(
+                "INSERT INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                (str(report.id), report.user_id, report.workspace_id,
+                 report.report_type.value, report.description, report.timestamp.isoformat())
+            )
+            conn.commit()
+            conn.close()
+
+            repo = SQLiteReportRepository(str(db_path))
+
+            assert repo.search("W123456", "legacy") == [report]
+            repo.close()
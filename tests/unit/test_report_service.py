@@ -4,6 +4,7 @@ from datetime import datetime, UTC
 from uuid import UUID
 from models.report import Report, ReportType
 from repositories.report_repository import ReportRepository
+from tests.factories import make_report
 
 
 class TestReportService:
@@ -57,7 +58,7 @@ class TestReportService:
         
         result = service.get_workspace_reports("W123456")
         
-        mock_repository.find_by_workspace.assert_called_once_with("W123456")
+        mock_repository.find_by_workspace.assert_called_once_with("W123456", None, None)
         assert result == mock_reports
     
     def test_get_user_reports(self):
@@ -85,40 +86,24 @@ class TestReportService:
         
         result = service.get_user_reports("U123456")
         
-        mock_repository.find_by_user.assert_called_once_with("U123456")
+        mock_repository.find_by_user.assert_called_once_with("U123456", None, None)
         assert result == mock_reports
     
     def test_get_workspace_summary(self):
         from services.report_service import ReportService
         
-        mock_reports = [
-            Report(
-                user_id="U123456",
-                workspace_id="W123456",
-                report_type=ReportType.LACKED_AUTHORITY,
-                description="Report 1"
-            ),
-            Report(
-                user_id="U789012",
-                workspace_id="W123456",
-                report_type=ReportType.EXPECTED_INITIATIVE,
-                description="Report 2"
-            ),
-            Report(
-                user_id="U345678",
-                workspace_id="W123456",
-                report_type=ReportType.LACKED_AUTHORITY,
-                description="Report 3"
-            )
-        ]
-        
         mock_repository = Mock(spec=ReportRepository)
-        mock_repository.find_by_workspace.return_value = mock_reports
+        mock_repository.count_by_type.return_value = {
+            ReportType.LACKED_AUTHORITY: 2,
+            ReportType.EXPECTED_INITIATIVE: 1
+        }
         
         service = ReportService(mock_repository)
         
         summary = service.get_workspace_summary("W123456")
         
+        mock_repository.count_by_type.assert_called_once_with("W123456", None)
+        mock_repository.find_by_workspace.assert_not_called()
         assert summary["total_reports"] == 3
         assert summary["lacked_authority_count"] == 2
         assert summary["expected_initiative_count"] == 1
@@ -158,4 +143,109 @@ class TestReportService:
         assert formatted[2]["type"] == "section"
         assert "Expected Initiative" in formatted[2]["text"]["text"]
         assert "<@U789012>" in formatted[2]["text"]["text"]
-        assert "Team member didn't fix obvious bug" in formatted[2]["text"]["text"]
\ No newline at end of file
+        assert "Team member didn't fix obvious bug" in formatted[2]["text"]["text"]
+    
+    def test_create_reports_delegates_to_save_many(self):
+        from services.report_service import ReportService
+        
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Imported report"
+            )
+        ]
+        
+        mock_repository = Mock(spec=ReportRepository)
+        mock_repository.save_many.return_value = reports
+        
+        service = ReportService(mock_repository)
+        
+        result = service.create_reports(reports)
+        
+        mock_repository.save_many.assert_called_once_with(reports)
+        assert result == reports
+    
+    def test_get_workspace_reports_page(self):
+        from services.report_service import ReportService
+        from models.pagination import ReportCursor, ReportPage
+        
+        page = ReportPage()
+        cursor = ReportCursor(timestamp=datetime.now(UTC), id=UUID(int=1))
+        
+        mock_repository = Mock(spec=ReportRepository)
+        mock_repository.find_page_by_workspace.return_value = page
+        
+        service = ReportService(mock_repository)
+        
+        result = service.get_workspace_reports_page("W123456", limit=5, before=cursor)
+        
+        mock_repository.find_page_by_workspace.assert_called_once_with(
+            "W123456", 5, before=cursor, after=None, since=None
+        )
+        assert result is page
+
+
+class TestRenderedReportCache:
+    def test_repeated_listings_reuse_rendered_text(self):
+        from unittest.mock import patch
+        from services.report_service import ReportService
+        
+        service = ReportService(Mock(spec=ReportRepository))
+        reports = [make_report(i) for i in range(3)]
+        
+        first = service.format_reports_for_slack(reports)
+        with patch("services.report_service.render_report_text") as render:
+            second = service.format_reports_for_slack(reports)
+        
+        render.assert_not_called()
+        assert second == first
+        assert second[0] is not first[0]
+    
+    def test_locales_are_cached_separately(self):
+        from services.report_service import ReportService
+        
+        service = ReportService(Mock(spec=ReportRepository))
+        report = make_report()
+        
+        service.format_reports_for_slack([report], locale="en_US")
+        service.format_reports_for_slack([report], locale="es_ES")
+        service.format_reports_for_slack([report], locale="es_ES")
+        
+        assert len(service._render_cache) == 2
+        assert service._render_cache.hits == 1
+    
+    def test_create_report_prefills_cache(self):
+        from services.report_service import ReportService
+        
+        mock_repository = Mock(spec=ReportRepository)
+        mock_repository.save.side_effect = lambda report: report
+        service = ReportService(mock_repository)
+        
+        report = service.create_report("U123456", "W123456", ReportType.EXPECTED_INITIATIVE, "Fixed it")
+        blocks = service.format_reports_for_slack([report])
+        
+        assert service._render_cache.hits == 1
+        assert "Expected Initiative" in blocks[0]["text"]["text"]
+    
+    def test_cache_is_bounded(self):
+        from services.report_service import ReportService
+        
+        service = ReportService(Mock(spec=ReportRepository), render_cache_size=2)
+        reports = [make_report(i) for i in range(3)]
+        
+        service.format_reports_for_slack(reports)
+        service.format_reports_for_slack(reports[:1])
+        
+        assert len(service._render_cache) == 2
+        assert service._render_cache.hits == 0
+    
+    def test_cache_can_be_disabled(self):
+        from services.report_service import ReportService
+        
+        service = ReportService(Mock(spec=ReportRepository), render_cache_size=0)
+        reports = [make_report()]
+        
+        assert service.format_reports_for_slack(reports) == service.format_reports_for_slack(reports)
+        assert len(service._render_cache) == 0
@@ -0,0 +1,138 @@
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone, UTC
+from unittest.mock import patch
+import pytest
+from tests.factories import make_report
+
+
+def skewed_reports(count, seed=5):
+    """A few heavy reporters and a long tail of occasional ones."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    users = [f"U{i:04d}" for i in range(2000)]
+    weights = [1000 // (i + 1) + 1 for i in range(len(users))]
+    return [
+        make_report(user_id=user_id, timestamp=start + timedelta(minutes=rng.randrange(60 * 24 * 90)))
+        for user_id in rng.choices(users, weights, k=count)
+    ]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        from repositories.report_repository import InMemoryReportRepository
+        yield InMemoryReportRepository()
+    else:
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        repo = SQLiteReportRepository(str(tmp_path / "reports.db"))
+        yield repo
+        repo.close()
+
+
+class TestCountMinSketch:
+    def test_never_undercounts(self):
+        from services.report_statistics import CountMinSketch
+
+        sketch = CountMinSketch(width=64, depth=3)
+        counts = Counter(report.user_id for report in skewed_reports(3000))
+        for user_id, count in counts.items():
+            sketch.add(user_id, count)
+
+        errors = [sketch.estimate(user_id) - count for user_id, count in counts.items()]
+        assert min(errors) >= 0
+        # Each row overcounts by n/w on average; the minimum over rows by less
+        assert sum(errors) / len(errors) <= 3000 / 64
+
+    def test_rejects_empty_sketch(self):
+        from services.report_statistics import CountMinSketch
+
+        with pytest.raises(ValueError):
+            CountMinSketch(width=0)
+
+
+class TestReporterStatistics:
+    def test_exact_top_k_and_heatmap(self):
+        from services.report_statistics import compute_reporter_statistics
+
+        reports = skewed_reports(2000)
+        counts = Counter(report.user_id for report in reports)
+
+        statistics = compute_reporter_statistics(iter(reports), top_k=3)
+
+        assert statistics.total_reports == 2000
+        assert statistics.top_reporters == sorted(counts.items(), key=lambda p: (-p[1], p[0]))[:3]
+        assert not statistics.approximate
+        for weekday in range(7):
+            for hour in (0, 13):
+                assert statistics.heatmap[weekday][hour] == sum(
+                    1 for r in reports if r.timestamp.weekday() == weekday and r.timestamp.hour == hour
+                )
+
+    def test_approximate_mode_finds_the_heavy_reporters(self):
+        from services.report_statistics import compute_reporter_statistics
+
+        reports = skewed_reports(20000)
+        exact = compute_reporter_statistics(reports, top_k=3)
+
+        approximate = compute_reporter_statistics(reports, top_k=3, approximate=True)
+
+        assert approximate.approximate
+        assert [user for user, _ in approximate.top_reporters] == [user for user, _ in exact.top_reporters]
+        assert all(
+            estimate >= count
+            for (_, estimate), (_, count) in zip(approximate.top_reporters, exact.top_reporters)
+        )
+        assert approximate.heatmap == exact.heatmap
+
+    def test_heatmap_uses_utc(self):
+        from services.report_statistics import compute_reporter_statistics
+
+        # Tuesday 01:00 at +05:00 is Monday 20:00 UTC
+        statistics = compute_reporter_statistics([
+            make_report(user_id="U1", timestamp=datetime(2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=5))))
+        ])
+
+        assert statistics.heatmap[0][20] == 1
+        assert statistics.busiest_slot() == (0, 20, 1)
+
+    def test_empty_stream(self):
+        from services.report_statistics import compute_reporter_statistics
+
+        statistics = compute_reporter_statistics([])
+
+        assert statistics.top_reporters == []
+        assert statistics.busiest_slot() is None
+
+
+class TestServiceStatistics:
+    def test_streams_the_workspace_window(self, repository):
+        from services.report_service import ReportService
+
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        repository.save_many([
+            make_report(user_id="U1", timestamp=start),
+            make_report(user_id="U2", timestamp=start + timedelta(days=1)),
+            make_report(user_id="U2", timestamp=start + timedelta(days=2)),
+            make_report(user_id="U3", timestamp=start + timedelta(days=2), workspace_id="W2"),
+        ])
+        service = ReportService(repository)
+
+        everything = service.get_reporter_statistics("W123456")
+        recent = service.get_reporter_statistics("W123456", since=start + timedelta(days=1))
+
+        assert everything.top_reporters == [("U2", 2), ("U1", 1)]
+        assert recent.top_reporters == [("U2", 2)]
+        assert recent.total_reports == 2
+        assert not everything.approximate
+
+    def test_large_workspaces_switch_to_approximate(self, repository):
+        from services.report_service import ReportService
+
+        repository.save_many([make_report(user_id="U1", timestamp=datetime(2024, 1, 1, tzinfo=UTC)) for _ in range(3)])
+
+        with patch("services.report_service.DEFAULT_APPROXIMATE_THRESHOLD", 2):
+            statistics = ReportService(repository).get_reporter_statistics("W123456")
+
+        assert statistics.approximate
+        assert statistics.top_reporters == [("U1", 3)]
@@ -5,11 +5,26 @@ from typing import List, Optional
 from models.report import Report, ReportType
 
 
-class TestReportRepository:
-    def test_save_report(self):
+@pytest.fixture(params=["memory", "sqlite", "sqlalchemy"])
+def repo(request):
+    """Every ReportRepository backend must satisfy the tests taking this fixture."""
+    if request.param == "memory":
         from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
+        yield InMemoryReportRepository()
+    elif request.param == "sqlite":
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        repository = SQLiteReportRepository(":memory:")
+        yield repository
+        repository.close()
+    else:
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+        repository = SQLAlchemyReportRepository("sqlite://")
+        yield repository
+        repository.close()
+
+
+class TestReportRepository:
+    def test_save_report(self, repo):
         report = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -22,10 +37,7 @@ class TestReportRepository:
         assert saved_report == report
         assert saved_report.id == report.id
     
-    def test_find_by_id(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
+    def test_find_by_id(self, repo):
         report = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -38,21 +50,14 @@ class TestReportRepository:
         
         assert found_report == report
     
-    def test_find_by_id_not_found(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
+    def test_find_by_id_not_found(self, repo):
         non_existent_id = UUID("550e8400-e29b-41d4-a716-446655440000")
         
         found_report = repo.find_by_id(non_existent_id)
         
         assert found_report is None
     
-    def test_find_by_workspace(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
-        
+    def test_find_by_workspace(self, repo):
         report1 = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -83,11 +88,7 @@ class TestReportRepository:
         assert report2 in workspace_reports
         assert report3 not in workspace_reports
     
-    def test_find_by_user(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
-        
+    def test_find_by_user(self, repo):
         report1 = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -118,11 +119,7 @@ class TestReportRepository:
         assert report2 in user_reports
         assert report3 not in user_reports
     
-    def test_find_by_type(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
-        
+    def test_find_by_type(self, repo):
         report1 = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -153,11 +150,7 @@ class TestReportRepository:
         assert report3 in authority_reports
         assert report2 not in authority_reports
     
-    def test_find_by_workspace_and_type(self):
-        from repositories.report_repository import InMemoryReportRepository
-        
-        repo = InMemoryReportRepository()
-        
+    def test_find_by_workspace_and_type(self, repo):
         report1 = Report(
             user_id="U123456",
             workspace_id="W123456",
@@ -189,4 +182,185 @@ class TestReportRepository:
         assert len(filtered_reports) == 2
         assert report1 in filtered_reports
         assert report3 in filtered_reports
-        assert report2 not in filtered_reports
\ No newline at end of file
+        assert report2 not in filtered_reports
+    
+    def test_save_many(self, repo):
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description=f"Report {i}"
+            )
+            for i in range(3)
+        ]
+        
+        saved_reports = repo.save_many(iter(reports))
+        
+        assert saved_reports == reports
+        assert all(repo.find_by_id(report.id) == report for report in reports)
+    
+    def test_lookups_are_ordered_by_timestamp(self, repo):
+        from datetime import timedelta
+        
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description=f"Report {day}",
+                timestamp=base + timedelta(days=day)
+            )
+            for day in (3, 1, 2)
+        ]
+        for report in reports:
+            repo.save(report)
+        
+        expected = sorted(reports, key=lambda r: r.timestamp)
+        
+        assert repo.find_by_workspace("W123456") == expected
+        assert repo.find_by_user("U123456") == expected
+        assert repo.find_by_type(ReportType.LACKED_AUTHORITY) == expected
+        assert repo.find_by_workspace_and_type(
+            "W123456", ReportType.LACKED_AUTHORITY
+        ) == expected
+    
+    def test_resaving_report_updates_indexes(self):
+        from repositories.report_repository import InMemoryReportRepository
+        from dataclasses import replace
+        
+        repo = InMemoryReportRepository()
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Original"
+        )
+        repo.save(report)
+        
+        updated = replace(report, report_type=ReportType.EXPECTED_INITIATIVE)
+        repo.save(updated)
+        
+        assert repo.find_by_workspace("W123456") == [updated]
+        assert repo.find_by_type(ReportType.LACKED_AUTHORITY) == []
+        assert repo.find_by_type(ReportType.EXPECTED_INITIATIVE) == [updated]
+    
+    def test_lookup_results_are_independent_copies(self, repo):
+        repo.save(Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Report"
+        ))
+        
+        repo.find_by_workspace("W123456").clear()
+        
+        assert len(repo.find_by_workspace("W123456")) == 1
+        assert repo.find_by_workspace("W000000") == []
+    
+    def test_find_page_by_workspace_walks_keyset(self, repo):
+        from datetime import timedelta
+        
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description=f"Report {i}",
+                timestamp=base + timedelta(hours=i)
+            )
+            for i in range(5)
+        ]
+        repo.save_many(reports)
+        repo.save(Report(
+            user_id="U123456",
+            workspace_id="W789012",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Other workspace"
+        ))
+        
+        first = repo.find_page_by_workspace("W123456", limit=2)
+        assert first.reports == [reports[4], reports[3]]
+        assert not first.has_newer and first.has_older
+        
+        second = repo.find_page_by_workspace("W123456", limit=2, before=first.older_cursor)
+        assert second.reports == [reports[2], reports[1]]
+        assert second.has_newer and second.has_older
+        
+        last = repo.find_page_by_workspace("W123456", limit=2, before=second.older_cursor)
+        assert last.reports == [reports[0]]
+        assert last.has_newer and not last.has_older
+        
+        back = repo.find_page_by_workspace("W123456", limit=2, after=last.newer_cursor)
+        assert back.reports == [reports[2], reports[1]]
+        assert back.has_newer and back.has_older
+    
+    def test_iter_by_workspace_streams_in_order(self, repo):
+        from datetime import timedelta
+        
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description=f"Report {i}",
+                timestamp=base + timedelta(minutes=i)
+            )
+            for i in range(7)
+        ]
+        repo.save_many(reversed(reports))
+        
+        iterator = repo.iter_by_workspace("W123456", chunk_size=3)
+        
+        assert next(iterator) == reports[0]
+        # Reports saved mid-iteration after the current position still show up
+        late = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Late report",
+            timestamp=base + timedelta(days=1)
+        )
+        repo.save(late)
+        
+        assert list(iterator) == reports[1:] + [late]
+    
+    def test_count_by_type(self):
+        from repositories.report_repository import InMemoryReportRepository
+        from dataclasses import replace
+        
+        repo = InMemoryReportRepository()
+        authority = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Report 1"
+        )
+        repo.save(authority)
+        repo.save(Report(
+            user_id="U789012",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Report 2"
+        ))
+        repo.save(Report(
+            user_id="U789012",
+            workspace_id="W789012",
+            report_type=ReportType.EXPECTED_INITIATIVE,
+            description="Other workspace"
+        ))
+        # Re-saving with a new type moves the report between counters
+        repo.save(replace(authority, report_type=ReportType.EXPECTED_INITIATIVE))
+        
+        assert repo.count_by_type("W123456") == {
+            ReportType.LACKED_AUTHORITY: 1,
+            ReportType.EXPECTED_INITIATIVE: 1
+        }
+        assert repo.count_by_type("W000000") == {
+            ReportType.LACKED_AUTHORITY: 0,
+            ReportType.EXPECTED_INITIATIVE: 0
+        }
@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+
+@pytest.fixture
+def repo(tmp_path):
+    from repositories.sharded_sqlite_repository import ShardedSQLiteReportRepository
+
+    repository = ShardedSQLiteReportRepository(str(tmp_path / "shards"), max_open_shards=2)
+    yield repository
+    repository.close()
+
+
+class TestShardedSQLiteReportRepository:
+    def test_routes_each_workspace_to_its_own_file(self, repo):
+        repo.save(make_report(0, workspace_id="W1"))
+        repo.save_many([make_report(1, workspace_id="W2"), make_report(2, workspace_id="T/odd id")])
+
+        assert repo.workspace_ids() == ["T/odd id", "W1", "W2"]
+        assert repo.shard_path("T/odd id").parent == repo.directory
+        assert [r.description for r in repo.find_by_workspace("W2")] == ["Report 1"]
+        assert [r.description for r in repo.find_by_workspace("T/odd id")] == ["Report 2"]
+
+    def test_reads_do_not_create_shards(self, repo):
+        assert repo.find_by_workspace("W404") == []
+        assert repo.find_page_by_workspace("W404", 10).reports == []
+        assert repo.count_by_type("W404") == {
+            ReportType.LACKED_AUTHORITY: 0, ReportType.EXPECTED_INITIATIVE: 0
+        }
+        assert list(repo.iter_by_workspace("W404")) == []
+        assert repo.workspace_ids() == []
+
+    def test_cross_workspace_queries_merge_by_timestamp(self, repo):
+        reports = [
+            make_report(i, workspace_id=f"W{i % 3}", user_id="U1" if i % 2 else "U2",
+                        report_type=ReportType.EXPECTED_INITIATIVE if i % 4 else ReportType.LACKED_AUTHORITY)
+            for i in range(12)
+        ]
+        repo.save_many(reversed(reports))
+
+        assert repo.find_by_user("U1") == [r for r in reports if r.user_id == "U1"]
+        assert repo.find_by_type(ReportType.LACKED_AUTHORITY) == [
+            r for r in reports if r.report_type == ReportType.LACKED_AUTHORITY
+        ]
+        since = reports[6].timestamp
+        assert repo.find_by_user("U2", since=since) == [
+            r for r in reports[6:] if r.user_id == "U2"
+        ]
+        assert repo.find_by_id(reports[7].id) == reports[7]
+        assert repo.find_by_id(uuid4()) is None
+
+    def test_id_lookups_open_only_the_shards_holding_them(self, tmp_path):
+        from repositories.sharded_sqlite_repository import INDEX_FILE, ShardedSQLiteReportRepository
+
+        directory = tmp_path / "shards"
+        reports = [make_report(i, workspace_id=f"W{i}") for i in range(5)]
+        repo = ShardedSQLiteReportRepository(str(directory))
+        repo.save_many(reports)
+        repo.close()
+
+        repo = ShardedSQLiteReportRepository(str(directory))
+        assert repo.find_by_id(reports[3].id) == reports[3]
+        assert repo.open_shard_count == 1
+        found = repo.find_by_ids([reports[0].id, reports[4].id, uuid4()])
+        assert sorted(found, key=lambda r: r.timestamp) == [reports[0], reports[4]]
+        assert repo.open_shard_count == 3
+        repo.close()
+
+        # Shards that predate the index are indexed on open
+        (directory / INDEX_FILE).unlink()
+        repo = ShardedSQLiteReportRepository(str(directory))
+        assert repo.workspace_ids() == [f"W{i}" for i in range(5)]
+        assert repo.find_by_id(reports[2].id) == reports[2]
+        repo.close()
+
+    def test_open_shards_are_bounded(self, repo):
+        for i in range(5):
+            repo.save(make_report(i, workspace_id=f"W{i}"))
+
+        assert repo.open_shard_count == 2
+        # Evicted shards reopen transparently
+        assert len(repo.find_by_user("U123456")) == 5
+        assert repo.open_shard_count == 2
+
+    def test_open_connections_are_bounded(self, repo):
+        from repositories.sharded_sqlite_repository import DEFAULT_MAX_CONNECTIONS_PER_SHARD
+
+        def request(n):
+            workspace_id = f"W{n % 3}"
+            repo.save(make_report(n, workspace_id=workspace_id))
+            return len(repo.find_by_workspace(workspace_id))
+
+        # Every request runs on a fresh thread, as a thread-per-request server would
+        for n in range(30):
+            thread = threading.Thread(target=request, args=(n,))
+            thread.start()
+            thread.join()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(request, range(30, 60)))
+        assert len(repo.find_by_user("U123456")) == 60
+
+        assert repo.open_connection_count <= repo.open_shard_count * DEFAULT_MAX_CONNECTIONS_PER_SHARD
+
+    def test_shard_evicted_mid_stream_stays_usable(self, repo):
+        repo.save_many([make_report(i, workspace_id="W1") for i in range(10)])
+
+        stream = repo.iter_by_workspace("W1", chunk_size=2)
+        first = next(stream)
+        for i in range(3):
+            repo.save(make_report(i, workspace_id=f"X{i}"))
+
+        assert [first, *stream] == repo.find_by_workspace("W1")
+
+    def test_concurrent_writers_in_different_workspaces(self, repo):
+        def write(workspace_id):
+            for i in range(20):
+                repo.save(make_report(i, workspace_id=workspace_id))
+
+        threads = [threading.Thread(target=write, args=(f"W{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [len(repo.find_by_workspace(f"W{n}")) for n in range(4)] == [20] * 4
@@ -0,0 +1,124 @@
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, UTC
+from pathlib import Path
+import pytest
+from models.report import Report, ReportType
+from tests.factories import make_report
+
+
+@pytest.fixture(params=["memory", "file"])
+def repo(request):
+    from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+
+    if request.param == "memory":
+        repository = SQLAlchemyReportRepository("sqlite://")
+        yield repository
+        repository.close()
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repository = SQLAlchemyReportRepository(
+                f"sqlite:///{Path(temp_dir) / 'test.db'}", pool_size=2, max_overflow=2
+            )
+            yield repository
+            repository.close()
+
+
+class TestSQLAlchemyReportRepository:
+    def test_timestamps_round_trip_as_utc(self, repo):
+        local = timezone(timedelta(hours=-3))
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.EXPECTED_INITIATIVE,
+            description="Filed from Buenos Aires",
+            timestamp=datetime(2024, 6, 1, 9, 30, 15, 123456, tzinfo=local)
+        )
+        repo.save(report)
+
+        found = repo.find_by_id(report.id)
+
+        assert found == report
+        assert found.timestamp.tzinfo == UTC
+
+    def test_save_many_in_batches(self, repo):
+        reports = [make_report(i) for i in range(7)]
+
+        assert repo.save_many(iter(reports), batch_size=3) == reports
+        assert repo.find_by_workspace("W123456") == reports
+
+    def test_search_filters_in_sql(self, repo):
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(
+            repo.engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+        match = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Needed sign-off on the Café budget"
+        )
+        repo.save_many([match, make_report(1), make_report(2)])
+
+        assert repo.search("W123456", "cafe BUDGET") == [match]
+        assert repo.search("W123456", "caf_") == []
+        assert "LIKE" in statements[-1]
+
+    def test_search_text_is_added_to_older_tables(self, tmp_path):
+        import sqlite3
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+
+        url = f"sqlite:///{tmp_path / 'old.db'}"
+        repository = SQLAlchemyReportRepository(url)
+        reports = [make_report(i, description=f"Café budget {i}") for i in range(3)]
+        repository.save_many(reports)
+        repository.close()
+        conn = sqlite3.connect(str(tmp_path / "old.db"))
+        conn.execute("ALTER TABLE reports DROP COLUMN search_text")
+        conn.close()
+
+        repository = SQLAlchemyReportRepository(url, batch_size=2)
+
+        assert repository.search("W123456", "cafe 2") == [reports[2]]
+        assert len(repository.search("W123456", "budget")) == 3
+        repository.close()
+
+    def test_concurrent_saves(self, repo):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(repo.save, [make_report(i) for i in range(20)]))
+
+        assert len(repo.find_by_workspace("W123456")) == 20
+
+
+class TestSQLAlchemyEngine:
+    def test_file_engine_uses_queue_pool_with_wal(self):
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+        from sqlalchemy.pool import QueuePool
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = SQLAlchemyReportRepository(
+                f"sqlite:///{Path(temp_dir) / 'test.db'}", pool_size=3, max_overflow=1
+            )
+
+            assert isinstance(repo.engine.pool, QueuePool)
+            assert repo.engine.pool.size() == 3
+            with repo.engine.connect() as conn:
+                assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            repo.close()
+
+    def test_accepts_existing_engine(self):
+        from repositories.sqlalchemy_report_repository import (
+            SQLAlchemyReportRepository,
+            create_report_engine,
+        )
+
+        engine = create_report_engine("sqlite://")
+        repo = SQLAlchemyReportRepository(engine)
+        report = make_report(1)
+        repo.save(report)
+
+        assert repo.engine is engine
+        assert SQLAlchemyReportRepository(engine).find_by_id(report.id) == report
@@ -0,0 +1,138 @@
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta, timezone, UTC
+from pathlib import Path
+from uuid import uuid4
+from models.report import Report, ReportType
+from tests.factories import START, make_report
+
+
+class TestCompactRowCodec:
+    def test_round_trip(self):
+        from repositories.sqlite_codecs import COMPACT_CODEC
+
+        report = make_report(3, report_type=ReportType.EXPECTED_INITIATIVE)
+        row = COMPACT_CODEC.encode(report)
+
+        assert isinstance(row[0], bytes) and len(row[0]) == 16
+        assert isinstance(row[3], int)
+        assert isinstance(row[5], int)
+        assert COMPACT_CODEC.decode(row) == report
+
+    def test_normalizes_timestamps_to_utc(self):
+        from repositories.sqlite_codecs import COMPACT_CODEC
+
+        local = timezone(timedelta(hours=2))
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Offset timestamp",
+            timestamp=datetime(2024, 3, 1, 12, 0, 0, 999999, tzinfo=local)
+        )
+
+        decoded = COMPACT_CODEC.decode(COMPACT_CODEC.encode(report))
+
+        assert decoded == report
+        assert decoded.timestamp.tzinfo == UTC
+
+    def test_encodings_preserve_order(self):
+        from repositories.sqlite_codecs import COMPACT_CODEC
+
+        ids = sorted(uuid4() for _ in range(50))
+        assert sorted(ids, key=COMPACT_CODEC.encode_id) == ids
+
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        timestamps = [base + timedelta(microseconds=i) for i in (5, 1, 3)]
+        assert sorted(timestamps, key=COMPACT_CODEC.encode_timestamp) == sorted(timestamps)
+
+
+class TestSQLiteCompactLayout:
+    def test_new_compact_database(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            repo = SQLiteReportRepository(str(db_path), compact=True)
+            report = make_report(1)
+            repo.save(report)
+
+            assert repo.layout == "compact"
+            conn = sqlite3.connect(str(db_path))
+            row = conn.execute("SELECT id, report_type, timestamp FROM reports").fetchone()
+            conn.close()
+            assert row == (report.id.bytes, 1, int(report.timestamp.timestamp()) * 1_000_000)
+
+    def test_compact_queries_match_text_layout(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        # Pairs of reports share a timestamp, so ties are ordered by id
+        reports = [
+            make_report(i, user_id=f"U{i % 2}", timestamp=START + timedelta(minutes=i // 2))
+            for i in range(6)
+        ]
+        reports.append(make_report(7, report_type=ReportType.EXPECTED_INITIATIVE))
+        reports.append(make_report(8, workspace_id="W789012"))
+        text = SQLiteReportRepository(":memory:")
+        compact = SQLiteReportRepository(":memory:", compact=True)
+        text.save_many(reports)
+        compact.save_many(reports)
+
+        for repo in (text, compact):
+            assert repo.find_by_id(reports[0].id) == reports[0]
+        assert compact.find_by_workspace("W123456") == text.find_by_workspace("W123456")
+        assert compact.find_by_user("U1") == text.find_by_user("U1")
+        assert compact.find_by_type(ReportType.EXPECTED_INITIATIVE) == [reports[6]]
+        assert compact.find_by_workspace_and_type(
+            "W123456", ReportType.LACKED_AUTHORITY
+        ) == text.find_by_workspace_and_type("W123456", ReportType.LACKED_AUTHORITY)
+        assert compact.count_by_type("W123456") == text.count_by_type("W123456")
+        assert list(compact.iter_by_workspace("W123456", chunk_size=2)) == text.find_by_workspace("W123456")
+
+        compact_page = compact.find_page_by_workspace("W123456", 3)
+        text_page = text.find_page_by_workspace("W123456", 3)
+        assert compact_page == text_page
+        assert compact.find_page_by_workspace(
+            "W123456", 3, before=compact_page.older_cursor
+        ) == text.find_page_by_workspace("W123456", 3, before=text_page.older_cursor)
+
+    def test_existing_text_database_migrates_in_place(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "test.db")
+            reports = [make_report(i) for i in range(10)]
+            text = SQLiteReportRepository(db_path)
+            text.save_many(reports)
+            text.close()
+
+            compact = SQLiteReportRepository(db_path, compact=True)
+
+            assert compact.layout == "compact"
+            assert compact.find_by_workspace("W123456") == text_sorted(reports)
+            conn = sqlite3.connect(db_path)
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='reports' "
+                    "AND sql IS NOT NULL"
+                )
+            }
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            conn.close()
+            assert indexes == {
+                "idx_reports_workspace_timestamp",
+                "idx_reports_workspace_type_timestamp",
+                "idx_reports_type_timestamp",
+                "idx_reports_user_timestamp",
+            }
+            assert "reports_text_layout" not in tables
+            compact.close()
+
+            # Reopening without the flag keeps reading the compact layout
+            reopened = SQLiteReportRepository(db_path)
+            assert reopened.layout == "compact"
+            assert len(reopened.find_by_workspace("W123456")) == 10
+
+
+def text_sorted(reports):
+    return sorted(reports, key=lambda r: (r.timestamp, r.id))
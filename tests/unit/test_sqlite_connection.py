@@ -0,0 +1,155 @@
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from models.report import Report, ReportType
+
+
+class TestSQLiteConnectionPool:
+    def test_file_connections_use_wal_and_pragmas(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pool = SQLiteConnectionPool(
+                str(Path(temp_dir) / "test.db"),
+                busy_timeout_ms=1234,
+                cache_size_kib=2048,
+                mmap_size=1024 * 1024
+            )
+
+            with pool.connection() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+                assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+                assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2048
+
+            pool.close()
+
+    def test_same_thread_reuses_connection(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pool = SQLiteConnectionPool(str(Path(temp_dir) / "test.db"))
+
+            with pool.connection() as first:
+                pass
+            with pool.connection() as second:
+                pass
+
+            assert first is second
+            pool.close()
+
+    def test_each_thread_gets_its_own_connection(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pool = SQLiteConnectionPool(str(Path(temp_dir) / "test.db"))
+            seen = []
+
+            def grab():
+                with pool.connection() as conn:
+                    seen.append(id(conn))
+
+            threads = [threading.Thread(target=grab) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(set(seen)) == 3
+            pool.close()
+
+    def test_bounded_pool_shares_connections_between_threads(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pool = SQLiteConnectionPool(str(Path(temp_dir) / "test.db"), max_connections=2)
+
+            def grab(_):
+                with pool.connection() as conn:
+                    # Nested use on the same thread must not take a second slot
+                    with pool.connection() as nested:
+                        assert nested is conn
+                    return conn.execute("SELECT 1").fetchone()[0]
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                assert sum(executor.map(grab, range(50))) == 50
+            # Threads that have finished leave their connections behind for reuse
+            for _ in range(5):
+                thread = threading.Thread(target=grab, args=(None,))
+                thread.start()
+                thread.join()
+
+            assert 1 <= pool.open_connection_count <= 2
+            pool.close()
+            assert pool.open_connection_count == 0
+
+    def test_memory_database_shares_one_connection(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        pool = SQLiteConnectionPool(":memory:")
+        seen = []
+
+        def grab():
+            with pool.connection() as conn:
+                seen.append(conn)
+
+        thread = threading.Thread(target=grab)
+        thread.start()
+        thread.join()
+        grab()
+
+        assert seen[0] is seen[1]
+        pool.close()
+
+    def test_closed_pool_refuses_connections(self):
+        from repositories.sqlite_connection import SQLiteConnectionPool
+
+        pool = SQLiteConnectionPool(":memory:")
+        pool.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            with pool.connection():
+                pass
+
+
+class TestSQLiteRepositoryConcurrency:
+    def test_concurrent_writes_and_reads_from_threads(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = SQLiteReportRepository(str(Path(temp_dir) / "test.db"))
+
+            def write(i):
+                repo.save(Report(
+                    user_id=f"U{i}",
+                    workspace_id="W123456",
+                    report_type=ReportType.LACKED_AUTHORITY,
+                    description=f"Report {i}"
+                ))
+                return len(repo.find_by_workspace("W123456"))
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(write, range(50)))
+
+            assert len(repo.find_by_workspace("W123456")) == 50
+            repo.close()
+
+    def test_failed_write_is_rolled_back(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        repo = SQLiteReportRepository(":memory:")
+        report = Report(
+            user_id="U123456",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Saved once"
+        )
+        repo.save(report)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save(report)
+
+        assert repo.find_by_workspace("W123456") == [report]
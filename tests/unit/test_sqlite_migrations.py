@@ -0,0 +1,116 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+from datetime import datetime, UTC
+from models.report import Report, ReportType
+
+
+class TestSQLiteMigrations:
+    def test_fresh_database_is_at_latest_version(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        from repositories.sqlite_migrations import LATEST_VERSION
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            SQLiteReportRepository(str(db_path))
+
+            conn = sqlite3.connect(str(db_path))
+            version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+            conn.close()
+
+            assert version == LATEST_VERSION
+
+    def test_indexes_are_created(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            SQLiteReportRepository(str(db_path))
+
+            conn = sqlite3.connect(str(db_path))
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='reports'"
+                )
+            }
+            conn.close()
+
+            assert "idx_reports_workspace_timestamp" in indexes
+            assert "idx_reports_workspace_type_timestamp" in indexes
+            assert "idx_reports_user_timestamp" in indexes
+
+    def test_workspace_query_uses_index(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            SQLiteReportRepository(str(db_path))
+
+            conn = sqlite3.connect(str(db_path))
+            plan = " ".join(
+                row[-1] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM reports "
+                    "WHERE workspace_id = ? ORDER BY timestamp, id",
+                    ("W123456",)
+                )
+            )
+            conn.close()
+
+            assert "idx_reports_workspace" in plan
+            assert "SCAN reports" not in plan
+
+    def test_migrations_are_idempotent(self):
+        from repositories.sqlite_migrations import apply_migrations, LATEST_VERSION
+
+        conn = sqlite3.connect(":memory:")
+
+        assert apply_migrations(conn) == LATEST_VERSION
+        assert apply_migrations(conn) == LATEST_VERSION
+
+        rows = conn.execute("SELECT version FROM schema_version").fetchall()
+        assert len(rows) == LATEST_VERSION
+
+    def test_legacy_database_upgrades_in_place(self):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "legacy.db"
+            report = Report(
+                id=uuid4(),
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Saved before migrations existed",
+                timestamp=datetime.now(UTC)
+            )
+
+            # Layout created by the original, unversioned repository
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("""
+                CREATE TABLE reports (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    workspace_id TEXT NOT NULL,
+                    report_type TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT INTO reports VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    str(report.id),
+                    report.user_id,
+                    report.workspace_id,
+                    report.report_type.value,
+                    report.description,
+                    report.timestamp.isoformat()
+                )
+            )
+            conn.commit()
+            conn.close()
+
+            repo = SQLiteReportRepository(str(db_path))
+
+            assert repo.find_by_workspace("W123456") == [report]
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+import pytest
+from models.report import ReportType
+from tests.factories import make_report
+
+
+@pytest.fixture(params=[False, True], ids=["text", "compact"])
+def repo_and_reports(request, tmp_path):
+    from repositories.sqlite_report_repository import SQLiteReportRepository
+
+    repo = SQLiteReportRepository(str(tmp_path / "test.db"), compact=request.param)
+    reports = [
+        make_report(
+            i,
+            user_id=f"U{i % 2}",
+            report_type=ReportType.EXPECTED_INITIATIVE if i % 2 else ReportType.LACKED_AUTHORITY
+        )
+        for i in range(6)
+    ]
+    repo.save_many(reports)
+    yield repo, reports
+    repo.close()
+
+
+class TestReportView:
+    def test_full_views_match_reports(self, repo_and_reports):
+        repo, reports = repo_and_reports
+
+        views = list(repo.iter_views_by_workspace("W123456", chunk_size=4))
+
+        assert views == reports
+        assert [view.to_report() for view in views] == reports
+        assert views[2].to_dict() == reports[2].to_dict()
+
+    def test_fields_decode_lazily_once(self, repo_and_reports):
+        repo, reports = repo_and_reports
+        codec = type(repo._codec)
+
+        with patch.object(codec, "decode_id", wraps=repo._codec.decode_id) as decode_id, \
+                patch.object(codec, "decode_timestamp", wraps=repo._codec.decode_timestamp) as decode_timestamp:
+            views = list(repo.iter_views_by_workspace("W123456"))
+            assert [view.description for view in views] == [r.description for r in reports]
+            decode_id.assert_not_called()
+            decode_timestamp.assert_not_called()
+
+            assert views[0].timestamp == views[0].timestamp == reports[0].timestamp
+            assert decode_timestamp.call_count == 1
+
+    def test_projection_reads_only_selected_columns(self, repo_and_reports):
+        repo, reports = repo_and_reports
+
+        views = list(repo.iter_views_by_workspace(
+            "W123456", columns=("report_type", "description"), since=reports[3].timestamp
+        ))
+
+        assert [(v.report_type, v.description) for v in views] == [
+            (r.report_type, r.description) for r in reports[3:]
+        ]
+        with pytest.raises(AttributeError):
+            views[0].user_id
+
+    def test_rejects_unknown_columns(self, repo_and_reports):
+        repo, _ = repo_and_reports
+
+        with pytest.raises(ValueError):
+            list(repo.iter_views_by_workspace("W123456", columns=("description", "1; DROP TABLE reports")))
+
+    def test_views_render_like_reports(self, repo_and_reports):
+        from repositories.report_repository import InMemoryReportRepository
+        from services.report_service import ReportService
+
+        repo, reports = repo_and_reports
+        service = ReportService(InMemoryReportRepository())
+        views = list(repo.iter_views_by_workspace(
+            "W123456", columns=("user_id", "report_type", "description", "timestamp")
+        ))
+
+        assert service.format_reports_for_slack(views) == service.format_reports_for_slack(reports)
@@ -390,4 +390,208 @@ class TestSQLiteRepository:
         
         assert saved_report == report
         assert found_report is not None
-        assert found_report.id == report.id
\ No newline at end of file
+        assert found_report.id == report.id
+    
+    def test_save_many_persists_in_batches(self):
+        """Test that save_many stores every report, batch by batch."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            repo = SQLiteReportRepository(str(db_path), batch_size=2)
+            
+            reports = [
+                Report(
+                    user_id=f"U{i}",
+                    workspace_id="W123456",
+                    report_type=ReportType.EXPECTED_INITIATIVE,
+                    description=f"Backfilled report {i}"
+                )
+                for i in range(5)
+            ]
+            
+            saved_reports = repo.save_many(report for report in reports)
+            
+            assert saved_reports == reports
+            found_ids = {r.id for r in repo.find_by_workspace("W123456")}
+            assert found_ids == {r.id for r in reports}
+    
+    def test_save_many_rolls_back_failing_batch(self):
+        """Test that a failing batch leaves no partial rows behind."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        import sqlite3
+        
+        repo = SQLiteReportRepository(":memory:", batch_size=2)
+        
+        first = Report(
+            user_id="U111",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="First batch"
+        )
+        second = Report(
+            user_id="U222",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="First batch"
+        )
+        fresh = Report(
+            user_id="U333",
+            workspace_id="W123456",
+            report_type=ReportType.LACKED_AUTHORITY,
+            description="Second batch"
+        )
+        
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save_many([first, second, fresh, first])
+        
+        found_ids = {r.id for r in repo.find_by_workspace("W123456")}
+        assert found_ids == {first.id, second.id}
+    
+    def test_find_page_by_workspace_walks_keyset(self):
+        """Test that pages follow (timestamp, id) order in both directions."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        from datetime import datetime, timedelta, UTC
+        
+        repo = SQLiteReportRepository(":memory:")
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        reports = [
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description=f"Report {i}",
+                # Two reports share each timestamp so the id tie-break matters
+                timestamp=base + timedelta(hours=i // 2)
+            )
+            for i in range(5)
+        ]
+        repo.save_many(reports)
+        newest_first = sorted(reports, key=lambda r: (r.timestamp, r.id), reverse=True)
+        
+        first = repo.find_page_by_workspace("W123456", limit=2)
+        assert [r.id for r in first.reports] == [r.id for r in newest_first[:2]]
+        assert not first.has_newer and first.has_older
+        
+        second = repo.find_page_by_workspace("W123456", limit=2, before=first.older_cursor)
+        assert [r.id for r in second.reports] == [r.id for r in newest_first[2:4]]
+        assert second.has_newer and second.has_older
+        
+        last = repo.find_page_by_workspace("W123456", limit=2, before=second.older_cursor)
+        assert [r.id for r in last.reports] == [newest_first[4].id]
+        assert not last.has_older
+        
+        back = repo.find_page_by_workspace("W123456", limit=2, after=last.newer_cursor)
+        assert [r.id for r in back.reports] == [r.id for r in newest_first[2:4]]
+        assert back.has_newer and back.has_older
+    
+    def test_iter_by_workspace_streams_reports(self):
+        """Test that iter_by_workspace yields every report lazily and in order."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        from datetime import datetime, timedelta, UTC
+        import types
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = SQLiteReportRepository(str(Path(temp_dir) / "test.db"))
+            base = datetime(2024, 1, 1, tzinfo=UTC)
+            reports = [
+                Report(
+                    user_id="U123456",
+                    workspace_id="W123456" if i % 2 else "W789012",
+                    report_type=ReportType.LACKED_AUTHORITY,
+                    description=f"Report {i}",
+                    timestamp=base + timedelta(minutes=i)
+                )
+                for i in range(9)
+            ]
+            repo.save_many(reports)
+            
+            iterator = repo.iter_by_workspace("W123456", chunk_size=2)
+            
+            assert isinstance(iterator, types.GeneratorType)
+            assert [r.id for r in iterator] == [r.id for r in reports if r.workspace_id == "W123456"]
+    
+    def test_abandoned_iterator_releases_memory_connection(self):
+        """Test that closing a partially consumed iterator frees the shared connection."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        from concurrent.futures import ThreadPoolExecutor
+        
+        repo = SQLiteReportRepository(":memory:")
+        repo.save_many(
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.EXPECTED_INITIATIVE,
+                description=f"Report {i}"
+            )
+            for i in range(5)
+        )
+        
+        iterator = repo.iter_by_workspace("W123456", chunk_size=2)
+        next(iterator)
+        iterator.close()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            found = executor.submit(repo.find_by_workspace, "W123456").result(timeout=5)
+        
+        assert len(found) == 5
+    
+    def test_partly_consumed_iterator_does_not_block_memory_connection(self):
+        """Test that other threads can use :memory: between streamed chunks."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import datetime, UTC
+    
+        repo = SQLiteReportRepository(":memory:")
+        # Equal timestamps make the keyset fall back to ordering by id
+        timestamp = datetime(2024, 1, 1, tzinfo=UTC)
+        reports = repo.save_many(
+            Report(
+                user_id="U123456",
+                workspace_id="W123456",
+                report_type=ReportType.EXPECTED_INITIATIVE,
+                description=f"Report {i}",
+                timestamp=timestamp
+            )
+            for i in range(7)
+        )
+    
+        iterator = repo.iter_by_workspace("W123456", chunk_size=3)
+        first = next(iterator)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            found = executor.submit(repo.find_by_workspace, "W123456").result(timeout=5)
+        streamed = [first, *iterator]
+    
+        assert len(found) == 7
+        assert [r.id for r in streamed] == sorted((r.id for r in reports), key=str)
+    
+    def test_count_by_type_groups_in_database(self):
+        """Test that count_by_type counts per type within one workspace."""
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        
+        repo = SQLiteReportRepository(":memory:")
+        repo.save_many([
+            Report(
+                user_id="U111",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Report 1"
+            ),
+            Report(
+                user_id="U222",
+                workspace_id="W123456",
+                report_type=ReportType.LACKED_AUTHORITY,
+                description="Report 2"
+            ),
+            Report(
+                user_id="U333",
+                workspace_id="W789012",
+                report_type=ReportType.EXPECTED_INITIATIVE,
+                description="Report 3"
+            )
+        ])
+        
+        assert repo.count_by_type("W123456") == {
+            ReportType.LACKED_AUTHORITY: 2,
+            ReportType.EXPECTED_INITIATIVE: 0
+        }
@@ -0,0 +1,109 @@
+import sqlite3
+from datetime import timedelta
+import pytest
+from models.report import ReportType
+from tests.factories import START, make_report
+
+
+@pytest.fixture(params=["memory", "sqlite", "sqlite_compact", "sqlalchemy"])
+def repo(request, tmp_path):
+    if request.param == "memory":
+        from repositories.report_repository import InMemoryReportRepository
+        yield InMemoryReportRepository()
+    elif request.param == "sqlalchemy":
+        from repositories.sqlalchemy_report_repository import SQLAlchemyReportRepository
+        repository = SQLAlchemyReportRepository("sqlite://")
+        yield repository
+        repository.close()
+    else:
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+        repository = SQLiteReportRepository(
+            str(tmp_path / "test.db"), compact=request.param == "sqlite_compact"
+        )
+        yield repository
+        repository.close()
+
+
+@pytest.fixture
+def reports(repo):
+    saved = [
+        make_report(day, timestamp=START + timedelta(days=day), report_type=ReportType(
+            "lacked_authority" if day % 2 else "expected_initiative"
+        ))
+        for day in range(10)
+    ]
+    saved.append(make_report(
+        5, timestamp=START + timedelta(days=5), workspace_id="W999999", user_id="U999999",
+        report_type=ReportType.EXPECTED_INITIATIVE
+    ))
+    repo.save_many(saved)
+    return saved[:10]
+
+
+class TestTimeWindows:
+    def test_since_is_inclusive_and_until_exclusive(self, repo, reports):
+        since, until = START + timedelta(days=3), START + timedelta(days=6)
+
+        assert repo.find_by_workspace("W123456", since=since, until=until) == reports[3:6]
+        assert repo.find_by_workspace("W123456", since=since) == reports[3:]
+        assert repo.find_by_workspace("W123456", until=until) == reports[:6]
+
+    def test_user_type_and_workspace_type_windows(self, repo, reports):
+        since, until = START + timedelta(days=2), START + timedelta(days=8)
+        authority = [r for r in reports[2:8] if r.report_type == ReportType.LACKED_AUTHORITY]
+
+        assert repo.find_by_user("U123456", since=since, until=until) == reports[2:8]
+        assert repo.find_by_type(
+            ReportType.LACKED_AUTHORITY, since=since, until=until
+        ) == authority
+        assert repo.find_by_workspace_and_type(
+            "W123456", ReportType.LACKED_AUTHORITY, since=since, until=until
+        ) == authority
+
+    def test_empty_window(self, repo, reports):
+        day = START + timedelta(days=4)
+
+        assert repo.find_by_workspace("W123456", since=day, until=day) == []
+
+    def test_count_by_type_since(self, repo, reports):
+        assert repo.count_by_type("W123456", since=START + timedelta(days=6)) == {
+            ReportType.LACKED_AUTHORITY: 2,
+            ReportType.EXPECTED_INITIATIVE: 2
+        }
+
+    def test_pages_stop_at_since(self, repo, reports):
+        since = START + timedelta(days=5)
+
+        first = repo.find_page_by_workspace("W123456", 3, since=since)
+        assert first.reports == reports[7:][::-1]
+        assert first.has_older
+
+        second = repo.find_page_by_workspace("W123456", 3, before=first.older_cursor, since=since)
+        assert second.reports == reports[5:7][::-1]
+        assert not second.has_older
+
+        back = repo.find_page_by_workspace("W123456", 3, after=second.newer_cursor, since=since)
+        assert back.reports == reports[7:][::-1]
+
+
+class TestSQLiteRangeScans:
+    @pytest.mark.parametrize("query, params, index", [
+        ("SELECT * FROM reports WHERE workspace_id = ? AND timestamp >= ? AND timestamp < ?",
+         ("W123456", "a", "b"), "idx_reports_workspace_timestamp"),
+        ("SELECT * FROM reports WHERE user_id = ? AND timestamp >= ?",
+         ("U123456", "a"), "idx_reports_user_timestamp"),
+        ("SELECT * FROM reports WHERE report_type = ? AND timestamp >= ?",
+         ("lacked_authority", "a"), "idx_reports_type_timestamp"),
+    ])
+    def test_window_queries_use_timestamp_indexes(self, tmp_path, query, params, index):
+        from repositories.sqlite_report_repository import SQLiteReportRepository
+
+        db_path = str(tmp_path / "test.db")
+        SQLiteReportRepository(db_path).close()
+
+        conn = sqlite3.connect(db_path)
+        plan = " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+        conn.close()
+
+        assert index in plan
+        assert "timestamp>?" in plan.replace(" ", "")
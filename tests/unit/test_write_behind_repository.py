@@ -0,0 +1,185 @@
+import threading
+import time
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+import pytest
+from models.report import ReportType
+from repositories.report_repository import InMemoryReportRepository, ReportRepository
+from repositories.write_behind_repository import WriteBehindReportRepository
+from tests.factories import make_report
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestWriteBehindReportRepository:
+    def setup_method(self):
+        self.delegate = InMemoryReportRepository()
+
+    def test_reads_see_pending_writes(self):
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=60)
+        report = make_report(1)
+
+        repo.save(report)
+
+        assert self.delegate.find_by_id(report.id) is None
+        assert repo.find_by_id(report.id) == report
+        assert repo.find_by_workspace("W123456") == [report]
+        assert repo.find_by_user("U123456") == [report]
+        assert repo.find_by_type(ReportType.LACKED_AUTHORITY) == [report]
+        assert repo.count_by_type("W123456")[ReportType.LACKED_AUTHORITY] == 1
+        repo.close()
+
+    def test_flushes_when_batch_size_is_reached(self):
+        repo = WriteBehindReportRepository(self.delegate, flush_size=3, flush_interval=60)
+
+        repo.save_many([make_report(i) for i in range(3)])
+
+        assert wait_until(lambda: len(self.delegate.find_by_workspace("W123456")) == 3)
+        assert wait_until(lambda: repo.pending_count == 0)
+        repo.close()
+
+    def test_flushes_on_interval(self):
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=0.05)
+
+        repo.save(make_report(1))
+
+        assert wait_until(lambda: len(self.delegate.find_by_workspace("W123456")) == 1)
+        repo.close()
+
+    def test_close_flushes_pending_reports(self):
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=60)
+        repo.save_many([make_report(i) for i in range(5)])
+
+        repo.close()
+
+        assert len(self.delegate.find_by_workspace("W123456")) == 5
+        with pytest.raises(RuntimeError):
+            repo.save(make_report(6))
+
+    def test_failed_flush_keeps_reports_pending(self):
+        delegate = Mock(spec=ReportRepository)
+        delegate.save_many.side_effect = RuntimeError("database is locked")
+        delegate.save.side_effect = RuntimeError("database is locked")
+        delegate.find_by_id.return_value = None
+        delegate.find_by_ids.return_value = []
+        repo = WriteBehindReportRepository(delegate, flush_size=100, flush_interval=60, max_attempts=2)
+        report = make_report(1)
+        repo.save(report)
+
+        assert repo.flush() == 0
+        assert repo.find_by_id(report.id) == report
+
+        delegate.save_many.side_effect = None
+        assert repo.flush() == 1
+        assert repo.pending_count == 0
+        repo.close()
+
+    def test_page_merges_pending_and_stored_reports(self):
+        stored = [make_report(i) for i in range(0, 10, 2)]
+        pending = [make_report(i) for i in range(1, 10, 2)]
+        self.delegate.save_many(stored)
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=60)
+        repo.save_many(pending)
+        newest_first = sorted(stored + pending, key=lambda r: r.timestamp, reverse=True)
+
+        first = repo.find_page_by_workspace("W123456", 4)
+        second = repo.find_page_by_workspace("W123456", 4, before=first.older_cursor)
+        back = repo.find_page_by_workspace("W123456", 4, after=second.newer_cursor)
+
+        assert first.reports == newest_first[:4]
+        assert second.reports == newest_first[4:8]
+        assert back.reports == newest_first[:4]
+        assert not back.has_newer
+        repo.close()
+
+    def test_iter_by_workspace_merges_in_order(self):
+        stored = [make_report(i) for i in range(0, 6, 2)]
+        pending = [make_report(i) for i in range(1, 6, 2)]
+        self.delegate.save_many(stored)
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=60)
+        repo.save_many(pending)
+
+        streamed = list(repo.iter_by_workspace("W123456", chunk_size=2))
+
+        assert streamed == sorted(stored + pending, key=lambda r: r.timestamp)
+        repo.close()
+
+    def test_rejects_pending_ids_and_drops_stored_ones_at_flush(self):
+        stored = make_report(1)
+        self.delegate.save(stored)
+        repo = WriteBehindReportRepository(self.delegate, flush_size=100, flush_interval=60)
+        pending = repo.save(make_report(2))
+
+        with pytest.raises(ValueError):
+            repo.save(pending)
+        with pytest.raises(ValueError):
+            repo.save_many([make_report(3), make_report(4), pending])
+        assert repo.pending_count == 1
+
+        # Saving never reads the delegate; the flush finds the stored id
+        repo.save(replace(stored, description="Same id, different report"))
+
+        assert repo.flush() == 1
+        assert repo.pending_count == 0
+        assert self.delegate.find_by_id(stored.id) == stored
+        assert self.delegate.find_by_id(pending.id) == pending
+        repo.close()
+
+    def test_flush_is_not_blocked_by_a_slow_count(self):
+        counting, release = threading.Event(), threading.Event()
+
+        class SlowCountDelegate(InMemoryReportRepository):
+            def count_by_type(self, workspace_id, since=None):
+                counts = super().count_by_type(workspace_id, since)
+                if not counting.is_set():
+                    counting.set()
+                    release.wait(5)
+                return counts
+
+        repo = WriteBehindReportRepository(SlowCountDelegate(), flush_size=100, flush_interval=60)
+        repo.save_many([make_report(i) for i in range(3)])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            counted = executor.submit(repo.count_by_type, "W123456")
+            assert counting.wait(5)
+            assert repo.flush() == 3
+            release.set()
+            counts = counted.result(timeout=5)
+
+        assert counts[ReportType.LACKED_AUTHORITY] == 3
+        repo.close()
+
+    def test_count_is_not_doubled_by_concurrent_flush(self):
+        written, release = threading.Event(), threading.Event()
+
+        class SlowDelegate(InMemoryReportRepository):
+            def save_many(self, reports):
+                saved = super().save_many(reports)
+                written.set()
+                release.wait(5)
+                return saved
+
+        repo = WriteBehindReportRepository(SlowDelegate(), flush_size=100, flush_interval=60)
+        repo.save_many([make_report(i) for i in range(3)])
+        flusher = threading.Thread(target=repo.flush)
+        flusher.start()
+        assert written.wait(5)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            counted = executor.submit(repo.count_by_type, "W123456")
+            # Give the count time to read both sides while the flush is mid-write
+            time.sleep(0.1)
+            release.set()
+            counts = counted.result(timeout=5)
+        flusher.join()
+
+        assert counts[ReportType.LACKED_AUTHORITY] == 3
+        repo.close()